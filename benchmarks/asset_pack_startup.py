@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Weed Whacker - Asset Pack Startup Benchmark
+Compares loading every sprite, icon and sound from the .pak archive against
+loose PNG/WAV files. Each run happens in a fresh process with the atlas and
+sprite caches disabled, so only the file access and decode paths differ.
+
+Usage:
+    python benchmarks/asset_pack_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def measure(use_asset_pack):
+    """Time one cold AssetManager startup in this process
+
+    Args:
+        use_asset_pack: Whether to read from the asset pack
+
+    Returns:
+        Seconds spent loading
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame # type: ignore
+    from weed_whacker.config import TILE_SIZE
+    from weed_whacker.assets.managers.asset_manager import AssetManager
+    from weed_whacker.src.game.tools import TOOLS
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    start = time.perf_counter()
+    asset_manager = AssetManager(TILE_SIZE, cache_atlas=False, cache_sprites=False, use_asset_pack=use_asset_pack)
+    # Icons and sounds the HUD, inventory and tools load on first use
+    for tool_key, tool in TOOLS.items():
+        asset_manager.get_icon('tools', tool.sprite_name, 48)
+        asset_manager.get_sound(tool.sound_file)
+    asset_manager.get_icon('objects', 'coin', 16)
+    asset_manager.get_icon('objects', 'tile', 16)
+    elapsed = time.perf_counter() - start
+
+    if use_asset_pack and asset_manager.asset_pack is None:
+        raise SystemExit("asset pack missing; run tools/build_asset_pack.py first")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare asset pack and loose file startup")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh processes per mode")
+    parser.add_argument('--child', choices=['pack', 'loose'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(measure(args.child == 'pack'))
+        return
+
+    pack_path = ROOT / 'weed_whacker' / 'assets' / 'assets.pak'
+    if not pack_path.exists():
+        subprocess.run([sys.executable, str(ROOT / 'tools' / 'build_asset_pack.py')], check=True)
+
+    results = {}
+    for mode in ('loose', 'pack'):
+        times = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, __file__, '--child', mode],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            times.append(float(output.strip().splitlines()[-1]))
+        results[mode] = times
+
+    print(f"{'mode':<8}{'median':>10}{'min':>10}{'max':>10}")
+    for mode, times in results.items():
+        print(f"{mode:<8}{statistics.median(times) * 1000:>8.1f}ms{min(times) * 1000:>8.1f}ms{max(times) * 1000:>8.1f}ms")
+    speedup = statistics.median(results['loose']) / statistics.median(results['pack'])
+    print(f"pack is {speedup:.1f}x faster than loose files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Weed Whacker - Display Scaling Benchmark
+Times getting one frame from the internal resolution onto the window
+(scaling plus flip) for the presets in docs/display-tuning-guide.md, for
+every display scaling mode that applies to the preset. Game rendering costs
+the same in every mode and is left out.
+
+Usage:
+    python benchmarks/display_scaling.py [--frames N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+import pygame # type: ignore
+
+# name, tile size, viewport width and height in tiles, scale factor
+PRESETS = [
+    ('Classic Retro', 16, 20, 15, 3),
+    ('Modern Indie', 32, 20, 15, 2),
+    ('HD Strategy', 32, 30, 20, 1),
+    ('High-Res Detail', 64, 15, 12, 1),
+    ('Default (config.py)', 64, 20, 15, 1),
+]
+
+
+def time_present(display, frames, rounds=5):
+    """Best milliseconds per present() over a few rounds"""
+    # Something that isn't a flat color, so scaling can't take shortcuts
+    random.seed(0)
+    width, height = display.surface.get_size()
+    for _ in range(200):
+        color = [random.randrange(256) for _ in range(3)]
+        display.surface.fill(color, (random.randrange(width), random.randrange(height), 40, 40))
+
+    display.present()
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(frames):
+            display.present()
+        best = min(best, (time.perf_counter() - start) / frames * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare display scaling modes per preset")
+    parser.add_argument('--frames', type=int, default=100, help="Frames per timing round")
+    args = parser.parse_args()
+
+    pygame.init()
+    from weed_whacker.src.render.display import Display
+
+    print(f"{'preset':<22}{'internal':>10}{'window':>11}  mode        present")
+    for name, tile_size, tiles_w, tiles_h, scale in PRESETS:
+        internal = (tiles_w * tile_size, tiles_h * tile_size)
+        modes = ['scale', 'scaled'] + (['direct'] if scale == 1 else ['scale_by'])
+        for mode in modes:
+            # A fresh video subsystem per window; SDL can't switch a window to SCALED
+            pygame.display.quit()
+            pygame.display.init()
+            display = Display(internal[0], internal[1], scale, mode)
+            present_ms = time_present(display, args.frames)
+            window = display.window_size
+            print(
+                f"{name:<22}{internal[0]:>5}x{internal[1]:<4}{window[0]:>6}x{window[1]:<4}"
+                f"  {mode:<10}{present_ms:>6.2f}ms"
+            )
+            name = ''
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Weed Whacker - Batched Blit Benchmark
+Renders a fully occupied viewport (every visible tile owned, half of them
+with weeds, purchasable tiles highlighted) one sprite per tile, and
+compares per-sprite blits through AssetManager.render_sprite against the
+same layers submitted with one batched call each. Ground chunk caching,
+which the live GridRenderer uses, is deliberately left out.
+
+Usage:
+    python benchmarks/render_batching.py [--frames N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+import pygame # type: ignore
+
+
+def render_per_sprite(surface, game, tile_size):
+    """Draw the same layers one blit at a time, as the renderers used to"""
+    from weed_whacker.src.game.grid import TileType
+
+    asset_manager = game.asset_manager
+    grid = game.grid
+    offset_x, offset_y = game.camera_offset
+    for y in range(grid.world_size):
+        for x in range(grid.world_size):
+            tile = grid.tiles[y][x]
+            screen_x = x * tile_size - offset_x
+            screen_y = y * tile_size - offset_y
+            if tile.tile_type == TileType.GRASS or tile.tile_type == TileType.WEED:
+                asset_manager.render_sprite(surface, f'grass_{(x + y) % 3 + 1}', screen_x, screen_y)
+            elif game.grid_renderer._is_purchasable(grid, x, y):
+                asset_manager.render_sprite(surface, 'unowned_purchasable', screen_x, screen_y)
+            if tile.tile_type == TileType.WEED:
+                asset_manager.render_sprite(surface, tile.weed_type.sprite_name, screen_x, screen_y)
+
+    player = game.player
+    asset_manager.render_sprite(surface, 'player', player.x * tile_size - offset_x, player.y * tile_size - offset_y)
+
+    selected = game.ui.get_selected_index()
+    for i, (tile_x, tile_y) in enumerate(game._get_all_purchasable_tiles()):
+        game.ui.render_tile_highlight(surface, tile_x, tile_y, tile_size, game.camera_offset, i == selected)
+
+
+def build_layers(game, tile_size):
+    """Build the per-tile layers the renderers submitted before ground chunk caching
+
+    GridRenderer now draws the ground from cached chunks, so its live blit
+    sequence holds only a handful of chunk blits. The per-tile layers are
+    built here instead, so batching is measured on the workload it was
+    written for rather than on the chunk cache.
+
+    Returns:
+        List of layers, each a list of (surface, (x, y)) pairs
+    """
+    from weed_whacker.src.game.grid import TileType
+
+    asset_manager = game.asset_manager
+    grid = game.grid
+    offset_x, offset_y = game.camera_offset
+    ground, purchasable, weeds = [], [], []
+    for y in range(grid.world_size):
+        for x in range(grid.world_size):
+            tile = grid.tiles[y][x]
+            position = (x * tile_size - offset_x, y * tile_size - offset_y)
+            if tile.tile_type == TileType.GRASS or tile.tile_type == TileType.WEED:
+                ground.append((asset_manager.get_sprite(f'grass_{(x + y) % 3 + 1}'), position))
+            elif game.grid_renderer._is_purchasable(grid, x, y):
+                purchasable.append((asset_manager.get_sprite('unowned_purchasable'), position))
+            if tile.tile_type == TileType.WEED:
+                weeds.append((asset_manager.get_sprite(tile.weed_type.sprite_name), position))
+
+    player = game.player
+    players = [(asset_manager.get_sprite('player'), (player.x * tile_size - offset_x, player.y * tile_size - offset_y))]
+
+    normal = game.ui._get_highlight(tile_size, False)
+    selected = game.ui._get_highlight(tile_size, True)
+    selected_index = game.ui.get_selected_index()
+    highlights = [
+        (selected if i == selected_index else normal, (tile_x * tile_size - offset_x, tile_y * tile_size - offset_y))
+        for i, (tile_x, tile_y) in enumerate(game._get_all_purchasable_tiles())
+    ]
+    return [ground, purchasable, weeds, players, highlights]
+
+
+def render_batched(surface, game, tile_size):
+    """Build the per-tile layers and draw each with one batched call"""
+    submit_batched(surface, build_layers(game, tile_size))
+
+
+def submit_per_sprite(surface, layers):
+    for layer in layers:
+        for source, position in layer:
+            surface.blit(source, position)
+
+
+def submit_batched(surface, layers):
+    from weed_whacker.src.render.batch import submit_blits
+
+    for layer in layers:
+        submit_blits(surface, layer)
+
+
+def best_of(rounds, frames, *funcs):
+    """Time functions in alternating rounds and keep each one's fastest round
+
+    Args:
+        rounds: Number of alternating rounds
+        frames: Calls per round
+        *funcs: Zero-argument callables, each drawing one frame
+
+    Returns:
+        List of best milliseconds per frame, one per function
+    """
+    for func in funcs:
+        func()  # Warm up lazily loaded sprites
+    best = [float('inf')] * len(funcs)
+    for _ in range(rounds):
+        for i, func in enumerate(funcs):
+            start = time.perf_counter()
+            for _ in range(frames):
+                func()
+            best[i] = min(best[i], (time.perf_counter() - start) / frames * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-sprite and batched blits")
+    parser.add_argument('--frames', type=int, default=100, help="Frames per timing round")
+    parser.add_argument('--rounds', type=int, default=7, help="Alternating rounds; the fastest is kept")
+    args = parser.parse_args()
+
+    from weed_whacker.config import INTERNAL_WIDTH, INTERNAL_HEIGHT, TILE_SIZE
+    pygame.init()
+    pygame.display.set_mode((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+
+    from weed_whacker.src.game_manager import Game
+    from weed_whacker.src.game.grid import TileType
+    from weed_whacker.src.game.weeds import WEED_BASIC
+
+    game = Game()
+    game.update(0)
+
+    # Own every tile in view except a one-tile purchasable border, weeds on half
+    random.seed(0)
+    viewport_w = INTERNAL_WIDTH // TILE_SIZE
+    viewport_h = INTERNAL_HEIGHT // TILE_SIZE
+    first_x = game.camera_offset[0] // TILE_SIZE
+    first_y = game.camera_offset[1] // TILE_SIZE
+    for y in range(first_y + 1, first_y + viewport_h - 1):
+        for x in range(first_x + 1, first_x + viewport_w - 1):
+            tile = game.grid.get_tile(x, y)
+            if tile is None:
+                continue
+            tile.tile_type = TileType.GRASS
+            if random.random() < 0.5:
+                tile.tile_type = TileType.WEED
+                tile.weed_type = WEED_BASIC
+            game.grid.mark_changed(x, y)
+
+    surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT)).convert()
+    per_sprite, batched = best_of(
+        args.rounds, args.frames,
+        lambda: render_per_sprite(surface, game, TILE_SIZE),
+        lambda: render_batched(surface, game, TILE_SIZE),
+    )
+
+    layers = build_layers(game, TILE_SIZE)
+    blits_per_sprite, blits_batched = best_of(
+        args.rounds, args.frames,
+        lambda: submit_per_sprite(surface, layers),
+        lambda: submit_batched(surface, layers),
+    )
+
+    blit_api = 'fblits' if hasattr(pygame.Surface, 'fblits') else 'blits'
+    print(f"viewport {viewport_w}x{viewport_h} tiles at {TILE_SIZE}px, "
+          f"{sum(len(layer) for layer in layers)} sprites in {len(layers)} layers, "
+          f"best of {args.rounds} x {args.frames} frames")
+    print(f"{'':<20}{'per-sprite':>12}{'batched':>12}{'speedup':>10}")
+    print(f"{'lookup + blits':<20}{per_sprite:>10.2f}ms{batched:>10.2f}ms{per_sprite / batched:>9.2f}x")
+    print(f"{'blit calls only':<20}{blits_per_sprite:>10.2f}ms{blits_batched:>10.2f}ms"
+          f"{blits_per_sprite / blits_batched:>9.2f}x  ({blit_api})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Weed Whacker - Zoom and Overview Benchmark
+Runs the game on a large farm (2000x2000 tiles by default, a quarter of it
+owned and a tenth of the owned tiles weedy) and times whole frames,
+Game.update plus Game.render with the HUD, at every zoom level while the
+player walks across the farm. Sprite levels draw cached chunks of
+pre-scaled sprites; levels at or below OVERVIEW_MAX_TILE_SIZE draw the one
+pixel per tile overview.
+
+Usage:
+    python benchmarks/zoom_overview.py [--size N] [--frames N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+import pygame # type: ignore
+
+FRAME_MS = 16
+
+
+def build_game(size):
+    """Create a game on a size x size world with a size/2 square plot, a tenth of it weeds
+
+    Args:
+        size: World edge length in tiles
+
+    Returns:
+        Game instance with every change delivered to its listeners
+    """
+    from weed_whacker.src import game_manager
+    from weed_whacker.src.game.grid import TileType
+    from weed_whacker.src.game.weeds import WEED_BASIC
+
+    game_manager.WORLD_GRID_SIZE = size
+    game_manager.STARTING_GRID_SIZE = size // 2
+    game = game_manager.Game()
+
+    random.seed(0)
+    weeds = []
+    for y, row in enumerate(game.grid.tiles):
+        for x, tile in enumerate(row):
+            if tile.tile_type is TileType.GRASS and random.random() < 0.1:
+                tile.tile_type = TileType.WEED
+                tile.weed_type = WEED_BASIC
+                tile.weed_health = WEED_BASIC.toughness
+                weeds.append((x, y))
+    game.grid.mark_region_changed(weeds)
+    game.grid.flush_changes()
+    # No new weeds while timing
+    game.weed_spawn_timer = float('-inf')
+    return game
+
+
+def run_frame(game, surface, step):
+    """Walk the player one tile along a square loop, then update and render
+
+    Args:
+        game: Game instance
+        surface: Surface to render to
+        step: Frame number
+    """
+    direction = ((1, 0), (0, 1), (-1, 0), (0, -1))[step // 40 % 4]
+    game.player.try_move(*direction, 0)
+    game.update(FRAME_MS)
+    game.render(surface)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time whole game frames per zoom level on a large farm")
+    parser.add_argument('--size', type=int, default=2000, help="World edge length in tiles")
+    parser.add_argument('--frames', type=int, default=120, help="Walking frames per zoom level")
+    args = parser.parse_args()
+
+    from weed_whacker.config import INTERNAL_WIDTH, INTERNAL_HEIGHT, OVERVIEW_MAX_TILE_SIZE
+    pygame.init()
+    pygame.display.set_mode((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+
+    start = time.perf_counter()
+    game = build_game(args.size)
+    print(f"{args.size}x{args.size} farm with {game.economy.get_owned_tile_count()} owned tiles "
+          f"built in {time.perf_counter() - start:.1f}s")
+    surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT)).convert()
+
+    print(f"{'tile size':>9}  {'mode':<9}{'first frame':>12}{'median':>9}{'worst':>9}{'fps':>7}")
+    step = 0
+    for zoom_index, tile_size in enumerate(game.zoom_levels):
+        game._set_zoom(zoom_index)
+        start = time.perf_counter()
+        run_frame(game, surface, step)
+        first = (time.perf_counter() - start) * 1000
+
+        times = []
+        for _ in range(args.frames):
+            step += 1
+            start = time.perf_counter()
+            run_frame(game, surface, step)
+            times.append((time.perf_counter() - start) * 1000)
+        median = statistics.median(times)
+        mode = 'overview' if tile_size <= OVERVIEW_MAX_TILE_SIZE else 'sprites'
+        print(f"{tile_size:>7}px  {mode:<9}{first:>10.1f}ms{median:>7.2f}ms{max(times):>7.2f}ms"
+              f"{1000 / statistics.mean(times):>7.0f}")
+
+
+if __name__ == '__main__':
+    main()
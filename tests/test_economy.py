@@ -0,0 +1,73 @@
+"""
+Tile pricing tests
+"""
+
+import pytest
+
+from weed_whacker.src.game.economy import Economy
+
+PRICINGS = [
+    (10, 1),
+    (25, 7),
+    (10, 0),
+    (3, 0),
+    (10.5, 0.25),
+    (0.3, 0.1),
+    (2.415, 0.0),
+    (7, 0.5),
+    (1.5, 3),
+]
+
+
+def _economy(base_cost, cost_increment, tiles_purchased):
+    economy = Economy(None, 0.01, base_cost, cost_increment)
+    economy.tiles_purchased = tiles_purchased
+    return economy
+
+
+def _price_totals(economy, count):
+    """Running totals of buying tiles one at a time: totals[n] pays for n tiles"""
+    totals = [0]
+    for i in range(count):
+        totals.append(totals[-1] + economy.base_cost + (economy.tiles_purchased + i) * economy.cost_increment)
+    return totals
+
+
+@pytest.mark.parametrize('base_cost, cost_increment', PRICINGS)
+@pytest.mark.parametrize('tiles_purchased', [0, 1, 13])
+def test_bulk_cost_matches_sum_of_prices(base_cost, cost_increment, tiles_purchased):
+    economy = _economy(base_cost, cost_increment, tiles_purchased)
+    for count, total in enumerate(_price_totals(economy, 80)):
+        assert economy.get_bulk_cost(count) == pytest.approx(total)
+
+
+@pytest.mark.parametrize('base_cost, cost_increment', PRICINGS)
+@pytest.mark.parametrize('tiles_purchased', [0, 1, 13])
+def test_max_affordable_tiles_matches_brute_force(base_cost, cost_increment, tiles_purchased):
+    economy = _economy(base_cost, cost_increment, tiles_purchased)
+    totals = _price_totals(economy, 80)
+    budgets = [(low + high) / 2 for low, high in zip(totals, totals[1:])]
+    if isinstance(base_cost, int) and isinstance(cost_increment, int):
+        # Integer prices add up exactly, so the boundaries themselves are safe
+        budgets += totals + [total - 1 for total in totals[1:]]
+    for money in budgets:
+        expected = max(count for count, total in enumerate(totals) if total <= money)
+        assert economy.get_max_affordable_tiles(money) == expected
+
+
+@pytest.mark.parametrize('base_cost, tiles_purchased, count', [
+    (3.55, 4, 3), (2.415, 30, 5), (0.8, 13, 13), (2.22, 14, 3),
+])
+def test_flat_price_affords_exact_bulk_cost(base_cost, tiles_purchased, count):
+    economy = _economy(base_cost, 0.0, tiles_purchased)
+    money = economy.get_bulk_cost(count)
+    assert economy.get_max_affordable_tiles(money) == count
+
+
+def test_max_affordable_tiles_never_overspends():
+    for base_cost, cost_increment in PRICINGS:
+        economy = _economy(base_cost, cost_increment, 5)
+        for step in range(400):
+            money = step * 1.37
+            count = economy.get_max_affordable_tiles(money)
+            assert economy.get_bulk_cost(count) <= money < economy.get_bulk_cost(count + 1)
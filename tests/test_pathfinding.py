@@ -0,0 +1,97 @@
+"""
+Pathfinding tests
+"""
+
+import random
+from collections import deque
+
+import pytest
+
+from weed_whacker.src.game.grid import Grid, TileType
+from weed_whacker.src.game.pathfinding import Pathfinder
+
+
+def _random_plot(seed, size=14):
+    """Make a grid whose owned tiles are a random, often disconnected, scatter"""
+    rng = random.Random(seed)
+    grid = Grid(size, 4)
+    owned = []
+    for y, row in enumerate(grid.tiles):
+        for x, tile in enumerate(row):
+            tile.tile_type = TileType.GRASS if rng.random() < 0.65 else TileType.UNOWNED
+            if tile.is_owned():
+                owned.append((x, y))
+    return grid, owned, rng
+
+
+def _bfs_distances(grid, goal):
+    """Reference walking distances to goal over owned tiles"""
+    distances = {goal: 0}
+    queue = deque([goal])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if (0 <= nx < grid.world_size and 0 <= ny < grid.world_size
+                    and (nx, ny) not in distances and grid.tiles[ny][nx].is_walkable()):
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return distances
+
+
+def _check_path(grid, start, goal, path, distances):
+    if start not in distances:
+        assert path is None
+        return
+    assert path is not None
+    assert len(path) == distances[start]
+    x, y = start
+    for step in path:
+        assert abs(step[0] - x) + abs(step[1] - y) == 1
+        assert grid.tiles[step[1]][step[0]].is_walkable()
+        x, y = step
+    assert (x, y) == goal
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_find_path_matches_bfs(seed):
+    grid, owned, rng = _random_plot(seed)
+    pathfinder = Pathfinder(grid)
+    for _ in range(40):
+        start, goal = rng.choice(owned), rng.choice(owned)
+        _check_path(grid, start, goal, pathfinder.find_path(start, goal), _bfs_distances(grid, goal))
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_sliced_and_cached_searches_match_bfs(seed):
+    grid, owned, rng = _random_plot(seed)
+    pathfinder = Pathfinder(grid)
+    for _ in range(40):
+        start, goal = rng.choice(owned), rng.choice(owned)
+        if rng.random() < 0.3:
+            pathfinder.distance_field(goal)
+        search = pathfinder.start_search(start, goal)
+        while not search.step(rng.randint(1, 5)):
+            pass
+        _check_path(grid, start, goal, search.path, _bfs_distances(grid, goal))
+
+
+def test_find_path_follows_bought_and_lost_tiles():
+    grid, owned, rng = _random_plot(0)
+    pathfinder = Pathfinder(grid)
+    for _ in range(30):
+        x, y = rng.randrange(grid.world_size), rng.randrange(grid.world_size)
+        tile = grid.tiles[y][x]
+        tile.tile_type = TileType.UNOWNED if tile.is_owned() else TileType.GRASS
+        grid.mark_changed(x, y)
+        owned = [(x, y) for y, row in enumerate(grid.tiles) for x, tile in enumerate(row) if tile.is_owned()]
+        start, goal = rng.choice(owned), rng.choice(owned)
+        _check_path(grid, start, goal, pathfinder.find_path(start, goal), _bfs_distances(grid, goal))
+
+
+def test_unwalkable_ends_have_no_path():
+    grid, owned, rng = _random_plot(1)
+    pathfinder = Pathfinder(grid)
+    unowned = next((x, y) for y, row in enumerate(grid.tiles) for x, tile in enumerate(row) if not tile.is_owned())
+    assert pathfinder.find_path(owned[0], unowned) is None
+    assert pathfinder.find_path(unowned, owned[0]) is None
+    assert pathfinder.find_path((-1, 0), owned[0]) is None
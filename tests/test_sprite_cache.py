@@ -0,0 +1,45 @@
+"""
+Sprite cache key tests
+"""
+
+import functools
+
+from weed_whacker.assets.managers.sprite_cache import SpriteCache
+
+
+def _make_manager(body):
+    """Define a manager class whose generator method has the given body"""
+    namespace = {}
+    exec(
+        "class PlayerManager:\n"
+        "    def _generate_player(self, avatar_type):\n"
+        f"        {body}\n",
+        namespace,
+    )
+    return namespace['PlayerManager']()
+
+
+def _key(generator_func):
+    return SpriteCache.make_key('PlayerManager', 32, ['worker', 32, 32, None],
+                                SpriteCache.generator_fingerprint(generator_func))
+
+
+def test_wrapped_generator_body_change_changes_key():
+    before = _make_manager("return [color for color in (avatar_type,)]")
+    after = _make_manager("return [color.upper() for color in (avatar_type,)]")
+    assert (_key(functools.partial(before._generate_player, 'green'))
+            != _key(functools.partial(after._generate_player, 'green')))
+
+
+def test_generator_arguments_change_key():
+    manager = _make_manager("return avatar_type")
+    assert (_key(functools.partial(manager._generate_player, 'green'))
+            != _key(functools.partial(manager._generate_player, 'blue')))
+
+
+def test_unchanged_generator_keeps_key():
+    # Nested code objects must not leak memory addresses into the key
+    first = _make_manager("return [color for color in (avatar_type,)]")
+    second = _make_manager("return [color for color in (avatar_type,)]")
+    assert (_key(functools.partial(first._generate_player, 'green'))
+            == _key(functools.partial(second._generate_player, 'green')))
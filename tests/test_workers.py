@@ -0,0 +1,73 @@
+"""
+Weed distance field tests
+"""
+
+import random
+
+import pytest
+
+from weed_whacker.src.game.economy import Economy
+from weed_whacker.src.game.grid import Grid, TileType
+from weed_whacker.src.game.pathfinding import Pathfinder
+from weed_whacker.src.game.weeds import WEED_BASIC
+from weed_whacker.src.game.workers import WeedDistanceField
+
+
+def _set_weed(grid, x, y, weed):
+    tile = grid.tiles[y][x]
+    tile.tile_type = TileType.WEED if weed else TileType.GRASS
+    tile.weed_type = WEED_BASIC if weed else None
+
+
+def _fresh_distances(grid):
+    return list(WeedDistanceField(grid, Pathfinder(grid)).distances)
+
+
+def _random_change(grid, economy, rng):
+    """Spawn or chop one weed, spawn or chop many at once, or buy a region"""
+    owned = [(x, y) for y, row in enumerate(grid.tiles) for x, tile in enumerate(row) if tile.is_owned()]
+    action = rng.random()
+    if action < 0.35:
+        x, y = rng.choice(owned)
+        _set_weed(grid, x, y, grid.tiles[y][x].tile_type is TileType.GRASS)
+        grid.mark_changed(x, y)
+    elif action < 0.6:
+        region = rng.sample(owned, min(len(owned), rng.randint(2, 12)))
+        for x, y in region:
+            _set_weed(grid, x, y, rng.random() < 0.5)
+        grid.mark_region_changed(region)
+    else:
+        x, y = rng.choice(sorted(grid.frontier))
+        economy.money = 1e9
+        economy.try_purchase_region(economy.get_rectangle_tiles(x - 3, y - 2, x + 3, y + 2))
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_incremental_field_matches_fresh_field(seed):
+    rng = random.Random(seed)
+    grid = Grid(20, 6)
+    economy = Economy(grid, 0.01, 10, 1)
+    field = WeedDistanceField(grid, Pathfinder(grid))
+
+    for _ in range(8):
+        for _ in range(rng.randint(1, 6)):
+            _random_change(grid, economy, rng)
+            # Listeners may be told about a region over several frames
+            grid.flush_changes(rng.randint(1, 20))
+        grid.flush_changes()
+        assert list(field.distances) == _fresh_distances(grid)
+
+
+def test_field_follows_weed_cleared_behind_another():
+    grid = Grid(12, 6)
+    field = WeedDistanceField(grid, Pathfinder(grid))
+    _set_weed(grid, 3, 3, True)
+    _set_weed(grid, 8, 8, True)
+    grid.mark_region_changed([(3, 3), (8, 8)])
+    grid.flush_changes()
+    assert field.distance(4, 3) == 1
+
+    _set_weed(grid, 3, 3, False)
+    grid.mark_changed(3, 3)
+    assert field.distance(4, 3) == 9
+    assert list(field.distances) == _fresh_distances(grid)
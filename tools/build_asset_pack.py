@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Weed Whacker - Asset Pack Builder
+Packs the sprites and sounds under weed_whacker/assets into a single .pak file.
+
+Usage:
+    python tools/build_asset_pack.py [--output PATH] [--max-size PIXELS] [--variant-sizes PIXELS ...]
+
+Sprites are downscaled to the largest zoom tile size by default (pass
+--max-size 0 to keep full resolution) and also stored pre-scaled to
+TILE_SIZE, so the game loads them without scaling.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+import pygame # type: ignore
+
+from weed_whacker.assets.managers.asset_pack import build_pack, DEFAULT_PACK_NAME
+from weed_whacker.config import TILE_SIZE, ZOOM_TILE_SIZES
+
+
+def main():
+    assets_dir = ROOT / 'weed_whacker' / 'assets'
+
+    parser = argparse.ArgumentParser(description="Build the Weed Whacker asset pack")
+    parser.add_argument('--output', type=Path, default=assets_dir / DEFAULT_PACK_NAME,
+                        help="Pack file to write (default: weed_whacker/assets/assets.pak)")
+    parser.add_argument('--max-size', type=int, default=max(ZOOM_TILE_SIZES),
+                        help="Downscale sprites larger than this edge length, 0 to keep full resolution "
+                             "(default: the largest zoom tile size, %(default)s)")
+    parser.add_argument('--variant-sizes', type=int, nargs='*', default=[TILE_SIZE],
+                        help="Also store sprites pre-scaled to these edge lengths (default: TILE_SIZE, %(default)s)")
+    args = parser.parse_args()
+
+    index = build_pack(assets_dir, args.output, args.max_size or None, args.variant_sizes)
+
+    sounds = sum(1 for entry in index.values() if entry['format'] == 'PCM')
+    variants = sum(1 for name in index if '@' in name)
+    sprites = len(index) - sounds - variants
+    size_mb = args.output.stat().st_size / (1024 * 1024)
+    print(f"Wrote {args.output} ({sprites} sprites, {variants} pre-scaled variants, {sounds} sounds, {size_mb:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
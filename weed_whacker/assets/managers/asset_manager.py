@@ -7,36 +7,332 @@ from .weed_manager import WeedManager
 from .player_manager import PlayerManager
 from .tool_manager import ToolManager
 from .object_manager import ObjectManager
+from .sprite_atlas import SpriteAtlas
+from .sprite_cache import SpriteCache
+from .asset_pack import AssetPack, DEFAULT_PACK_NAME
+from .sprite_budget import SpriteBudget
+from .sprite_registry import SpriteRegistry
+from .base_asset_manager import FORMAT_ALPHA, normalize_sprite
 import pygame
+import time
 from pathlib import Path
 
 
 class AssetManager:
     """Unified manager coordinating all asset types"""
     
-    def __init__(self, tile_size):
+    def __init__(self, tile_size, cache_atlas=True, cache_sprites=True, use_asset_pack=True, sprite_budget_bytes=None):
         """Initialize all asset managers
         
         Args:
             tile_size: Size of tiles in pixels
+            cache_atlas: Save the packed sprite atlas to disk and reuse it on later startups
+            cache_sprites: Keep scaled and generated sprite pixels in a disk cache
+            use_asset_pack: Read sprites and sounds from assets/assets.pak when it exists
+            sprite_budget_bytes: Resident memory budget for unpinned sprites (None for unlimited)
         """
         self.tile_size = tile_size
+        self.cache_atlas = cache_atlas
+        self.assets_dir = Path(__file__).parent.parent.parent / 'assets'
+        self.atlas_cache_dir = self.assets_dir / '.cache' / f'atlas_{tile_size}'
+        
+        # One memory-mapped archive replaces per-file stats, opens and decodes
+        self.asset_pack = None
+        pack_path = self.assets_dir / DEFAULT_PACK_NAME
+        if use_asset_pack and pack_path.exists():
+            try:
+                self.asset_pack = AssetPack(pack_path)
+            except (OSError, ValueError):
+                print(f"Failed to open asset pack, using loose files: {pack_path}")
+        
+        # A valid cached atlas lets managers skip loading unchanged sprites
+        cached_atlas = SpriteAtlas.load(self.atlas_cache_dir) if cache_atlas else None
+        
+        # Sprites the atlas can't serve are looked up by content key before decoding.
+        # Each tile size keeps its own entries, so switching presets back is cheap.
+        self.sprite_cache = None
+        if cache_sprites:
+            self.sprite_cache = SpriteCache(self.assets_dir / '.cache' / f'sprites_{tile_size}')
+        
+        # Unpinned sprites load on first use and are evicted least recently used first
+        self.sprite_budget = SpriteBudget(sprite_budget_bytes)
+        
+        # Flat integer ids for every sprite, so renderers skip name lookups
+        self.sprite_registry = SpriteRegistry()
         
         # Initialize specialized managers
-        self.tiles = TileManager(tile_size)
-        self.weeds = WeedManager(tile_size)
-        self.players = PlayerManager(tile_size)
-        self.tools = ToolManager(tile_size)
-        self.objects = ObjectManager(tile_size)
+        self.tiles = TileManager(
+            tile_size, cached_atlas, self.sprite_cache, self.asset_pack, self.sprite_budget, self.sprite_registry
+        )
+        self.weeds = WeedManager(
+            tile_size, cached_atlas, self.sprite_cache, self.asset_pack, self.sprite_budget, self.sprite_registry
+        )
+        self.players = PlayerManager(
+            tile_size, cached_atlas, self.sprite_cache, self.asset_pack, self.sprite_budget, self.sprite_registry
+        )
+        self.tools = ToolManager(
+            tile_size, cached_atlas, self.sprite_cache, self.asset_pack, self.sprite_budget, self.sprite_registry
+        )
+        self.objects = ObjectManager(
+            tile_size, cached_atlas, self.sprite_cache, self.asset_pack, self.sprite_budget, self.sprite_registry
+        )
+        
+        # Pack the pinned sprites into a few atlas pages
+        self.atlas = None
+        self._pack_sprites(cached_atlas)
+        
+        # Drop entries for sprites whose sources or generators have changed
+        if self.sprite_cache is not None:
+            self.sprite_cache.prune()
         
         # Sound dictionary
         self.sounds = {}
-        self.assets_dir = Path(__file__).parent.parent.parent / 'assets'
+        
+        # (category, name, size) -> smoothscaled UI icon
+        self.icons = {}
+        
+        # (sprite names, background, size) -> flattened opaque surface
+        self.composites = {}
+        
+        # (sprite name, size) -> sprite pre-scaled for a zoom level
+        self.scaled_sprites = {}
+        # Both count against the sprite budget; those built only from pinned
+        # sprites are pinned too, the rest are evicted like lazy sprites
         
         # Initialize mixer if not already
         if not pygame.mixer.get_init():
             pygame.mixer.init()
 
+    def _managers(self):
+        """Get all specialized managers in lookup order"""
+        return [self.tiles, self.weeds, self.players, self.tools, self.objects]
+
+    def _pack_sprites(self, cached_atlas):
+        """Pack pinned alpha sprites into an atlas and point managers at its regions
+        
+        Every pinned sprite is saved to the atlas cache, which serves them all
+        on the next startup. Only sprites that kept per-pixel alpha stay in
+        the resident atlas: opaque and colorkeyed sprites were already
+        replaced by their own converted surfaces, so their atlas pixels would
+        never be drawn. Lazily loaded sprites stay separate surfaces so
+        evicting them frees memory.
+        
+        Args:
+            cached_atlas: Atlas loaded from disk, or None
+        """
+        managers = self._managers()
+        
+        sprites = {}
+        signatures = {}
+        alpha_keys = []
+        for manager in managers:
+            for name in manager.pinned_sprites:
+                key = manager.atlas_key(name)
+                sprites[key] = manager.sprites[name]
+                signatures[key] = manager.sprite_signatures.get(name)
+                if manager.sprite_formats.get(name) == FORMAT_ALPHA:
+                    alpha_keys.append(key)
+        
+        # Every sprite came out of the cached atlas, nothing to save
+        cache_valid = (cached_atlas is not None and set(cached_atlas.regions) == set(sprites)
+                       and not any(manager.atlas_misses for manager in managers))
+        if self.cache_atlas and not cache_valid:
+            try:
+                SpriteAtlas.build(sprites, signatures).save(self.atlas_cache_dir)
+            except (OSError, pygame.error):
+                print(f"Failed to save sprite atlas cache: {self.atlas_cache_dir}")
+        
+        if cache_valid and len(alpha_keys) == len(sprites):
+            self.atlas = cached_atlas
+        else:
+            self.atlas = SpriteAtlas.build(
+                {key: sprites[key] for key in alpha_keys}, {key: signatures[key] for key in alpha_keys}
+            )
+        
+        # Managers hand out subsurfaces so the get_sprite API is unchanged
+        for manager in managers:
+            for name in manager.pinned_sprites:
+                if manager.sprite_formats.get(name) == FORMAT_ALPHA:
+                    manager._set_resident(name, self.atlas.get(manager.atlas_key(name)))
+            # Let the cached pages go once nothing is served from them
+            manager.atlas = None
+
+    def get_composite(self, sprite_names, background=(0, 0, 0), size=None):
+        """Flatten sprites drawn on top of each other into one opaque surface
+        
+        Drawing the result is a single opaque blit instead of one alpha
+        blit per layer. The result matches blitting the layers in order
+        onto a surface filled with the background color.
+        
+        Args:
+            sprite_names: Sprite names from bottom to top
+            background: Color under the bottom sprite's transparent pixels
+            size: Tile size of a zoom level to build from pre-scaled sprites,
+                defaults to the loaded tile size
+            
+        Returns:
+            Pygame surface in display format without alpha, or None if the
+            bottom sprite is missing
+        """
+        if size is None:
+            size = self.tile_size
+        key = (tuple(sprite_names), tuple(background), size)
+        if key in self.composites:
+            self.sprite_budget.touch(self, key)
+            return self.composites[key]
+        
+        layers = [self.get_scaled_sprite(name, size) for name in sprite_names]
+        composite = None
+        if layers and layers[0] is not None:
+            composite = pygame.Surface(layers[0].get_size())
+            composite.fill(background)
+            for layer in layers:
+                if layer is not None:
+                    composite.blit(layer, (0, 0))
+            if pygame.display.get_surface() is not None:
+                composite = composite.convert()
+        self._add_derived(self.composites, key, composite, all(self._is_pinned(name) for name in sprite_names))
+        return composite
+
+    def get_scaled_sprite(self, sprite_name, size):
+        """Get a sprite pre-scaled for a zoom level, scaling it only once
+        
+        Smaller sizes form a mip chain: each level is smoothscaled from the
+        level twice its size, down from the loaded tile size. Larger sizes
+        are smoothscaled from the full-resolution source image when there
+        is one.
+        
+        Args:
+            sprite_name: Name of the sprite
+            size: Edge length in pixels of the zoom level's tiles
+            
+        Returns:
+            Pygame surface in its normalized display format, or None if not found
+        """
+        if size == self.tile_size:
+            return self.get_sprite(sprite_name)
+        
+        key = (sprite_name, size)
+        if key in self.scaled_sprites:
+            self.sprite_budget.touch(self, key)
+            return self.scaled_sprites[key]
+        
+        scaled = None
+        base = self.get_sprite(sprite_name)
+        if base is not None:
+            if size < self.tile_size:
+                parent = self.get_scaled_sprite(sprite_name, min(size * 2, self.tile_size))
+            else:
+                parent = self._load_source_image(sprite_name)
+                if parent is None:
+                    parent = base
+            # Colorkeys would bleed into smoothscaled edges; scale with real alpha
+            if parent.get_colorkey() is not None:
+                parent = parent.convert_alpha()
+            target = (
+                max(1, round(base.get_width() * size / self.tile_size)),
+                max(1, round(base.get_height() * size / self.tile_size)),
+            )
+            scaled, _ = normalize_sprite(pygame.transform.smoothscale(parent, target))
+        self._add_derived(self.scaled_sprites, key, scaled, self._is_pinned(sprite_name))
+        return scaled
+    
+    def _add_derived(self, cache, key, sprite, pinned):
+        """Keep a scaled or composite sprite and account for it in the sprite budget
+        
+        Args:
+            cache: scaled_sprites or composites
+            key: Cache key
+            sprite: Surface, or None to remember that there is nothing to build
+            pinned: Whether every source sprite is pinned
+        """
+        cache[key] = sprite
+        if sprite is not None:
+            self.sprite_budget.add(self, key, sprite, pinned)
+    
+    def _unload_sprite(self, key):
+        """Drop an evicted scaled or composite sprite; it is rebuilt on next use
+        
+        Args:
+            key: scaled_sprites or composites key (their shapes differ)
+        """
+        self.scaled_sprites.pop(key, None)
+        self.composites.pop(key, None)
+    
+    def _is_pinned(self, sprite_name):
+        """Check whether a sprite is pinned by its manager
+        
+        Args:
+            sprite_name: Name of the sprite
+            
+        Returns:
+            True if the sprite is registered and pinned
+        """
+        sprite_id = self.sprite_registry.get_id(sprite_name)
+        if sprite_id is None:
+            return False
+        manager, name = self.sprite_registry.entries[sprite_id]
+        return name in manager.pinned_sprites
+    
+    def _load_source_image(self, sprite_name):
+        """Load the full-resolution source image of a sprite, if it has one
+        
+        Args:
+            sprite_name: Name of the sprite
+            
+        Returns:
+            Pygame surface or None for generated sprites
+        """
+        sprite_id = self.sprite_registry.get_id(sprite_name)
+        if sprite_id is None:
+            return None
+        manager, name = self.sprite_registry.entries[sprite_id]
+        file_name = manager.sprite_specs[name][1]
+        return self.load_image(f'sprites/{manager.asset_subdir}/{file_name}.png')
+
+    def get_format_report(self, repeats=200):
+        """Time blits of every registered sprite in its normalized format
+        
+        Loads sprites that aren't resident yet.
+        
+        Args:
+            repeats: Blits per sprite and format
+            
+        Returns:
+            List of dicts with manager, name, format, blit_us (chosen format)
+            and alpha_blit_us (the same pixels as a convert_alpha surface)
+        """
+        target = pygame.Surface(pygame.display.get_surface().get_size()).convert()
+        
+        def time_blits(sprite):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                target.blit(sprite, (0, 0))
+            return (time.perf_counter() - start) / repeats * 1e6
+        
+        report = []
+        for manager in self._managers():
+            for name in manager.sprite_specs:
+                sprite = manager.get_sprite(name)
+                if sprite is None:
+                    continue
+                report.append({
+                    'manager': type(manager).__name__,
+                    'name': name,
+                    'format': manager.sprite_formats.get(name),
+                    'blit_us': time_blits(sprite),
+                    'alpha_blit_us': time_blits(sprite.convert_alpha()),
+                })
+        return report
+
+    def get_sprite_stats(self):
+        """Get sprite residency counters for the performance overlay
+        
+        Returns:
+            Dict of hits, misses, evictions, resident and budget bytes
+        """
+        return self.sprite_budget.stats()
+
     def get_sound(self, sound_file: str):
         """Get or load a sound file
         
@@ -49,6 +345,16 @@ class AssetManager:
         if not sound_file:
             return None
             
+        if sound_file not in self.sounds and self.asset_pack:
+            # Pack entries are named relative to the assets directory
+            pack_name = sound_file[len('assets/'):] if sound_file.startswith('assets/') else sound_file
+            try:
+                sound = self.asset_pack.load_sound(pack_name)
+            except pygame.error:
+                sound = None
+            if sound is not None:
+                self.sounds[sound_file] = sound
+        
         if sound_file not in self.sounds:
             # We assume sound_file is relative to the weed_whacker directory, e.g. 'assets/sounds/scythe.wav'
             # Adjust path relative to weed_whacker directory
@@ -75,10 +381,54 @@ class AssetManager:
         if sound:
             sound.play()
     
-    def get_sprite(self, sprite_name):
-        """Get a sprite by name from any manager
+    def load_image(self, relative_path):
+        """Load a full-resolution image from the asset pack or from disk
+        
+        Images from the pack share its memory; scale or copy them rather
+        than keeping or drawing into them.
+        
+        Args:
+            relative_path: Path relative to the assets directory, e.g. 'sprites/objects/coin.png'
+            
+        Returns:
+            Pygame surface or None if the image doesn't exist
+        """
+        if self.asset_pack:
+            image = self.asset_pack.load_image(relative_path)
+            if image is not None:
+                return image
+        
+        image_path = self.assets_dir / relative_path
+        if not image_path.exists():
+            return None
+        try:
+            return pygame.image.load(str(image_path)).convert_alpha()
+        except pygame.error:
+            print(f"Failed to load image: {image_path}")
+            return None
+
+    def get_icon(self, category, name, size):
+        """Get a sprite smoothscaled from its full-resolution source, once per size
         
-        Tries each manager in order until sprite is found.
+        Args:
+            category: Sprite subdirectory (tools, objects, events)
+            name: Sprite name (without extension)
+            size: Icon edge length in pixels
+            
+        Returns:
+            Pygame surface or None if the sprite is missing
+        """
+        key = (category, name, size)
+        if key not in self.icons:
+            icon = None
+            original = self.load_image(f'sprites/{category}/{name}.png')
+            if original is not None:
+                icon = pygame.transform.smoothscale(original, (size, size))
+            self.icons[key] = icon
+        return self.icons[key]
+    
+    def get_sprite(self, sprite_name):
+        """Get a sprite by name from whichever manager registered it
         
         Args:
             sprite_name: Name of the sprite to retrieve
@@ -86,13 +436,50 @@ class AssetManager:
         Returns:
             Pygame surface or None if not found
         """
-        # Try each manager
-        for manager in [self.tiles, self.weeds, self.players, self.tools, self.objects]:
-            sprite = manager.get_sprite(sprite_name)
-            if sprite:
-                return sprite
+        sprite_id = self.sprite_registry.get_id(sprite_name)
+        if sprite_id is None:
+            return None
+        manager, name = self.sprite_registry.entries[sprite_id]
+        return manager.get_sprite(name)
+    
+    def sprite_id(self, sprite_name):
+        """Get the integer id of a sprite for use with get_sprite_by_id
+        
+        Args:
+            sprite_name: Name of the sprite
+            
+        Returns:
+            Integer id or None if no manager has the sprite
+        """
+        return self.sprite_registry.get_id(sprite_name)
+    
+    def get_sprite_by_id(self, sprite_id):
+        """Get a sprite by integer id with a single list index
+        
+        Id lookups don't refresh LRU recency; pin sprites drawn every frame.
+        
+        Args:
+            sprite_id: Id from sprite_id()
+            
+        Returns:
+            Pygame surface or None if it couldn't be loaded
+        """
+        return self.sprite_registry.get(sprite_id)
+    
+    def pin_sprite(self, sprite_name):
+        """Load a sprite and keep it resident so callers can hold on to the surface
         
-        return None
+        Args:
+            sprite_name: Name of the sprite
+            
+        Returns:
+            Pygame surface or None if not found
+        """
+        sprite_id = self.sprite_registry.get_id(sprite_name)
+        if sprite_id is None:
+            return None
+        manager, name = self.sprite_registry.entries[sprite_id]
+        return manager.pin_sprite(name)
     
     def render_sprite(self, surface, sprite_name, x, y):
         """Render a sprite to a surface
@@ -0,0 +1,257 @@
+"""
+Asset pack - single-file archive of decoded sprites and sounds
+
+Layout of a .pak file:
+    magic (8 bytes) | version (u32) | index length (u32) | JSON index | blobs
+
+The index maps each asset's path relative to weed_whacker/assets (for example
+'sprites/tiles/grass_1.png') to its blob offset, size, format and dimensions.
+Sprites are stored as raw BGRA pixels and sounds as raw PCM frames, so
+loading is a memory-mapped slice instead of a file open and a decode.
+
+Sprites can also be stored pre-scaled to the sizes the game draws them at,
+under 'sprites/tiles/grass_1.png@64x64', so loading them needs no scaling.
+"""
+
+import io
+import json
+import mmap
+import struct
+import wave
+import pygame
+from pathlib import Path
+
+
+PACK_MAGIC = b'WWPAK\x00\x00\x00'
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct('<8sII')
+
+# Same byte order convert_alpha() produces, so packed sprites need no conversion
+IMAGE_FORMAT = 'BGRA'
+SOUND_FORMAT = 'PCM'
+
+# Blob alignment keeps pixel rows on word boundaries
+BLOB_ALIGN = 16
+
+DEFAULT_PACK_NAME = 'assets.pak'
+
+
+def _align(offset):
+    return (offset + BLOB_ALIGN - 1) // BLOB_ALIGN * BLOB_ALIGN
+
+
+def variant_name(name, size):
+    """Get the pack entry name of a sprite pre-scaled to a size
+
+    Args:
+        name: Asset path relative to the assets directory
+        size: (width, height) tuple
+
+    Returns:
+        Entry name string
+    """
+    return f'{name}@{size[0]}x{size[1]}'
+
+
+def build_pack(assets_dir, pack_path, max_size=None, variant_sizes=()):
+    """Build a .pak archive from the sprite PNGs and sound WAVs in an assets directory
+
+    Args:
+        assets_dir: The weed_whacker/assets directory
+        pack_path: Output file path
+        max_size: Optional maximum sprite edge length; larger sprites are
+            downscaled at build time to keep the pack small
+        variant_sizes: Edge lengths to also store every sprite at, scaled
+            from the full-resolution source exactly as loose PNGs are
+
+    Returns:
+        Dict of asset name -> index entry that was written
+    """
+    assets_dir = Path(assets_dir)
+    blobs = []  # (name, entry, bytes)
+
+    for png_path in sorted((assets_dir / 'sprites').rglob('*.png')):
+        name = png_path.relative_to(assets_dir).as_posix()
+        image = pygame.image.load(str(png_path))
+        width, height = image.get_size()
+        for edge in sorted(set(variant_sizes)):
+            if (edge, edge) != (width, height):
+                variant = pygame.transform.scale(image, (edge, edge))
+                blobs.append((variant_name(name, (edge, edge)), {'format': IMAGE_FORMAT, 'dims': [edge, edge]},
+                              pygame.image.tobytes(variant, IMAGE_FORMAT)))
+        if max_size and max(width, height) > max_size:
+            scale = max(width, height) / max_size
+            width, height = max(1, round(width / scale)), max(1, round(height / scale))
+            image = pygame.transform.scale(image, (width, height))
+        pixels = pygame.image.tobytes(image, IMAGE_FORMAT)
+        blobs.append((name, {'format': IMAGE_FORMAT, 'dims': [width, height]}, pixels))
+
+    for wav_path in sorted((assets_dir / 'sounds').rglob('*.wav')):
+        name = wav_path.relative_to(assets_dir).as_posix()
+        try:
+            with wave.open(str(wav_path), 'rb') as wav:
+                params = wav.getparams()
+                frames = wav.readframes(params.nframes)
+        except (wave.Error, EOFError):
+            print(f"Skipping unsupported WAV: {wav_path}")
+            continue
+        entry = {
+            'format': SOUND_FORMAT,
+            'dims': [params.framerate, params.sampwidth, params.nchannels],
+        }
+        blobs.append((name, entry, frames))
+
+    # Offsets depend on the index length, which depends on the offsets' digits;
+    # lay blobs out relative to the data start and rebase after sizing the index
+    index = {}
+    cursor = 0
+    for name, entry, data in blobs:
+        cursor = _align(cursor)
+        index[name] = dict(entry, offset=cursor, size=len(data))
+        cursor += len(data)
+
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    # Rebasing only adds a few digits per offset; reserve room for that
+    data_start = _align(PACK_HEADER.size + len(index_bytes) + 16 * len(index))
+    for entry in index.values():
+        entry['offset'] += data_start
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    if PACK_HEADER.size + len(index_bytes) > data_start:
+        raise ValueError('asset pack index outgrew its reserved space')
+
+    pack_path = Path(pack_path)
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = pack_path.with_suffix('.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for name, entry, data in blobs:
+            f.write(b'\x00' * (index[name]['offset'] - f.tell()))
+            f.write(data)
+    temp_path.replace(pack_path)
+    return index
+
+
+class AssetPack:
+    """View of a .pak archive backed by a copy-on-write memory map
+
+    Surfaces from load_image share the mapped pages and are treated as
+    immutable: sprite managers keep exact-size ones as they are and only
+    ever blit from them. Drawing into one would never touch the file (or
+    fault, as a read-only map would), but the change would show in every
+    later load of that entry.
+    """
+
+    def __init__(self, pack_path):
+        """Open and index an asset pack
+
+        Args:
+            pack_path: Path to the .pak file
+
+        Raises:
+            OSError: If the file can't be opened
+            ValueError: If the file isn't a supported asset pack
+        """
+        self.path = Path(pack_path)
+        self._file = open(self.path, 'rb')
+        try:
+            # ACCESS_READ would back surfaces with read-only memory
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, version, index_length = PACK_HEADER.unpack_from(self._map)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise ValueError(f'not a version {PACK_VERSION} asset pack: {self.path}')
+            index_start = PACK_HEADER.size
+            self.index = json.loads(self._map[index_start:index_start + index_length].decode('utf-8'))
+        except (ValueError, struct.error):
+            self._file.close()
+            raise
+
+        # Identifies the pack's contents for sprite signatures
+        self.mtime_ns = self.path.stat().st_mtime_ns
+        self._view = memoryview(self._map)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self):
+        """Get all asset names in the pack"""
+        return list(self.index)
+
+    def _blob(self, entry):
+        return self._view[entry['offset']:entry['offset'] + entry['size']]
+
+    def _image_entry(self, name, size=None):
+        entry = None
+        if size is not None:
+            entry = self.index.get(variant_name(name, size))
+        if entry is None:
+            entry = self.index.get(name)
+        if entry is None or entry['format'] != IMAGE_FORMAT:
+            return None
+        return entry
+
+    def image_size(self, name, size=None):
+        """Get the dimensions load_image would return, without loading
+
+        Args:
+            name: Asset path relative to the assets directory
+            size: Optional (width, height) the caller wants
+
+        Returns:
+            (width, height) tuple, or None if the pack doesn't contain the sprite
+        """
+        entry = self._image_entry(name, size)
+        return tuple(entry['dims']) if entry else None
+
+    def load_image(self, name, size=None):
+        """Get a packed sprite as a surface sharing the mapped pixels
+
+        Args:
+            name: Asset path relative to the assets directory
+            size: Optional (width, height) the caller wants; a variant stored
+                at exactly that size is returned when the pack has one
+
+        Returns:
+            Pygame surface sharing the pack's memory (never draw into it),
+            or None if the pack doesn't contain the sprite
+        """
+        entry = self._image_entry(name, size)
+        if entry is None:
+            return None
+        # frombuffer wraps the mapped bytes without copying them
+        return pygame.image.frombuffer(self._blob(entry), tuple(entry['dims']), IMAGE_FORMAT)
+
+    def load_sound(self, name):
+        """Create a sound from packed PCM frames
+
+        Args:
+            name: Asset path relative to the assets directory
+
+        Returns:
+            pygame.mixer.Sound or None if the pack doesn't contain the sound
+        """
+        entry = self.index.get(name)
+        if entry is None or entry['format'] != SOUND_FORMAT:
+            return None
+
+        framerate, sampwidth, channels = entry['dims']
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format == (framerate, -8 * sampwidth if sampwidth > 1 else 8, channels):
+            # Mixer already plays this format, hand over the frames directly
+            return pygame.mixer.Sound(buffer=self._blob(entry))
+
+        # Otherwise let SDL resample by presenting the frames as a WAV stream
+        wav_bytes = io.BytesIO()
+        with wave.open(wav_bytes, 'wb') as wav:
+            wav.setnchannels(channels)
+            wav.setsampwidth(sampwidth)
+            wav.setframerate(framerate)
+            wav.writeframes(self._blob(entry))
+        wav_bytes.seek(0)
+        return pygame.mixer.Sound(file=wav_bytes)
+
+    def close(self):
+        """Release the memory map (fails while surfaces still reference it)"""
+        self._view.release()
+        self._map.close()
+        self._file.close()
@@ -2,32 +2,290 @@
 Base asset manager providing common sprite loading/generation functionality
 """
 
+import functools
 import pygame
 from pathlib import Path
 
 
+# Sprite blit formats chosen by normalize_sprite, cheapest first
+FORMAT_OPAQUE = 'opaque'      # convert(): every pixel fully opaque
+FORMAT_COLORKEY = 'colorkey'  # convert() + RLEACCEL colorkey: alpha only 0 or 255
+FORMAT_ALPHA = 'alpha'        # convert_alpha(): partially transparent pixels
+
+# Stands in for transparent pixels of colorkeyed sprites
+NORMALIZE_COLORKEY = (255, 0, 255)
+
+
+def normalize_sprite(sprite):
+    """Convert a sprite to the cheapest display format that draws it identically
+    
+    The format is chosen by inspecting pixels: fully opaque sprites drop
+    their alpha channel, sprites whose pixels are either fully opaque or
+    fully transparent become run-length encoded colorkey surfaces, and only
+    sprites with partial transparency keep per-pixel alpha.
+    
+    Args:
+        sprite: Surface to normalize
+        
+    Returns:
+        Tuple of (surface in display format, format name)
+    """
+    width, height = sprite.get_size()
+    opaque_pixels = pygame.mask.from_surface(sprite, 254).count()
+    if opaque_pixels == width * height:
+        return sprite.convert(), FORMAT_OPAQUE
+    
+    visible_pixels = pygame.mask.from_surface(sprite, 0).count()
+    if visible_pixels == opaque_pixels:
+        keyed = pygame.Surface((width, height)).convert()
+        keyed.fill(NORMALIZE_COLORKEY)
+        keyed.blit(sprite, (0, 0))
+        keyed.set_colorkey(NORMALIZE_COLORKEY, pygame.RLEACCEL)
+        # Opaque pixels that happen to use the key color would vanish
+        if pygame.mask.from_surface(keyed).count() == opaque_pixels:
+            return keyed, FORMAT_COLORKEY
+    
+    # Atlas regions and packed sprites are already in display format; keep them shared
+    display_masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+    if sprite.get_flags() & pygame.SRCALPHA and sprite.get_masks() == display_masks:
+        return sprite, FORMAT_ALPHA
+    return sprite.convert_alpha(), FORMAT_ALPHA
+
+
 class BaseAssetManager:
     """Base class for asset managers with common sprite loading logic"""
     
-    def __init__(self, tile_size, asset_subdir):
+    def __init__(self, tile_size, asset_subdir, atlas=None, sprite_cache=None, asset_pack=None, sprite_budget=None,
+                 sprite_registry=None):
         """Initialize base asset manager
         
         Args:
             tile_size: Size of tiles in pixels
             asset_subdir: Subdirectory under assets/sprites/ for this asset type
+            atlas: Optional cached SpriteAtlas to take unchanged sprites from
+            sprite_cache: Optional SpriteCache storing loaded and generated pixels
+            asset_pack: Optional AssetPack read instead of loose PNG files
+            sprite_budget: Optional SpriteBudget shared by all managers for LRU eviction
+            sprite_registry: Optional SpriteRegistry assigning integer sprite ids
         """
         self.tile_size = tile_size
-        self.sprites = {}
+        self.sprites = {}  # Resident sprites only; see sprite_specs for everything registered
+        self.sprite_specs = {}  # name -> (generator_func, file_name, size, signature, cache_key)
+        self.pinned_sprites = set()
+        self.sprite_signatures = {}  # name -> source signature of pinned sprites, for atlas caching
+        self.atlas_misses = 0  # Pinned sprites that had to be loaded or generated
+        self.asset_subdir = asset_subdir
+        self.atlas = atlas
+        self.sprite_cache = sprite_cache
+        self.asset_pack = asset_pack
+        self.sprite_budget = sprite_budget
+        self.sprite_registry = sprite_registry
+        self.sprite_ids = {}  # name -> registry id
+        self.sprite_formats = {}  # name -> blit format chosen by normalize_sprite
         self.asset_dir = Path(__file__).parent.parent / 'sprites' / asset_subdir
         self.asset_dir.mkdir(parents=True, exist_ok=True)
     
-    def _load_or_generate(self, name, generator_func, size=None):
-        """Load sprite from file or generate it
+    def _add_sprite(self, name, generator_func, file_name=None, size=None, pinned=False, args=()):
+        """Register a sprite under a name
+        
+        Unpinned sprites are loaded on their first get_sprite and may be
+        evicted again when the sprite budget runs out. Pinned sprites are
+        loaded now, packed into the atlas and never evicted.
+        
+        Args:
+            name: Sprite identifier used by get_sprite
+            generator_func: Method to generate sprite if file not found; pass
+                the method itself, not a lambda, so the sprite cache key
+                follows changes to its code
+            file_name: PNG name (without extension), defaults to name
+            size: Custom size tuple (width, height), defaults to (tile_size, tile_size)
+            pinned: Load eagerly and keep resident (for sprites drawn every frame)
+            args: Arguments generator_func is called with
+        """
+        if args:
+            generator_func = functools.partial(generator_func, *args)
+        if file_name is None:
+            file_name = name
+        if size is None:
+            size = (self.tile_size, self.tile_size)
+        
+        signature = self._source_signature(file_name, size)
+        cache_key = None
+        # Exact-size pack sprites are served from the map and never cached
+        if self.sprite_cache is not None and not self._is_packed_at(file_name, size):
+            cache_key = self._cache_key(file_name, generator_func, size, signature)
+            # Keep the disk entry alive even if the sprite isn't loaded this run
+            self.sprite_cache.touch(cache_key)
+        self.sprite_specs[name] = (generator_func, file_name, size, signature, cache_key)
+        if self.sprite_registry is not None:
+            self.sprite_ids[name] = self.sprite_registry.register(self, name)
+        
+        if pinned:
+            self.pinned_sprites.add(name)
+            self.sprite_signatures[name] = signature
+            self._load_sprite(name)
+    
+    def _load_sprite(self, name):
+        """Load a registered sprite and make it resident
+        
+        Pinned sprites still present and unchanged in the cached atlas are
+        taken from it; otherwise the sprite cache is tried before decoding
+        a PNG or running the generator. The result is normalized to its
+        cheapest blit format.
+        
+        Args:
+            name: Registered sprite identifier
+            
+        Returns:
+            Pygame surface with the sprite
+        """
+        generator_func, file_name, size, signature, cache_key = self.sprite_specs[name]
+        pinned = name in self.pinned_sprites
+        
+        sprite = None
+        if pinned and self.atlas:
+            sprite = self.atlas.lookup(self.atlas_key(name), signature)
+        if sprite is None:
+            sprite = self._load_or_generate(file_name, generator_func, size, cache_key)
+            if pinned:
+                self.atlas_misses += 1
+        sprite, self.sprite_formats[name] = normalize_sprite(sprite)
+        
+        self._set_resident(name, sprite)
+        if self.sprite_budget is not None:
+            self.sprite_budget.add(self, name, sprite, pinned)
+        return sprite
+    
+    def _set_resident(self, name, sprite):
+        """Store or drop a resident sprite, keeping the registry's id table in sync
+        
+        Args:
+            name: Sprite identifier
+            sprite: Surface, or None to drop it
+        """
+        if sprite is None:
+            self.sprites.pop(name, None)
+        else:
+            self.sprites[name] = sprite
+        if name in self.sprite_ids:
+            self.sprite_registry.surfaces[self.sprite_ids[name]] = sprite
+    
+    def _unload_sprite(self, name):
+        """Drop a resident sprite; it is reloaded on its next get_sprite
+        
+        Args:
+            name: Sprite identifier
+        """
+        self._set_resident(name, None)
+    
+    def pin_sprite(self, name):
+        """Load a sprite if needed and keep it resident from now on
+        
+        Use for sprites that callers hold on to across frames.
+        
+        Args:
+            name: Sprite identifier
+            
+        Returns:
+            Pygame surface or None if not registered
+        """
+        sprite = self.get_sprite(name)
+        if sprite is not None and name not in self.pinned_sprites:
+            self.pinned_sprites.add(name)
+            if self.sprite_budget is not None:
+                self.sprite_budget.pin(self, name)
+        return sprite
+    
+    def _source_signature(self, file_name, size):
+        """Describe a sprite's source so cached copies can be validated
+        
+        Args:
+            file_name: PNG name (without extension)
+            size: Target size tuple
+            
+        Returns:
+            JSON-serializable list of size and PNG modification time (None if generated)
+        """
+        if self.asset_pack and self._pack_name(file_name) in self.asset_pack:
+            return [file_name, size[0], size[1], f'pak:{self.asset_pack.mtime_ns}']
+        
+        sprite_path = self.asset_dir / f'{file_name}.png'
+        try:
+            mtime = sprite_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        return [file_name, size[0], size[1], mtime]
+    
+    def _cache_key(self, file_name, generator_func, size, signature=None):
+        """Get the sprite cache key for a sprite's current inputs
+        
+        Args:
+            file_name: PNG name (without extension)
+            generator_func: Function that draws the sprite when no PNG exists
+            size: Target size tuple
+            signature: Source signature, computed if not given
+            
+        Returns:
+            Content-addressed key string
+        """
+        if signature is None:
+            signature = self._source_signature(file_name, size)
+        return self.sprite_cache.make_key(
+            type(self).__name__,
+            self.tile_size,
+            signature,
+            self.sprite_cache.generator_fingerprint(generator_func),
+        )
+    
+    def _pack_name(self, file_name):
+        """Get the asset pack entry name for a PNG
+        
+        Args:
+            file_name: PNG name (without extension)
+            
+        Returns:
+            Path relative to the assets directory
+        """
+        return f'sprites/{self.asset_subdir}/{file_name}.png'
+    
+    def atlas_key(self, name):
+        """Get the atlas region name for a sprite
+        
+        Args:
+            name: Sprite identifier
+            
+        Returns:
+            Name unique across all managers
+        """
+        return f'{self.asset_subdir}/{name}'
+    
+    def _is_packed_at(self, file_name, size):
+        """Check whether the asset pack stores a sprite at exactly a size
+        
+        Args:
+            file_name: PNG name (without extension)
+            size: Target size tuple
+            
+        Returns:
+            True if the pack can serve the sprite without scaling
+        """
+        if not self.asset_pack:
+            return False
+        return self.asset_pack.image_size(self._pack_name(file_name), size) == tuple(size)
+    
+    def _load_or_generate(self, name, generator_func, size=None, cache_key=None):
+        """Load sprite from the asset pack, the sprite cache, from file, or generate it
+        
+        A sprite the pack stores at exactly the wanted size is returned as
+        a surface over the mapped pixels: no decode, scale or copy, and no
+        sprite cache lookup, since the pack is already raw pixels. Such
+        surfaces share the pack's pages and must never be drawn into.
         
         Args:
             name: Sprite name (without extension)
             generator_func: Function to generate sprite if file not found
             size: Custom size tuple (width, height), defaults to (tile_size, tile_size)
+            cache_key: Sprite cache key, computed if a cache is set and none is given
             
         Returns:
             Pygame surface with the sprite
@@ -35,6 +293,39 @@ class BaseAssetManager:
         if size is None:
             size = (self.tile_size, self.tile_size)
         
+        if self._is_packed_at(name, size):
+            return self.asset_pack.load_image(self._pack_name(name), size)
+        
+        if self.sprite_cache is None:
+            return self._load_or_generate_uncached(name, generator_func, size)
+        
+        if cache_key is None:
+            cache_key = self._cache_key(name, generator_func, size)
+        sprite = self.sprite_cache.load(cache_key)
+        if sprite is None:
+            sprite = self._load_or_generate_uncached(name, generator_func, size)
+            self.sprite_cache.store(cache_key, sprite)
+        return sprite
+    
+    def _load_or_generate_uncached(self, name, generator_func, size):
+        """Read a packed or PNG sprite and scale it, or run the generator if there is none
+        
+        Args:
+            name: Sprite name (without extension)
+            generator_func: Function to generate sprite if file not found
+            size: Target size tuple (width, height)
+            
+        Returns:
+            Pygame surface with the sprite
+        """
+        # Packed pixels are already decoded; only sizes the pack lacks get here
+        if self.asset_pack:
+            packed_sprite = self.asset_pack.load_image(self._pack_name(name), size)
+            if packed_sprite is not None:
+                if packed_sprite.get_size() != size:
+                    return pygame.transform.scale(packed_sprite, size)
+                return packed_sprite
+        
         # Try to load from PNG file
         sprite_path = self.asset_dir / f'{name}.png'
         if sprite_path.exists():
@@ -61,7 +352,14 @@ class BaseAssetManager:
         Returns:
             Pygame surface or None if not found
         """
-        return self.sprites.get(name)
+        sprite = self.sprites.get(name)
+        if sprite is not None:
+            if self.sprite_budget is not None:
+                self.sprite_budget.touch(self, name)
+            return sprite
+        if name in self.sprite_specs:
+            return self._load_sprite(name)
+        return None
     
     def render_sprite(self, surface, sprite_name, x, y):
         """Render a sprite to a surface
@@ -9,31 +9,41 @@ from .base_asset_manager import BaseAssetManager
 class ObjectManager(BaseAssetManager):
     """Manages object sprites (rocks, trees, buildings, decorations, etc.)"""
     
-    def __init__(self, tile_size):
+    def __init__(self, tile_size, atlas=None, sprite_cache=None, asset_pack=None,
+                 sprite_budget=None, sprite_registry=None):
         """Initialize object manager
         
         Args:
             tile_size: Size of tiles in pixels
+            atlas: Optional cached SpriteAtlas
+            sprite_cache: Optional SpriteCache
+            asset_pack: Optional AssetPack
+            sprite_budget: Optional SpriteBudget
+            sprite_registry: Optional SpriteRegistry
         """
-        super().__init__(tile_size, 'objects')
+        super().__init__(
+            tile_size, 'objects', atlas, sprite_cache, asset_pack, sprite_budget, sprite_registry
+        )
         self._load_objects()
     
     def _load_objects(self):
-        """Load or generate all object sprites"""
+        """Register all object sprites (loaded on first use)"""
         # Future objects - ready to enable when needed
-        # self.sprites['rock_small'] = self._load_or_generate(
+        # self._add_sprite(
         #     'rock_small',
-        #     lambda: self._generate_rock('small')
+        #     self._generate_rock,
+        #     args=('small',)
         # )
-        # self.sprites['rock_large'] = self._load_or_generate(
+        # self._add_sprite(
         #     'rock_large',
-        #     lambda: self._generate_rock('large')
+        #     self._generate_rock,
+        #     args=('large',)
         # )
-        # self.sprites['tree'] = self._load_or_generate(
+        # self._add_sprite(
         #     'tree',
         #     self._generate_tree
         # )
-        # self.sprites['fence'] = self._load_or_generate(
+        # self._add_sprite(
         #     'fence',
         #     self._generate_fence
         # )
@@ -9,33 +9,52 @@ from .base_asset_manager import BaseAssetManager
 class PlayerManager(BaseAssetManager):
     """Manages player sprites (different avatars, skins, animations)"""
     
-    def __init__(self, tile_size):
+    def __init__(self, tile_size, atlas=None, sprite_cache=None, asset_pack=None,
+                 sprite_budget=None, sprite_registry=None):
         """Initialize player manager
         
         Args:
             tile_size: Size of tiles in pixels
+            atlas: Optional cached SpriteAtlas
+            sprite_cache: Optional SpriteCache
+            asset_pack: Optional AssetPack
+            sprite_budget: Optional SpriteBudget
+            sprite_registry: Optional SpriteRegistry
         """
-        super().__init__(tile_size, 'players')
+        super().__init__(
+            tile_size, 'players', atlas, sprite_cache, asset_pack, sprite_budget, sprite_registry
+        )
         self._load_players()
     
     def _load_players(self):
-        """Load or generate all player sprites"""
+        """Register all player sprites (loaded on first use)"""
         # Default player - loads farmer.png
-        self.sprites['player'] = self._load_or_generate(
-            'farmer',
-            lambda: self._generate_player('default')
+        self._add_sprite(
+            'player',
+            self._generate_player,
+            file_name='farmer',
+            args=('default',)
+        )
+        
+        # Helper workers - generated, in their own color
+        self._add_sprite(
+            'worker',
+            self._generate_player,
+            args=('green',)
         )
         
         # TODO: Add character selection system to allow players to choose their avatar
         
         # Future player avatars - ready to enable
-        # self.sprites['player_blue'] = self._load_or_generate(
+        # self._add_sprite(
         #     'player_blue',
-        #     lambda: self._generate_player('blue')
+        #     self._generate_player,
+        #     args=('blue',)
         # )
-        # self.sprites['player_red'] = self._load_or_generate(
+        # self._add_sprite(
         #     'player_red',
-        #     lambda: self._generate_player('red')
+        #     self._generate_player,
+        #     args=('red',)
         # )
     
     def _generate_player(self, avatar_type):
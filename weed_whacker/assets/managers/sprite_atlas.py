@@ -0,0 +1,225 @@
+"""
+Sprite atlas - packs many small sprites into a few large surfaces
+"""
+
+import json
+import pygame
+from pathlib import Path
+
+
+ATLAS_VERSION = 1
+
+
+class ShelfPacker:
+    """Shelf bin packer that fills a page row by row
+
+    Rectangles should be inserted tallest first; each shelf is as tall as the
+    first rectangle placed on it and later ones fill it left to right.
+    """
+
+    def __init__(self, width, height, padding=1):
+        """Initialize packer for one page
+
+        Args:
+            width, height: Page dimensions in pixels
+            padding: Gap left between packed rectangles
+        """
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.shelf_y = 0        # Top of the current shelf
+        self.shelf_height = 0   # Height of the current shelf
+        self.cursor_x = 0       # Next free x on the current shelf
+        self.used_width = 0
+        self.used_height = 0
+
+    def insert(self, width, height):
+        """Find a place for a rectangle
+
+        Args:
+            width, height: Rectangle dimensions
+
+        Returns:
+            (x, y) position or None if the page is full
+        """
+        if width > self.width or height > self.height:
+            return None
+
+        # Start a new shelf if the rectangle doesn't fit on the current one
+        shelf_y, shelf_height, cursor_x = self.shelf_y, self.shelf_height, self.cursor_x
+        if cursor_x + width > self.width:
+            shelf_y += shelf_height + self.padding
+            shelf_height = 0
+            cursor_x = 0
+
+        # Check before committing anything, so a failed insert leaves the packer unchanged
+        if shelf_y + height > self.height:
+            return None
+
+        position = (cursor_x, shelf_y)
+        self.shelf_y = shelf_y
+        self.cursor_x = cursor_x + width + self.padding
+        self.shelf_height = max(shelf_height, height)
+        self.used_width = max(self.used_width, position[0] + width)
+        self.used_height = max(self.used_height, position[1] + height)
+        return position
+
+
+class SpriteAtlas:
+    """Sprites packed into one or a few page surfaces, addressed by name"""
+
+    def __init__(self, pages, regions, signatures=None):
+        """Initialize atlas from packed pages
+
+        Args:
+            pages: List of page surfaces
+            regions: Dict of name -> (page_index, pygame.Rect)
+            signatures: Optional dict of name -> JSON-serializable source signature
+                used to validate a cached atlas
+        """
+        self.pages = pages
+        self.regions = regions
+        self.signatures = signatures or {}
+        self._subsurfaces = {}
+
+    @classmethod
+    def build(cls, sprites, signatures=None, page_size=1024, padding=1):
+        """Pack sprites into atlas pages
+
+        Args:
+            sprites: Dict of name -> pygame surface
+            signatures: Optional dict of name -> source signature
+            page_size: Edge length of each page in pixels
+            padding: Gap between sprites to avoid bleeding
+
+        Returns:
+            SpriteAtlas instance
+        """
+        # Tallest first keeps shelves tight
+        order = sorted(sprites, key=lambda name: (sprites[name].get_height(), sprites[name].get_width()), reverse=True)
+
+        placements = []  # (name, page_index, x, y)
+        packers = []
+        for name in order:
+            width, height = sprites[name].get_size()
+            position = None
+            for page_index, packer in enumerate(packers):
+                position = packer.insert(width, height)
+                if position:
+                    break
+            if position is None:
+                # Oversized sprites get a page of their own
+                packer = ShelfPacker(max(page_size, width), max(page_size, height), padding)
+                packers.append(packer)
+                page_index = len(packers) - 1
+                position = packer.insert(width, height)
+            placements.append((name, page_index, position[0], position[1]))
+
+        # Trim each page to the area actually used
+        pages = [
+            pygame.Surface((max(1, packer.used_width), max(1, packer.used_height)), pygame.SRCALPHA)
+            for packer in packers
+        ]
+        regions = {}
+        for name, page_index, x, y in placements:
+            sprite = sprites[name]
+            pages[page_index].blit(sprite, (x, y))
+            regions[name] = (page_index, pygame.Rect(x, y, sprite.get_width(), sprite.get_height()))
+
+        return cls(pages, regions, dict(signatures or {}))
+
+    def get(self, name):
+        """Get a packed sprite by name
+
+        Args:
+            name: Sprite identifier
+
+        Returns:
+            Subsurface of an atlas page or None if not packed
+        """
+        if name not in self._subsurfaces:
+            region = self.regions.get(name)
+            if region is None:
+                return None
+            page_index, rect = region
+            self._subsurfaces[name] = self.pages[page_index].subsurface(rect)
+        return self._subsurfaces[name]
+
+    def lookup(self, name, signature):
+        """Get a packed sprite only if its source hasn't changed since packing
+
+        Args:
+            name: Sprite identifier
+            signature: Current source signature of the sprite
+
+        Returns:
+            Subsurface or None if missing or stale
+        """
+        if name not in self.regions or self.signatures.get(name) != signature:
+            return None
+        return self.get(name)
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def save(self, cache_dir):
+        """Save atlas pages and a JSON index to a cache directory
+
+        Args:
+            cache_dir: Directory to write atlas_<n>.png files and atlas.json to
+        """
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        for page_index, page in enumerate(self.pages):
+            pygame.image.save(page, str(cache_dir / f'atlas_{page_index}.png'))
+
+        index = {
+            'version': ATLAS_VERSION,
+            'pages': len(self.pages),
+            'regions': {
+                name: {
+                    'page': page_index,
+                    'rect': [rect.x, rect.y, rect.width, rect.height],
+                    'signature': self.signatures.get(name),
+                }
+                for name, (page_index, rect) in self.regions.items()
+            },
+        }
+        with open(cache_dir / 'atlas.json', 'w') as f:
+            json.dump(index, f, indent=1)
+
+    @classmethod
+    def load(cls, cache_dir):
+        """Load a previously saved atlas
+
+        Args:
+            cache_dir: Directory containing atlas.json and its pages
+
+        Returns:
+            SpriteAtlas instance or None if the cache is missing or unusable
+        """
+        cache_dir = Path(cache_dir)
+        index_path = cache_dir / 'atlas.json'
+        if not index_path.exists():
+            return None
+
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+            if index.get('version') != ATLAS_VERSION:
+                return None
+
+            pages = [
+                pygame.image.load(str(cache_dir / f'atlas_{page_index}.png')).convert_alpha()
+                for page_index in range(index['pages'])
+            ]
+            regions = {}
+            signatures = {}
+            for name, entry in index['regions'].items():
+                regions[name] = (entry['page'], pygame.Rect(entry['rect']))
+                signatures[name] = entry['signature']
+        except (OSError, ValueError, KeyError, pygame.error):
+            return None
+
+        return cls(pages, regions, signatures)
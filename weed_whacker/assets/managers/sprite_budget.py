@@ -0,0 +1,111 @@
+"""
+Sprite budget - shared memory budget and LRU eviction for lazily loaded sprites
+"""
+
+from collections import OrderedDict
+
+
+class SpriteBudget:
+    """Tracks resident sprite bytes across managers and evicts least recently used sprites
+
+    Pinned sprites count towards resident memory but are never evicted.
+    Owners are sprite managers, or the AssetManager for its scaled and
+    composite sprites; each provides _unload_sprite(name).
+    """
+
+    def __init__(self, max_bytes):
+        """Initialize sprite budget
+
+        Args:
+            max_bytes: Resident byte budget for unpinned sprites (None for unlimited)
+        """
+        self.max_bytes = max_bytes
+        self.used_bytes = 0     # Unpinned sprites
+        self.pinned_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (manager, sprite name) -> bytes, oldest first
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def surface_bytes(surface):
+        """Get the pixel memory used by a surface
+
+        Args:
+            surface: Pygame surface
+
+        Returns:
+            Size in bytes
+        """
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def touch(self, manager, name):
+        """Record a lookup of a resident sprite
+
+        Args:
+            manager: Asset manager owning the sprite
+            name: Sprite identifier
+        """
+        self.hits += 1
+        key = (manager, name)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+    def add(self, manager, name, sprite, pinned=False):
+        """Account for a newly loaded sprite, evicting others if over budget
+
+        Args:
+            manager: Asset manager owning the sprite
+            name: Sprite identifier
+            sprite: Loaded surface
+            pinned: Whether the sprite must stay resident
+        """
+        self.misses += 1
+        size = self.surface_bytes(sprite)
+        if pinned:
+            self.pinned_bytes += size
+            return
+
+        self._entries[(manager, name)] = size
+        self.used_bytes += size
+        self._evict()
+
+    def pin(self, manager, name):
+        """Exempt a resident sprite from eviction
+
+        Args:
+            manager: Asset manager owning the sprite
+            name: Sprite identifier
+        """
+        size = self._entries.pop((manager, name), None)
+        if size is not None:
+            self.used_bytes -= size
+            self.pinned_bytes += size
+
+    def _evict(self):
+        """Unload least recently used sprites until within budget"""
+        if self.max_bytes is None:
+            return
+        # Always keep the most recent sprite, even if it alone exceeds the budget
+        while self.used_bytes > self.max_bytes and len(self._entries) > 1:
+            (manager, name), size = self._entries.popitem(last=False)
+            manager._unload_sprite(name)
+            self.used_bytes -= size
+            self.evictions += 1
+
+    def stats(self):
+        """Get counters for the performance overlay
+
+        Returns:
+            Dict of hits, misses, evictions, resident and budget bytes
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'evictable_sprites': len(self._entries),
+            'resident_bytes': self.used_bytes + self.pinned_bytes,
+            'pinned_bytes': self.pinned_bytes,
+            'budget_bytes': self.max_bytes,
+        }
@@ -0,0 +1,171 @@
+"""
+Sprite cache - content-addressed disk cache of generated and scaled sprites
+"""
+
+import functools
+import hashlib
+import struct
+import pygame
+from pathlib import Path
+
+
+CACHE_VERSION = 1
+
+# Matches the layout convert_alpha() produces, so cached pixels need no conversion
+PIXEL_FORMAT = 'BGRA'
+
+# Magic, width, height
+HEADER = struct.Struct('<4sII')
+MAGIC = b'WWSP'
+
+
+def _hash_code(code, digest):
+    """Feed a code object's bytecode and constants into a digest
+
+    Nested code objects (comprehensions, inner functions) are hashed
+    recursively, since their repr contains a memory address.
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _hash_code(const, digest)
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+
+class SpriteCache:
+    """Stores final sprite pixels on disk under a hash of everything they depend on
+
+    A cache entry is the raw BGRA pixels of a sprite after loading, scaling
+    and converting (or after procedural generation). Any change to the
+    inputs produces a different key, so entries never need invalidating;
+    stale ones are simply pruned.
+    """
+
+    def __init__(self, cache_dir):
+        """Initialize sprite cache
+
+        Args:
+            cache_dir: Directory holding the cached .sprite files
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self.used_keys = set()
+
+    @staticmethod
+    def make_key(*parts):
+        """Build a content-addressed key from the inputs a sprite depends on
+
+        Args:
+            *parts: Values that determine the sprite's pixels (manager, sprite
+                name, tile size, source signature, generator fingerprint)
+
+        Returns:
+            Hex digest usable as a file name
+        """
+        digest = hashlib.sha1(repr((CACHE_VERSION,) + parts).encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def generator_fingerprint(generator_func):
+        """Describe a generator function so code changes invalidate its entries
+
+        Managers register their generator methods with the arguments bound
+        by functools.partial rather than wrapped in a lambda, so the method
+        that actually draws the sprite is the one fingerprinted here.
+
+        Args:
+            generator_func: Function, bound method or functools.partial that draws a sprite
+
+        Returns:
+            Tuple of qualified name, bytecode hash, default arguments and bound arguments
+        """
+        bound_args = None
+        if isinstance(generator_func, functools.partial):
+            bound_args = repr((generator_func.args, sorted(generator_func.keywords.items())))
+            generator_func = generator_func.func
+        func = getattr(generator_func, '__func__', generator_func)
+        code = getattr(func, '__code__', None)
+        code_hash = None
+        if code is not None:
+            digest = hashlib.sha1()
+            _hash_code(code, digest)
+            code_hash = digest.hexdigest()
+        return (
+            getattr(func, '__qualname__', repr(func)),
+            code_hash,
+            repr(getattr(func, '__defaults__', None)),
+            bound_args,
+        )
+
+    def _path(self, key):
+        return self.cache_dir / f'{key}.sprite'
+
+    def touch(self, key):
+        """Mark an entry as still in use without loading it
+
+        Args:
+            key: Key from make_key
+        """
+        self.used_keys.add(key)
+
+    def load(self, key):
+        """Load a cached sprite
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Pygame surface backed by the cached bytes, or None on a miss
+        """
+        self.used_keys.add(key)
+        try:
+            # A bytearray keeps the surface writable; frombuffer over bytes would
+            # let later blits scribble on an immutable object
+            data = bytearray(self._path(key).read_bytes())
+            magic, width, height = HEADER.unpack_from(data)
+            pixels = memoryview(data)[HEADER.size:]
+            if magic != MAGIC or len(pixels) != width * height * 4:
+                raise ValueError('corrupt sprite cache entry')
+            # frombuffer wraps the pixels in place instead of copying them
+            sprite = pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+        except (OSError, ValueError, struct.error, pygame.error):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return sprite
+
+    def store(self, key, sprite):
+        """Write a sprite's final pixels to the cache
+
+        Args:
+            key: Key from make_key
+            sprite: Surface to store
+        """
+        self.used_keys.add(key)
+        width, height = sprite.get_size()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            pixels = pygame.image.tobytes(sprite, PIXEL_FORMAT)
+            # Write then rename so an interrupted write never leaves a partial entry
+            temp_path = self._path(key).with_suffix('.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, width, height))
+                f.write(pixels)
+            temp_path.replace(self._path(key))
+        except (OSError, pygame.error):
+            print(f"Failed to write sprite cache entry: {self._path(key)}")
+
+    def prune(self):
+        """Delete cache entries not loaded or stored during this run"""
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob('*.sprite'):
+            if path.stem not in self.used_keys:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
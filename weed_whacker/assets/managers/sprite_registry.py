@@ -0,0 +1,60 @@
+"""
+Sprite registry - flat integer ids for every sprite across all managers
+"""
+
+
+class SpriteRegistry:
+    """Assigns each registered sprite a small integer id
+
+    Resident surfaces are mirrored into a flat list indexed by id, so hot
+    render paths can fetch a sprite with one list index instead of a name
+    lookup through every manager.
+    """
+
+    def __init__(self):
+        """Initialize empty registry"""
+        self.ids = {}        # name -> id (first manager to register a name wins)
+        self.entries = []    # id -> (manager, name)
+        self.surfaces = []   # id -> resident surface or None
+
+    def register(self, manager, name):
+        """Assign an id to a manager's sprite
+
+        Args:
+            manager: Asset manager owning the sprite
+            name: Sprite identifier within that manager
+
+        Returns:
+            Integer sprite id
+        """
+        sprite_id = len(self.entries)
+        self.entries.append((manager, name))
+        self.surfaces.append(None)
+        self.ids.setdefault(name, sprite_id)
+        return sprite_id
+
+    def get_id(self, name):
+        """Get the id for a sprite name
+
+        Args:
+            name: Sprite identifier
+
+        Returns:
+            Integer sprite id or None if no manager registered the name
+        """
+        return self.ids.get(name)
+
+    def get(self, sprite_id):
+        """Get a sprite by id, loading it if it isn't resident
+
+        Args:
+            sprite_id: Integer sprite id
+
+        Returns:
+            Pygame surface or None if it couldn't be loaded
+        """
+        surface = self.surfaces[sprite_id]
+        if surface is None:
+            manager, name = self.entries[sprite_id]
+            surface = manager.get_sprite(name)
+        return surface
@@ -9,33 +9,48 @@ from .base_asset_manager import BaseAssetManager
 class TileManager(BaseAssetManager):
     """Manages tile sprites (grass variations, unowned, etc.)"""
     
-    def __init__(self, tile_size):
+    def __init__(self, tile_size, atlas=None, sprite_cache=None, asset_pack=None,
+                 sprite_budget=None, sprite_registry=None):
         """Initialize tile manager
         
         Args:
             tile_size: Size of tiles in pixels
+            atlas: Optional cached SpriteAtlas
+            sprite_cache: Optional SpriteCache
+            asset_pack: Optional AssetPack
+            sprite_budget: Optional SpriteBudget
+            sprite_registry: Optional SpriteRegistry
         """
-        super().__init__(tile_size, 'tiles')
+        super().__init__(
+            tile_size, 'tiles', atlas, sprite_cache, asset_pack, sprite_budget, sprite_registry
+        )
         self._load_tiles()
     
     def _load_tiles(self):
-        """Load or generate all tile sprites"""
+        """Load or generate all tile sprites
+        
+        Tiles cover the whole viewport every frame, so they are pinned.
+        """
         # Load grass variations (grass_1, grass_2, grass_3 from PNG files)
         # Note: Using 1-based indexing to match asset filenames
         for i in range(1, 4):
-            self.sprites[f'grass_{i}'] = self._load_or_generate(
+            self._add_sprite(
                 f'grass_{i}',
-                lambda variation=i-1: self._generate_grass(variation)
+                self._generate_grass,
+                pinned=True,
+                args=(i - 1,)
             )
         
         # Generate unowned tiles
-        self.sprites['unowned'] = self._load_or_generate(
+        self._add_sprite(
             'unowned',
-            self._generate_unowned
+            self._generate_unowned,
+            pinned=True
         )
-        self.sprites['unowned_purchasable'] = self._load_or_generate(
+        self._add_sprite(
             'unowned_purchasable',
-            self._generate_unowned_purchasable
+            self._generate_unowned_purchasable,
+            pinned=True
         )
     
     def _generate_grass(self, variation=0):
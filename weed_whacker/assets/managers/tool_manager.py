@@ -9,54 +9,62 @@ from .base_asset_manager import BaseAssetManager
 class ToolManager(BaseAssetManager):
     """Manages tool sprites (scythe, hoe, watering can, etc.)"""
     
-    def __init__(self, tile_size):
+    def __init__(self, tile_size, atlas=None, sprite_cache=None, asset_pack=None,
+                 sprite_budget=None, sprite_registry=None):
         """Initialize tool manager
         
         Args:
             tile_size: Size of tiles in pixels
+            atlas: Optional cached SpriteAtlas
+            sprite_cache: Optional SpriteCache
+            asset_pack: Optional AssetPack
+            sprite_budget: Optional SpriteBudget
+            sprite_registry: Optional SpriteRegistry
         """
-        super().__init__(tile_size, 'tools')
+        super().__init__(
+            tile_size, 'tools', atlas, sprite_cache, asset_pack, sprite_budget, sprite_registry
+        )
         self._load_tools()
     
     def _load_tools(self):
-        """Load or generate all tool sprites"""
+        """Register all tool sprites (loaded on first use)"""
         # Tool icons (for UI and cooldown bar)
         icon_size = max(12, self.tile_size // 2)
         
         # Load actual tool assets
-        self.sprites['hand_hoe'] = self._load_or_generate(
+        self._add_sprite(
             'hand_hoe',
             self._generate_hoe,
             size=(icon_size, icon_size)
         )
-        self.sprites['scythe'] = self._load_or_generate(
+        self._add_sprite(
             'scythe',
             self._generate_scythe,
             size=(icon_size, icon_size)
         )
-        self.sprites['chainsaw'] = self._load_or_generate(
+        self._add_sprite(
             'chainsaw',
             self._generate_chainsaw,
             size=(icon_size, icon_size)
         )
-        self.sprites['aerosol'] = self._load_or_generate(
+        self._add_sprite(
             'aerosol',
             self._generate_aerosol,
             size=(icon_size, icon_size)
         )
-        self.sprites['shears'] = self._load_or_generate(
+        self._add_sprite(
             'shears',
             self._generate_shears,
             size=(icon_size, icon_size)
         )
         
         # Future tools - ready to enable
-        # self.sprites['hoe'] = self._load_or_generate(
+        # self._add_sprite(
         #     'hoe',
         #     self._generate_hoe,
         #     size=(icon_size, icon_size)
         # )
-        # self.sprites['watering_can'] = self._load_or_generate(
+        # self._add_sprite(
         #     'watering_can',
         #     self._generate_watering_can,
         #     size=(icon_size, icon_size)
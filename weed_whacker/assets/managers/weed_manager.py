@@ -9,31 +9,42 @@ from .base_asset_manager import BaseAssetManager
 class WeedManager(BaseAssetManager):
     """Manages weed sprites (basic, thistle, dandelion, etc. with variations)"""
     
-    def __init__(self, tile_size):
+    def __init__(self, tile_size, atlas=None, sprite_cache=None, asset_pack=None,
+                 sprite_budget=None, sprite_registry=None):
         """Initialize weed manager
         
         Args:
             tile_size: Size of tiles in pixels
+            atlas: Optional cached SpriteAtlas
+            sprite_cache: Optional SpriteCache
+            asset_pack: Optional AssetPack
+            sprite_budget: Optional SpriteBudget
+            sprite_registry: Optional SpriteRegistry
         """
-        super().__init__(tile_size, 'weeds')
+        super().__init__(
+            tile_size, 'weeds', atlas, sprite_cache, asset_pack, sprite_budget, sprite_registry
+        )
         self._load_weeds()
     
     def _load_weeds(self):
-        """Load or generate all weed sprites"""
+        """Register all weed sprites (loaded on first use)"""
         # Basic weed (current default)
-        self.sprites['weed_basic'] = self._load_or_generate(
+        self._add_sprite(
             'weed_basic',
-            lambda: self._generate_weed('basic', 0)
+            self._generate_weed,
+            args=('basic', 0)
         )
         
         # Future weed types - commented out for now, ready to enable
-        # self.sprites['weed_thistle'] = self._load_or_generate(
+        # self._add_sprite(
         #     'weed_thistle',
-        #     lambda: self._generate_weed('thistle', 0)
+        #     self._generate_weed,
+        #     args=('thistle', 0)
         # )
-        # self.sprites['weed_dandelion'] = self._load_or_generate(
+        # self._add_sprite(
         #     'weed_dandelion',
-        #     lambda: self._generate_weed('dandelion', 0)
+        #     self._generate_weed,
+        #     args=('dandelion', 0)
         # )
     
     def _generate_weed(self, weed_type, variation=0):
@@ -18,6 +18,37 @@ INTERNAL_HEIGHT = VIEWPORT_HEIGHT_TILES * TILE_SIZE
 # Window scale factor (scales up internal resolution for crisp pixels)
 SCALE_FACTOR = 1  # Final window will be INTERNAL_WIDTH * SCALE_FACTOR
 
+# How frames reach the window: 'auto' (direct at scale 1, scale_by for integer
+# scales), 'direct', 'scaled' (pygame.SCALED), 'scale_by' or 'scale'
+DISPLAY_SCALING = 'auto'
+
+# Frame pacing
+# 'adaptive' (throttles when idle, skips unchanged frames), or for measuring:
+# 'sleep' (clock.tick), 'busy' (clock.tick_busy_loop), 'vsync' or 'uncapped'.
+# Override with: python -m weed_whacker.main --pacing MODE
+PACING_MODE = 'adaptive'
+TARGET_FPS = 60                 # Frame rate while the screen is changing
+IDLE_FPS = 10                   # Frame rate once nothing on screen has changed for a while
+IDLE_AFTER_FRAMES = 30          # Unchanged frames before dropping to IDLE_FPS
+UNFOCUSED_FPS = 5               # Frame rate while the window is in the background
+MINIMIZED_FPS = 1               # Simulation rate while minimized (nothing is drawn)
+MAX_SIMULATION_STEP_MS = 100    # Longer frames are simulated in steps of at most this
+
+# Camera
+CAMERA_DEADZONE_TILES = (6, 4)  # Centered box (tiles) the player can move in without scrolling
+CAMERA_SMOOTHING_MS = 120       # Easing time constant, 0 snaps to the player
+GROUND_CHUNK_TILES = 8          # Edge length in tiles of each cached ground surface
+
+# Zoom (+/- keys or mouse wheel); tile sizes in pixels, TILE_SIZE is the starting level
+ZOOM_TILE_SIZES = (128, 64, 32, 16, 8, 4, 2, 1)
+OVERVIEW_MAX_TILE_SIZE = 4      # At or below this, draw one pixel per tile instead of sprites
+
+# Asset loading
+SPRITE_ATLAS_CACHE = True   # Save packed sprite atlas to assets/.cache for faster startup
+SPRITE_DISK_CACHE = True    # Cache scaled and generated sprite pixels in assets/.cache
+USE_ASSET_PACK = True       # Read assets/assets.pak when present (build with tools/build_asset_pack.py)
+SPRITE_MEMORY_BUDGET = 16 * 1024 * 1024  # Bytes of lazily loaded sprites kept resident (None = unlimited)
+
 # Grid settings
 STARTING_GRID_SIZE = 5
 WORLD_GRID_SIZE = 30
@@ -25,6 +56,11 @@ WORLD_GRID_SIZE = 30
 # Player settings
 PLAYER_MOVE_COOLDOWN = 150      # ms
 CHOP_COOLDOWN = 1000            # ms
+AUTO_TARGET = False             # Start with spacebar chops aimed at the nearest weed in CHOP_RANGE (toggle with T)
+CHOP_RANGE = 1                  # Tiles from the player (diagonals included) a click can chop at
+PATH_EXPANSIONS_PER_STEP = 1500 # Click-to-move search work per update; longer searches continue next frame
+REGION_TILES_PER_STEP = 1000    # Bulk-bought tiles handed to pathfinding, helpers and renderers per update
+INPUT_BUFFER_MS = 150           # A move or chop pressed during its cooldown fires if the cooldown ends within this
 
 # Weed spawning
 WEED_SPAWN_INTERVAL = 5000      # ms
@@ -33,3 +69,9 @@ WEED_SPAWN_INTERVAL = 5000      # ms
 INCOME_PER_TILE_PER_SECOND = 0.01  # dollars
 TILE_BASE_COST = 10             # first tile costs this
 TILE_COST_INCREMENT = 1         # each subsequent tile costs this much more
+
+# Helper workers (hire with H)
+WORKER_BASE_COST = 100          # first worker costs this
+WORKER_COST_INCREMENT = 50      # each subsequent worker costs this much more
+WORKER_MOVE_COOLDOWN = 300      # ms between worker steps
+WORKER_TOOL = 'hand_hoe'        # tool new workers are given
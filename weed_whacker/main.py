@@ -2,50 +2,85 @@
 Weed Whacker - Main Entry Point
 """
 
+import argparse
+import time
+
 import pygame
 import sys
 from .src.game_manager import Game
-from .config import INTERNAL_WIDTH, INTERNAL_HEIGHT, SCALE_FACTOR
+from .src.frame_scheduler import FrameScheduler, PACING_MODES
+from .src.input_handler import restrict_events
+from .src.render.display import Display
+from .config import (
+    INTERNAL_WIDTH, INTERNAL_HEIGHT, SCALE_FACTOR, DISPLAY_SCALING, PACING_MODE,
+    TARGET_FPS, IDLE_FPS, IDLE_AFTER_FRAMES, UNFOCUSED_FPS, MINIMIZED_FPS, MAX_SIMULATION_STEP_MS
+)
+
+
+def parse_args(argv=None):
+    """Parse command line options
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Weed Whacker")
+    parser.add_argument('--pacing', choices=PACING_MODES, default=PACING_MODE,
+                        help="How the game loop is paced (default from config.py)")
+    parser.add_argument('--fps', type=int, default=TARGET_FPS,
+                        help="Target frame rate for the adaptive, sleep and busy modes")
+    parser.add_argument('--duration', type=float, default=None,
+                        help="Quit after this many seconds (for benchmark runs)")
+    return parser.parse_args(argv)
 
 
 def main():
     """Initialize Pygame and start the game loop"""
+    args = parse_args()
     pygame.init()
 
-    # Create window with scaled resolution
-    window_width = INTERNAL_WIDTH * SCALE_FACTOR
-    window_height = INTERNAL_HEIGHT * SCALE_FACTOR
-    screen = pygame.display.set_mode((window_width, window_height))
+    # Create window with scaled resolution; at scale 1 the game renders straight into it
+    display = Display(INTERNAL_WIDTH, INTERNAL_HEIGHT, SCALE_FACTOR, DISPLAY_SCALING, vsync=args.pacing == 'vsync')
     pygame.display.set_caption("Weed Whacker")
-
-    # Create internal surface for pixel-perfect rendering
-    internal_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    restrict_events()
 
     # Initialize game
     game = Game()
-    clock = pygame.time.Clock()
+    game.picker.set_pointer_scale(display.pointer_scale)
+    scheduler = FrameScheduler(
+        args.fps, IDLE_FPS, UNFOCUSED_FPS, MINIMIZED_FPS, IDLE_AFTER_FRAMES, MAX_SIMULATION_STEP_MS, args.pacing
+    )
+    end_time = time.perf_counter() + args.duration if args.duration else None
 
     # Main game loop
     running = True
     while running:
-        dt = clock.tick(60)  # 60 FPS, returns milliseconds since last frame
-
-        # Handle events
-        for event in pygame.event.get():
+        # Sleep until the next frame is due or input arrives
+        for event in scheduler.wait():
             if event.type == pygame.QUIT:
                 running = False
             game.handle_event(event)
 
-        # Update game state
-        game.update(dt)
+        # Update game state by the real elapsed time
+        for step in scheduler.simulation_steps():
+            game.update(step)
+
+        # Only draw frames that differ from the one on screen
+        if scheduler.should_render(game.get_frame_key()):
+            # Render at internal resolution
+            game.render(display.surface)
 
-        # Render to internal surface
-        game.render(internal_surface)
+            # Scale up to window (if needed) and show
+            display.present()
 
-        # Scale up to window
-        pygame.transform.scale(internal_surface, (window_width, window_height), screen)
-        pygame.display.flip()
+        if end_time is not None and time.perf_counter() >= end_time:
+            running = False
 
+    # Achieved frame rate and jitter, to tell rendering cost from pacing artifacts
+    print(scheduler.report())
+    print(game.input.report())
     pygame.quit()
     sys.exit()
 
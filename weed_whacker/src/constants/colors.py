@@ -39,3 +39,7 @@ BAR_BG_DARK = (40, 40, 40)
 # Highlights
 HIGHLIGHT_ACTIVE = (255, 255, 100)
 HIGHLIGHT_INACTIVE = (150, 150, 80)
+OVERVIEW_PLAYER_MARKER = (255, 255, 100)
+TARGET_FILL = (255, 255, 100, 60)
+TARGET_BORDER = (255, 255, 100)
+WEED_ARROW = (255, 200, 60)
@@ -0,0 +1,273 @@
+"""
+Weed Whacker - Frame Scheduler
+Decides how often the main loop runs and whether a frame needs drawing.
+"""
+
+import math
+import time
+
+import pygame # type: ignore
+
+# How the main loop waits for the next frame
+PACING_MODES = ('adaptive', 'sleep', 'busy', 'vsync', 'uncapped')
+
+
+class FrameStats:
+    """Running frame time statistics, kept in constant memory"""
+
+    def __init__(self):
+        """Initialize frame stats"""
+        self.frames = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.shortest = math.inf
+        self.longest = 0.0
+
+    def add(self, frame_time):
+        """Record one frame
+
+        Args:
+            frame_time: Seconds since the previous frame
+        """
+        # Welford's online mean and variance
+        self.frames += 1
+        self.total += frame_time
+        delta = frame_time - self.mean
+        self.mean += delta / self.frames
+        self._m2 += delta * (frame_time - self.mean)
+        self.shortest = min(self.shortest, frame_time)
+        self.longest = max(self.longest, frame_time)
+
+    @property
+    def fps(self):
+        """Average frames per second"""
+        return self.frames / self.total if self.total > 0 else 0.0
+
+    @property
+    def jitter(self):
+        """Standard deviation of the frame time in seconds"""
+        return math.sqrt(self._m2 / self.frames) if self.frames > 1 else 0.0
+
+    def report(self, label):
+        """Format the stats as one line
+
+        Args:
+            label: Name shown at the start of the line
+
+        Returns:
+            Summary string
+        """
+        if not self.frames:
+            return f"{label}: no frames"
+        return (
+            f"{label}: {self.frames} frames in {self.total:.1f}s, {self.fps:.2f} FPS, "
+            f"frame time {self.mean * 1000:.2f}ms ± {self.jitter * 1000:.2f}ms jitter "
+            f"(min {self.shortest * 1000:.2f}ms, max {self.longest * 1000:.2f}ms)"
+        )
+
+
+class FrameScheduler:
+    """Frame pacing for the main loop
+
+    Runs at the target rate while something on screen changes. It drops to
+    idle_fps after idle_after_frames unchanged frames, to unfocused_fps in
+    the background, and to minimized_fps (without drawing) while minimized.
+    Between frames it sleeps in pygame.event.wait, so input wakes the loop
+    straight away instead of waiting out a slow frame. The simulation is
+    advanced by the real elapsed time, split into steps of at most
+    max_step_ms, so it stays time-accurate at any rate.
+
+    That is the 'adaptive' mode. The other PACING_MODES draw every frame at
+    a fixed pace, for measuring throughput and frame timing:
+        sleep: clock.tick(target_fps), sleeping between frames
+        busy: clock.tick_busy_loop(target_fps), spinning for precise timing
+        vsync: no wait of its own; the display's vsync flip sets the pace
+        uncapped: no wait at all
+    """
+
+    def __init__(self, target_fps=60, idle_fps=10, unfocused_fps=5, minimized_fps=1,
+                 idle_after_frames=30, max_step_ms=100, mode='adaptive'):
+        """Initialize frame scheduler
+
+        Args:
+            target_fps: Frame rate while the screen is changing
+            idle_fps: Frame rate once the screen has stopped changing
+            unfocused_fps: Frame rate while the window doesn't have focus
+            minimized_fps: Simulation rate while the window is minimized
+            idle_after_frames: Unchanged frames before dropping to idle_fps
+            max_step_ms: Longest single simulation step in milliseconds
+            mode: One of PACING_MODES
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in PACING_MODES:
+            raise ValueError(f"Unknown pacing mode: {mode}")
+        self.mode = mode
+        self.target_fps = target_fps
+        self.idle_fps = idle_fps
+        self.unfocused_fps = unfocused_fps
+        self.minimized_fps = minimized_fps
+        self.idle_after_frames = idle_after_frames
+        self.max_step_ms = max_step_ms
+
+        self.focused = True
+        self.minimized = False
+        self.clean_frames = 0
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self._force_redraw = True
+        self._last_frame_key = None
+        self.stats = FrameStats()
+        self._clock = pygame.time.Clock()
+        self._last_frame = time.perf_counter()
+        self._last_step = self._last_frame
+
+    @property
+    def frame_interval(self):
+        """Seconds between frames at the current rate"""
+        if self.minimized:
+            fps = self.minimized_fps
+        elif not self.focused:
+            fps = self.unfocused_fps
+        elif self.clean_frames >= self.idle_after_frames:
+            fps = self.idle_fps
+        else:
+            fps = self.target_fps
+        return 1.0 / fps
+
+    def handle_event(self, event):
+        """Track window focus and visibility
+
+        Args:
+            event: Pygame event
+        """
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+            self.minimized = False
+            self._force_redraw = True
+        elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            self._force_redraw = True
+
+        # Any input brings the loop back to full rate
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                          pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.WINDOWFOCUSGAINED):
+            self.clean_frames = 0
+
+    def wait(self):
+        """Sleep until the next frame is due, waking early on input
+
+        Input arriving during a slow frame ends the wait once a frame at the
+        target rate would be due, which is usually immediately.
+
+        Returns:
+            List of pygame events received, in order
+        """
+        if self.mode != 'adaptive':
+            return self._wait_fixed()
+
+        events = []
+        while True:
+            interval = self.frame_interval
+            if events and not self.minimized:
+                interval = min(interval, 1.0 / self.target_fps)
+            remaining = self._last_frame + interval - time.perf_counter()
+            if remaining <= 0:
+                break
+
+            # A timeout of 0 would wait forever
+            event = pygame.event.wait(max(1, int(remaining * 1000)))
+            received = [] if event.type == pygame.NOEVENT else [event]
+            received.extend(pygame.event.get())
+            for event in received:
+                self.handle_event(event)
+            events.extend(received)
+
+        received = pygame.event.get()
+        for event in received:
+            self.handle_event(event)
+        events.extend(received)
+        self._end_wait()
+        return events
+
+    def _wait_fixed(self):
+        """Wait for the next frame in one of the fixed-pace modes
+
+        Returns:
+            List of pygame events received, in order
+        """
+        if self.mode == 'sleep':
+            self._clock.tick(self.target_fps)
+        elif self.mode == 'busy':
+            self._clock.tick_busy_loop(self.target_fps)
+        events = pygame.event.get()
+        for event in events:
+            self.handle_event(event)
+        self._end_wait()
+        return events
+
+    def _end_wait(self):
+        """Start the next frame and record how long the last one took"""
+        now = time.perf_counter()
+        self.stats.add(now - self._last_frame)
+        self._last_frame = now
+
+    def simulation_steps(self):
+        """Split the time since the last call into simulation steps
+
+        Returns:
+            List of step lengths in milliseconds, summing to the elapsed time
+        """
+        now = time.perf_counter()
+        elapsed = (now - self._last_step) * 1000
+        self._last_step = now
+
+        steps = []
+        while elapsed > self.max_step_ms:
+            steps.append(self.max_step_ms)
+            elapsed -= self.max_step_ms
+        steps.append(elapsed)
+        return steps
+
+    def should_render(self, frame_key):
+        """Check whether the frame differs from the last one drawn
+
+        Args:
+            frame_key: Hashable summary of everything the frame shows
+
+        Returns:
+            True if the frame should be rendered and presented
+        """
+        if self.mode != 'adaptive':
+            # Fixed-pace modes measure the full frame every time
+            self.frames_rendered += 1
+            return True
+        if self.minimized:
+            self.frames_skipped += 1
+            return False
+        if self._force_redraw or frame_key != self._last_frame_key:
+            self._force_redraw = False
+            self._last_frame_key = frame_key
+            self.clean_frames = 0
+            self.frames_rendered += 1
+            return True
+        self.clean_frames += 1
+        self.frames_skipped += 1
+        return False
+
+    def report(self):
+        """Summarize achieved frame rate and jitter
+
+        Returns:
+            Multi-line summary string
+        """
+        lines = [self.stats.report(f"Frame pacing ({self.mode})")]
+        if self.mode == 'adaptive':
+            lines.append(f"Rendered {self.frames_rendered} frames, skipped {self.frames_skipped} unchanged frames")
+        return "\n".join(lines)
@@ -0,0 +1,128 @@
+"""
+Weed Whacker - Follow Camera
+Keeps the player in view with a deadzone and smoothing, clamped to the plot.
+"""
+
+import math
+
+
+class Camera:
+    """Scrolling camera following a target point in world pixels"""
+
+    def __init__(self, view_width, view_height, tile_size, deadzone_tiles=(6, 4), smoothing_ms=120):
+        """Initialize camera
+
+        Args:
+            view_width: Viewport width in pixels
+            view_height: Viewport height in pixels
+            tile_size: Size of tiles in pixels
+            deadzone_tiles: (width, height) in tiles of the centered box the
+                target can move in without scrolling
+            smoothing_ms: Time constant for easing towards the target (0 snaps)
+        """
+        self.view_width = view_width
+        self.view_height = view_height
+        self.tile_size = tile_size
+        self.deadzone_tiles = deadzone_tiles
+        self.smoothing_ms = smoothing_ms
+
+        # Where the camera is easing towards, and where it is now (floats)
+        self.target_x = 0.0
+        self.target_y = 0.0
+        self.x = 0.0
+        self.y = 0.0
+        self.offset = (0, 0)
+
+    def snap(self, focus_x, focus_y, bounds):
+        """Jump straight to the target without easing
+
+        Args:
+            focus_x, focus_y: Point to follow, in world pixels
+            bounds: (min_x, min_y, max_x, max_y) owned tile bounds, inclusive
+        """
+        self.target_x = focus_x - self.view_width / 2
+        self.target_y = focus_y - self.view_height / 2
+        self._clamp_target(bounds)
+        self.x, self.y = self.target_x, self.target_y
+        self.offset = (round(self.x), round(self.y))
+
+    def update(self, dt, focus_x, focus_y, bounds):
+        """Move the camera towards the focus point
+
+        Args:
+            dt: Delta time in milliseconds
+            focus_x, focus_y: Point to follow, in world pixels
+            bounds: (min_x, min_y, max_x, max_y) owned tile bounds, inclusive
+        """
+        # Only scroll once the focus leaves the deadzone around the view center
+        half_zone_w = self.deadzone_tiles[0] * self.tile_size / 2
+        half_zone_h = self.deadzone_tiles[1] * self.tile_size / 2
+        center_x = self.target_x + self.view_width / 2
+        center_y = self.target_y + self.view_height / 2
+        if focus_x < center_x - half_zone_w:
+            self.target_x += focus_x - (center_x - half_zone_w)
+        elif focus_x > center_x + half_zone_w:
+            self.target_x += focus_x - (center_x + half_zone_w)
+        if focus_y < center_y - half_zone_h:
+            self.target_y += focus_y - (center_y - half_zone_h)
+        elif focus_y > center_y + half_zone_h:
+            self.target_y += focus_y - (center_y + half_zone_h)
+        self._clamp_target(bounds)
+
+        # Frame-rate independent exponential easing
+        if self.smoothing_ms > 0:
+            blend = 1 - math.exp(-dt / self.smoothing_ms)
+        else:
+            blend = 1
+        self.x += (self.target_x - self.x) * blend
+        self.y += (self.target_y - self.y) * blend
+        if abs(self.target_x - self.x) < 0.5:
+            self.x = self.target_x
+        if abs(self.target_y - self.y) < 0.5:
+            self.y = self.target_y
+        self.offset = (round(self.x), round(self.y))
+
+    def set_tile_size(self, tile_size):
+        """Switch zoom level, keeping the same world point at the view center
+
+        Args:
+            tile_size: New size of tiles in pixels
+        """
+        ratio = tile_size / self.tile_size
+        half_w = self.view_width / 2
+        half_h = self.view_height / 2
+        self.x = (self.x + half_w) * ratio - half_w
+        self.y = (self.y + half_h) * ratio - half_h
+        self.target_x = (self.target_x + half_w) * ratio - half_w
+        self.target_y = (self.target_y + half_h) * ratio - half_h
+        self.tile_size = tile_size
+        self.offset = (round(self.x), round(self.y))
+
+    def is_moving(self):
+        """Check if the camera is still easing towards its target"""
+        return self.x != self.target_x or self.y != self.target_y
+
+    def _clamp_target(self, bounds):
+        """Keep the view inside the owned region plus its purchasable border
+
+        Regions smaller than the view are centered instead.
+
+        Args:
+            bounds: (min_x, min_y, max_x, max_y) owned tile bounds, inclusive
+        """
+        if bounds is None:
+            return
+        min_x, min_y, max_x, max_y = bounds
+        # One tile of margin shows the purchasable ring around the plot
+        left = (min_x - 1) * self.tile_size
+        top = (min_y - 1) * self.tile_size
+        right = (max_x + 2) * self.tile_size
+        bottom = (max_y + 2) * self.tile_size
+        self.target_x = self._clamp_axis(self.target_x, left, right, self.view_width)
+        self.target_y = self._clamp_axis(self.target_y, top, bottom, self.view_height)
+
+    @staticmethod
+    def _clamp_axis(position, low, high, view_size):
+        if high - low <= view_size:
+            return (low + high - view_size) / 2
+        return min(max(position, low), high - view_size)
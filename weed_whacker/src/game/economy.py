@@ -2,13 +2,17 @@
 Weed Whacker - Income, Money, and Purchasing System
 """
 
+import math
+from collections import deque
+
 from .grid import TileType
 
 
 class Economy:
     """Manages money, income, and tile purchasing"""
 
-    def __init__(self, grid, income_per_tile, base_cost, cost_increment):
+    def __init__(self, grid, income_per_tile, base_cost, cost_increment,
+                 worker_base_cost=100, worker_cost_increment=50):
         """Initialize economy system
 
         Args:
@@ -16,6 +20,8 @@ class Economy:
             income_per_tile: Income per grass tile per second
             base_cost: Base cost for first additional tile
             cost_increment: Cost increase per tile purchased
+            worker_base_cost: Cost of the first helper worker
+            worker_cost_increment: Cost increase per worker hired
         """
         self.grid = grid
         self.money = 0.0
@@ -23,6 +29,9 @@ class Economy:
         self.base_cost = base_cost
         self.cost_increment = cost_increment
         self.tiles_purchased = 0  # Number of tiles beyond starting plot
+        self.worker_base_cost = worker_base_cost
+        self.worker_cost_increment = worker_cost_increment
+        self.workers_hired = 0
 
     def update(self, dt):
         """Update income accumulation
@@ -30,7 +39,7 @@ class Economy:
         Args:
             dt: Delta time in milliseconds
         """
-        # Calculate income per frame
+        # Calculate income per frame; the grid keeps its tile counts current
         grass_count = self.grid.count_tiles_by_type(TileType.GRASS)
         income_per_ms = (grass_count * self.income_per_tile) / 1000.0
         self.money += income_per_ms * dt
@@ -94,8 +103,164 @@ class Economy:
         self.money -= cost
         self.tiles_purchased += 1
         tile.tile_type = TileType.GRASS
+        self.grid.mark_changed(x, y)
         return True
 
+    def get_next_worker_cost(self):
+        """Calculate cost of hiring the next helper worker
+
+        Returns:
+            Cost in dollars
+        """
+        return self.worker_base_cost + (self.workers_hired * self.worker_cost_increment)
+
+    def try_hire_worker(self):
+        """Attempt to pay for a helper worker
+
+        Returns:
+            True if the worker was paid for
+        """
+        cost = self.get_next_worker_cost()
+        if self.money < cost:
+            return False
+        self.money -= cost
+        self.workers_hired += 1
+        return True
+
+    def get_bulk_cost(self, count):
+        """Calculate the total cost of buying the next count tiles
+
+        Prices rise by cost_increment per tile, so the total is an
+        arithmetic series.
+
+        Args:
+            count: Number of tiles
+
+        Returns:
+            Cost in dollars
+        """
+        return count * self.get_next_tile_cost() + count * (count - 1) // 2 * self.cost_increment
+
+    def get_max_affordable_tiles(self, money=None):
+        """Calculate how many tiles the money buys at rising prices
+
+        Solves get_bulk_cost(n) <= money for the largest n with the
+        quadratic formula instead of adding up prices one by one.
+
+        Args:
+            money: Budget in dollars, defaults to the current money
+
+        Returns:
+            Number of tiles
+        """
+        if money is None:
+            money = self.money
+        first = self.get_next_tile_cost()
+        increment = self.cost_increment
+        if money < first:
+            return 0
+        if increment <= 0:
+            if first <= 0:
+                return 0
+            count = int(money // first)
+        else:
+            # increment / 2 * n^2 + (first - increment / 2) * n - money <= 0
+            b = first - increment / 2
+            count = int((-b + math.sqrt(b * b + 2 * increment * money)) / increment)
+        # Floating point can land one off either side of the exact answer
+        if self.get_bulk_cost(count) > money:
+            count -= 1
+        elif self.get_bulk_cost(count + 1) <= money:
+            count += 1
+        return count
+
+    def get_connected_purchase_order(self, tiles):
+        """Order candidate tiles so each touches owned land or an earlier one
+
+        One flood pass from the candidates already on the frontier through
+        the other candidates. Candidates it doesn't reach aren't connected
+        to owned land and are left out. Any prefix of the result is a
+        valid purchase on its own.
+
+        Args:
+            tiles: (x, y) candidates, in order of preference
+
+        Returns:
+            List of purchasable (x, y) tiles
+        """
+        size = self.grid.world_size
+        rows = self.grid.tiles
+        frontier = self.grid.frontier
+        # Flat marks with a one-tile border, so neighbours need no bounds checks
+        stride = size + 2
+        CANDIDATE, REACHED = 1, 2
+        marks = bytearray(stride * stride)
+        seeds = []
+        for x, y in tiles:
+            if 0 <= x < size and 0 <= y < size and rows[y][x].tile_type is TileType.UNOWNED:
+                index = (y + 1) * stride + x + 1
+                if marks[index]:
+                    continue
+                if (x, y) in frontier:
+                    marks[index] = REACHED
+                    seeds.append(index)
+                else:
+                    marks[index] = CANDIDATE
+
+        queue = deque(seeds)
+        order = []
+        while queue:
+            index = queue.popleft()
+            order.append(index)
+            for neighbor in (index - stride, index + stride, index - 1, index + 1):
+                if marks[neighbor] == CANDIDATE:
+                    marks[neighbor] = REACHED
+                    queue.append(neighbor)
+        return [(index % stride - 1, index // stride - 1) for index in order]
+
+    def get_rectangle_tiles(self, x1, y1, x2, y2):
+        """Get the unowned tiles in a rectangle
+
+        Args:
+            x1, y1: One corner in tile coordinates
+            x2, y2: The opposite corner, inclusive
+
+        Returns:
+            List of (x, y) tiles, row by row
+        """
+        last = self.grid.world_size - 1
+        left, right = max(0, min(x1, x2)), min(last, max(x1, x2))
+        top, bottom = max(0, min(y1, y2)), min(last, max(y1, y2))
+        return [
+            (x, y)
+            for y in range(top, bottom + 1)
+            for x in range(left, right + 1)
+            if self.grid.tiles[y][x].tile_type == TileType.UNOWNED
+        ]
+
+    def try_purchase_region(self, tiles):
+        """Buy as many of the tiles as the money allows, in one payment
+
+        Args:
+            tiles: (x, y) candidates, in order of preference; tiles that
+                are owned or not connected to owned land are skipped
+
+        Returns:
+            List of the (x, y) tiles bought
+        """
+        order = self.get_connected_purchase_order(tiles)
+        count = min(len(order), self.get_max_affordable_tiles())
+        if count == 0:
+            return []
+
+        self.money -= self.get_bulk_cost(count)
+        self.tiles_purchased += count
+        bought = order[:count]
+        for x, y in bought:
+            self.grid.tiles[y][x].tile_type = TileType.GRASS
+        self.grid.mark_region_changed(bought)
+        return bought
+
     def _is_adjacent_to_owned(self, x, y):
         """Check if a tile is adjacent to an owned tile
 
@@ -119,6 +284,4 @@ class Economy:
         Returns:
             Number of grass and weed tiles
         """
-        grass = self.grid.count_tiles_by_type(TileType.GRASS)
-        weeds = self.grid.count_tiles_by_type(TileType.WEED)
-        return grass + weeds
+        return self.grid.count_owned_tiles()
@@ -2,8 +2,12 @@
 Weed Whacker - Grid and Tile Management
 """
 
+import random
+from collections import deque
 from enum import Enum
 
+from .weed_index import WeedIndex
+
 
 class TileType(Enum):
     """Types of tiles in the game"""
@@ -12,6 +16,12 @@ class TileType(Enum):
     UNOWNED = "unowned"  # Not part of the plot
 
 
+# Values in Grid.tile_codes; weed tiles get a code per weed sprite from CODE_FIRST_WEED up
+CODE_UNOWNED = 0
+CODE_GRASS = 1
+CODE_FIRST_WEED = 2
+
+
 class Tile:
     """Represents a single tile in the grid"""
 
@@ -44,6 +54,24 @@ class Grid:
         """
         self.world_size = world_size
         self.tiles = [[Tile() for _ in range(world_size)] for _ in range(world_size)]
+        
+        # (min_x, min_y, max_x, max_y) of owned tiles, inclusive
+        self.owned_bounds = None
+        # (callback, region_callback) pairs notified by mark_changed and mark_region_changed
+        self._change_listeners = []
+        # Bumped by every change notification, so views can tell the grid changed at all
+        self.revision = 0
+        # Spatial index of WEED tiles, kept current by mark_changed
+        self.weeds = WeedIndex(world_size)
+        # Unowned (x, y) tiles next to owned land, kept current by mark_changed
+        self.frontier = set()
+        # Tiles from mark_region_changed not yet handed to listeners
+        self._pending_changes = deque()
+        # One byte per tile, row by row, and tiles per TileType, both kept
+        # current by mark_changed so nothing has to scan the tiles
+        self.tile_codes = bytearray(world_size * world_size)
+        self.weed_codes = {}  # weed sprite name (None if untyped) -> tile code
+        self.tile_counts = {TileType.UNOWNED: world_size * world_size, TileType.GRASS: 0, TileType.WEED: 0}
 
         # Initialize starting plot in the center
         self._initialize_starting_plot(starting_size)
@@ -56,6 +84,174 @@ class Grid:
         for y in range(start, start + size):
             for x in range(start, start + size):
                 self.tiles[y][x].tile_type = TileType.GRASS
+        self.owned_bounds = (start, start, start + size - 1, start + size - 1)
+        for y in range(start, start + size):
+            for x in range(start, start + size):
+                self._record_tile(x, y, self.tiles[y][x])
+                self._extend_frontier(x, y)
+
+    def add_change_listener(self, callback, region_callback=None):
+        """Register a callable notified whenever a tile changes
+
+        Args:
+            callback: Function taking (x, y) tile coordinates
+            region_callback: Optional function taking a list of (x, y) tiles
+                that changed together; without one, callback is called per tile
+        """
+        self._change_listeners.append((callback, region_callback))
+
+    def mark_changed(self, x, y):
+        """Record that a tile's type or weed changed
+
+        Call after modifying a tile so caches built from the grid stay valid.
+
+        Args:
+            x, y: Tile coordinates
+        """
+        tile = self.tiles[y][x]
+        self._record_tile(x, y, tile)
+        if tile.tile_type == TileType.WEED:
+            self.weeds.add(x, y)
+        else:
+            self.weeds.discard(x, y)
+        if tile.is_owned():
+            if (x, y) in self.frontier:
+                self._extend_frontier(x, y)
+            self._grow_owned_bounds(x, y, x, y)
+        self.revision += 1
+        for callback, _ in self._change_listeners:
+            callback(x, y)
+
+    def mark_region_changed(self, tiles):
+        """Record that many tiles changed at once, such as a bulk purchase
+
+        The grid's own indexes (weeds, frontier, owned bounds) are updated
+        straight away. Listeners hear about the tiles later, in slices from
+        flush_changes, each slice as one list so they can do their
+        expensive work (flushing caches, relaxing distances) once per slice
+        instead of once per tile, and a huge region is spread over frames.
+        Listener updates must therefore not mind hearing about a tile that
+        mark_changed has already reported.
+
+        Args:
+            tiles: List of (x, y) tile coordinates
+        """
+        if not tiles:
+            return
+        rows = self.tiles
+        weeds = self.weeds
+        record_tile = self._record_tile
+        owned_xs = []
+        owned_ys = []
+        for x, y in tiles:
+            tile = rows[y][x]
+            record_tile(x, y, tile)
+            tile_type = tile.tile_type
+            if tile_type is TileType.WEED:
+                weeds.add(x, y)
+            elif weeds.count:
+                weeds.discard(x, y)
+            if tile_type is not TileType.UNOWNED:
+                # Bought together, so it may be owned without being on the frontier
+                self._extend_frontier(x, y)
+                owned_xs.append(x)
+                owned_ys.append(y)
+        if owned_xs:
+            self._grow_owned_bounds(min(owned_xs), min(owned_ys), max(owned_xs), max(owned_ys))
+        self.revision += 1
+        self._pending_changes.extend(tiles)
+
+    @property
+    def pending_changes(self):
+        """Number of region tiles listeners haven't been told about yet"""
+        return len(self._pending_changes)
+
+    def flush_changes(self, max_tiles=None):
+        """Hand pending region tiles to the listeners
+
+        Args:
+            max_tiles: Most tiles to deliver, or None for all of them
+
+        Returns:
+            True if tiles are still pending afterwards
+        """
+        pending = self._pending_changes
+        if not pending:
+            return False
+        count = len(pending) if max_tiles is None else min(max_tiles, len(pending))
+        tiles = [pending.popleft() for _ in range(count)]
+        self.revision += 1
+        for callback, region_callback in self._change_listeners:
+            if region_callback is not None:
+                region_callback(tiles)
+            else:
+                for x, y in tiles:
+                    callback(x, y)
+        return bool(pending)
+
+    def _record_tile(self, x, y, tile):
+        """Update tile_codes and tile_counts for a tile's current state
+
+        Args:
+            x, y: Tile coordinates
+            tile: The tile at those coordinates
+        """
+        tile_type = tile.tile_type
+        if tile_type is TileType.UNOWNED:
+            code = CODE_UNOWNED
+        elif tile_type is TileType.GRASS:
+            code = CODE_GRASS
+        else:
+            weed = tile.weed_type
+            weed_name = weed.sprite_name if weed else None
+            code = self.weed_codes.get(weed_name)
+            if code is None:
+                code = self.weed_codes[weed_name] = CODE_FIRST_WEED + len(self.weed_codes)
+        index = y * self.world_size + x
+        old_code = self.tile_codes[index]
+        if old_code == code:
+            return
+        self.tile_codes[index] = code
+        if old_code == CODE_UNOWNED:
+            self.tile_counts[TileType.UNOWNED] -= 1
+        elif old_code == CODE_GRASS:
+            self.tile_counts[TileType.GRASS] -= 1
+        else:
+            self.tile_counts[TileType.WEED] -= 1
+        self.tile_counts[tile_type] += 1
+
+    def _grow_owned_bounds(self, min_x, min_y, max_x, max_y):
+        """Widen owned_bounds to cover a rectangle of owned tiles
+
+        Args:
+            min_x, min_y, max_x, max_y: Inclusive tile rectangle
+        """
+        if self.owned_bounds is None:
+            self.owned_bounds = (min_x, min_y, max_x, max_y)
+        else:
+            old_min_x, old_min_y, old_max_x, old_max_y = self.owned_bounds
+            self.owned_bounds = (
+                min(old_min_x, min_x), min(old_min_y, min_y), max(old_max_x, max_x), max(old_max_y, max_y)
+            )
+
+    def _extend_frontier(self, x, y):
+        """Move a newly owned tile out of the frontier and its unowned neighbours in
+
+        Args:
+            x, y: Coordinates of an owned tile
+        """
+        frontier = self.frontier
+        tiles = self.tiles
+        last = self.world_size - 1
+        frontier.discard((x, y))
+        if y > 0 and tiles[y - 1][x].tile_type is TileType.UNOWNED:
+            frontier.add((x, y - 1))
+        if y < last and tiles[y + 1][x].tile_type is TileType.UNOWNED:
+            frontier.add((x, y + 1))
+        if x > 0 and tiles[y][x - 1].tile_type is TileType.UNOWNED:
+            frontier.add((x - 1, y))
+        if x < last and tiles[y][x + 1].tile_type is TileType.UNOWNED:
+            frontier.add((x + 1, y))
 
     def get_tile(self, x, y):
         """Get tile at position
@@ -70,6 +266,30 @@ class Grid:
             return self.tiles[y][x]
         return None
 
+    def nearest_weed(self, x, y, max_distance=None):
+        """Find the weed closest to a tile
+
+        Args:
+            x, y: Tile coordinates to search from
+            max_distance: Optional furthest straight-line distance in tiles
+
+        Returns:
+            (x, y) of the nearest WEED tile, or None
+        """
+        return self.weeds.nearest(x, y, max_distance)
+
+    def weeds_in_radius(self, x, y, radius):
+        """Find the weeds within a square around a tile
+
+        Args:
+            x, y: Tile coordinates at the center
+            radius: Tiles from the center in each direction, diagonals included
+
+        Returns:
+            List of (x, y) WEED tiles
+        """
+        return self.weeds.in_radius(x, y, radius)
+
     def count_tiles_by_type(self, tile_type):
         """Count how many tiles of a given type exist
 
@@ -77,14 +297,46 @@ class Grid:
             tile_type: TileType to count
 
         Returns:
-            Number of tiles of that type
-        """
-        count = 0
-        for row in self.tiles:
-            for tile in row:
-                if tile.tile_type == tile_type:
-                    count += 1
-        return count
+            Number of tiles of that type, as of the last change notification
+        """
+        return self.tile_counts[tile_type]
+
+    def count_owned_tiles(self):
+        """Count the GRASS and WEED tiles
+
+        Returns:
+            Number of owned tiles
+        """
+        return self.tile_counts[TileType.GRASS] + self.tile_counts[TileType.WEED]
+
+    def random_grass_tile(self, rng=random):
+        """Pick a GRASS tile uniformly at random
+
+        Counts tiles a row at a time in tile_codes instead of listing every
+        GRASS tile, so the cost follows the world's height, not its area.
+
+        Args:
+            rng: Random number generator
+
+        Returns:
+            (x, y) of the tile, or None if there is no GRASS
+        """
+        count = self.tile_counts[TileType.GRASS]
+        if not count:
+            return None
+        remaining = rng.randrange(count)
+        size = self.world_size
+        codes = self.tile_codes
+        for y in range(size):
+            row = codes[y * size:(y + 1) * size]
+            in_row = row.count(CODE_GRASS)
+            if remaining < in_row:
+                x = row.index(CODE_GRASS)
+                for _ in range(remaining):
+                    x = row.index(CODE_GRASS, x + 1)
+                return x, y
+            remaining -= in_row
+        return None
 
     def render(self, surface, tile_size, camera_offset=(0, 0), sprite_manager=None):
         """Render the grid to a surface
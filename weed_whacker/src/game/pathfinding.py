@@ -0,0 +1,374 @@
+"""
+Weed Whacker - Pathfinding
+Shortest walking paths over a walkability bitmap kept in sync with the grid.
+"""
+
+import heapq
+from array import array
+from collections import deque
+
+
+class Pathfinder:
+    """Shortest paths between tiles for click-to-move
+
+    Walkability is kept in a bytearray with a one-tile unwalkable border,
+    so neighbour lookups need no bounds checks. The bitmap listens to grid
+    changes and only clears the cached paths and distance fields when a
+    tile's walkability actually flips (buying a tile); weeds growing and
+    being chopped leave them intact.
+
+    Paths come from A* with a Manhattan heuristic, breaking ties towards
+    the goal, so on open ground it expands little more than the path itself.
+    """
+
+    def __init__(self, grid, max_cached_goals=32):
+        """Initialize pathfinder
+
+        Args:
+            grid: Grid to path over
+            max_cached_goals: Most goals whose paths and distance fields are kept
+        """
+        self.grid = grid
+        self.max_cached_goals = max_cached_goals
+        self.stride = grid.world_size + 2
+        self.walkable = bytearray(self.stride * self.stride)
+        for y in range(grid.world_size):
+            row = grid.tiles[y]
+            base = (y + 1) * self.stride + 1
+            for x in range(grid.world_size):
+                if row[x].is_walkable():
+                    self.walkable[base + x] = 1
+
+        # Bumped whenever the walkable set changes
+        self.revision = 0
+        self._paths = {}            # goal index -> (path, {tile index: position in path})
+        self._distance_fields = {}  # goal -> distance array
+        self._scratch = None        # SearchScratch free for the next search
+        self.searches = 0
+        self.cache_hits = 0
+        grid.add_change_listener(self._on_tile_changed, self._on_region_changed)
+
+    def _on_tile_changed(self, x, y):
+        """Update the bitmap, dropping the caches if walkability changed"""
+        index = (y + 1) * self.stride + x + 1
+        walkable = 1 if self.grid.tiles[y][x].is_walkable() else 0
+        if self.walkable[index] != walkable:
+            self.walkable[index] = walkable
+            self.invalidate()
+
+    def _on_region_changed(self, tiles):
+        """Update the bitmap for many tiles, dropping the caches at most once"""
+        tiles_by_row = self.grid.tiles
+        stride = self.stride
+        changed = False
+        for x, y in tiles:
+            index = (y + 1) * stride + x + 1
+            walkable = 1 if tiles_by_row[y][x].is_walkable() else 0
+            if self.walkable[index] != walkable:
+                self.walkable[index] = walkable
+                changed = True
+        if changed:
+            self.invalidate()
+
+    def invalidate(self):
+        """Drop all cached paths and distance fields"""
+        self._paths.clear()
+        self._distance_fields.clear()
+        self.revision += 1
+
+    def is_walkable(self, x, y):
+        """Check a tile against the bitmap
+
+        Args:
+            x, y: Tile coordinates
+
+        Returns:
+            True if the tile is in the world and walkable
+        """
+        if 0 <= x < self.grid.world_size and 0 <= y < self.grid.world_size:
+            return self.walkable[(y + 1) * self.stride + x + 1] == 1
+        return False
+
+    def find_path(self, start, goal):
+        """Find a shortest 4-directional walking path in one go
+
+        Args:
+            start: (x, y) tile to start from
+            goal: (x, y) tile to reach
+
+        Returns:
+            List of (x, y) tiles to step onto in order (empty if already at
+            goal), or None if the goal can't be reached
+        """
+        search = self.start_search(start, goal)
+        search.step()
+        return search.path
+
+    def start_search(self, start, goal):
+        """Begin a path search that can be spread over several frames
+
+        Cached answers come back already finished: a start that lies on a
+        cached path to the same goal reuses the rest of that path, and a
+        cached distance field for the goal is followed downhill.
+
+        Args:
+            start: (x, y) tile to start from
+            goal: (x, y) tile to reach
+
+        Returns:
+            PathSearch; call step() until done is True, then read path
+        """
+        search = PathSearch(self, start, goal)
+        if not self.is_walkable(*goal) or not self.is_walkable(*start):
+            search.finish(None)
+            return search
+        start_index = self._index(*start)
+        goal_index = self._index(*goal)
+
+        cached = self._paths.get(goal_index)
+        if cached is not None and start_index in cached[1]:
+            self.cache_hits += 1
+            path, positions = cached
+            search.finish(path[positions[start_index] + 1:])
+            return search
+
+        field = self._distance_fields.get(goal)
+        if field is not None:
+            self.cache_hits += 1
+            self._finish_search(search, self._descend(field, start_index))
+            return search
+
+        self.searches += 1
+        search.begin(start_index, goal_index)
+        return search
+
+    def _finish_search(self, search, indices):
+        """Cache a search result and hand its steps to the search
+
+        Args:
+            search: PathSearch to finish
+            indices: Bitmap indices from start to goal inclusive, or None
+        """
+        if indices is None:
+            search.finish(None)
+            return
+        path = [self._position(index) for index in indices]
+        self._remember(self._paths, indices[-1], (path, {index: i for i, index in enumerate(indices)}))
+        search.finish(path[1:])
+
+    def distance_field(self, goal):
+        """Get walking distances from every tile to a goal
+
+        Args:
+            goal: (x, y) tile
+
+        Returns:
+            List indexed like the bitmap ((y + 1) * stride + x + 1) of steps
+            to the goal, -1 where it can't be reached
+        """
+        field = self._distance_fields.get(goal)
+        if field is None:
+            field = [-1] * len(self.walkable)
+            if self.is_walkable(*goal):
+                self._flood(field, [self._index(*goal)])
+            self._remember(self._distance_fields, goal, field)
+        return field
+
+    def _flood(self, field, sources):
+        """Breadth-first fill of walking distances from the source indices"""
+        walkable = self.walkable
+        stride = self.stride
+        queue = deque(sources)
+        for index in sources:
+            field[index] = 0
+        while queue:
+            index = queue.popleft()
+            distance = field[index] + 1
+            for neighbour in (index - stride, index + stride, index - 1, index + 1):
+                if walkable[neighbour] and field[neighbour] < 0:
+                    field[neighbour] = distance
+                    queue.append(neighbour)
+
+    def _descend(self, field, start):
+        """Follow a distance field downhill from start to its goal
+
+        Returns:
+            List of indices from start to goal inclusive, or None
+        """
+        if field[start] < 0:
+            return None
+        stride = self.stride
+        path = [start]
+        index = start
+        while field[index] > 0:
+            target = field[index] - 1
+            for neighbour in (index - stride, index + stride, index - 1, index + 1):
+                if field[neighbour] == target:
+                    index = neighbour
+                    break
+            path.append(index)
+        return path
+
+    def _borrow_scratch(self):
+        """Get working arrays for a search
+
+        The arrays are reused between searches, since allocating them costs
+        several milliseconds on a large world. Searches running side by side
+        get fresh ones.
+
+        Returns:
+            SearchScratch with a new generation
+        """
+        scratch, self._scratch = self._scratch, None
+        if scratch is None:
+            scratch = SearchScratch(len(self.walkable))
+        scratch.generation += 1
+        return scratch
+
+    def _return_scratch(self, scratch):
+        """Keep a finished search's arrays for the next one"""
+        self._scratch = scratch
+
+    def _remember(self, cache, key, value):
+        """Store a cache entry, evicting the oldest beyond max_cached_goals"""
+        cache.pop(key, None)
+        cache[key] = value
+        if len(cache) > self.max_cached_goals:
+            del cache[next(iter(cache))]
+
+    def _index(self, x, y):
+        return (y + 1) * self.stride + x + 1
+
+    def _position(self, index):
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+
+class SearchScratch:
+    """Cost, parent and generation arrays sized to a pathfinder's bitmap
+
+    A cost only counts when its stamp matches the current generation, so a
+    new search starts by bumping the generation instead of clearing costs.
+    """
+
+    def __init__(self, cells):
+        """Initialize search scratch
+
+        Args:
+            cells: Number of bitmap cells
+        """
+        self.costs = array('i', [0]) * cells
+        self.came_from = array('i', [-1]) * cells
+        self.stamps = array('I', [0]) * cells
+        self.generation = 0
+
+
+class PathSearch:
+    """An A* search that can be advanced a slice at a time
+
+    Spreading a long search over several frames keeps each frame within
+    its budget even on winding plots where A* has to explore widely.
+    """
+
+    def __init__(self, pathfinder, start, goal):
+        """Initialize path search
+
+        Args:
+            pathfinder: Pathfinder that owns the bitmap and caches
+            start: (x, y) tile to start from
+            goal: (x, y) tile to reach
+        """
+        self.pathfinder = pathfinder
+        self.start = start
+        self.goal = goal
+        self.done = False
+        self.path = None
+        self.expansions = 0
+        self._goal_index = None
+        self._open = []
+        self._scratch = None
+
+    def begin(self, start_index, goal_index):
+        """Seed the open set; called by Pathfinder.start_search"""
+        stride = self.pathfinder.stride
+        start_y, start_x = divmod(start_index, stride)
+        self._goal_y, self._goal_x = divmod(goal_index, stride)
+        start_h = abs(start_x - self._goal_x) + abs(start_y - self._goal_y)
+        self._goal_index = goal_index
+        # Flat arrays sized to the bitmap: no dict growth pauses on big plots
+        scratch = self._scratch = self.pathfinder._borrow_scratch()
+        scratch.costs[start_index] = 0
+        scratch.came_from[start_index] = -1
+        scratch.stamps[start_index] = scratch.generation
+        # (f, h, index): among equal f, expand the node nearest the goal first
+        self._open.append((start_h, start_h, start_index))
+
+    def finish(self, path):
+        """Mark the search done with its result
+
+        Args:
+            path: List of (x, y) tiles to step onto, or None if unreachable
+        """
+        self.done = True
+        self.path = path
+        self._open = []
+        if self._scratch is not None:
+            self.pathfinder._return_scratch(self._scratch)
+            self._scratch = None
+
+    def cancel(self):
+        """Abandon the search, handing its arrays back to the pathfinder"""
+        if not self.done:
+            self.finish(None)
+
+    def step(self, max_expansions=None):
+        """Expand up to max_expansions nodes
+
+        Args:
+            max_expansions: Node budget for this call, or None to run to the end
+
+        Returns:
+            True once the search is done
+        """
+        if self.done:
+            return True
+        walkable = self.pathfinder.walkable
+        stride = self.pathfinder.stride
+        goal = self._goal_index
+        goal_x, goal_y = self._goal_x, self._goal_y
+        open_heap = self._open
+        costs = self._scratch.costs
+        came_from = self._scratch.came_from
+        stamps = self._scratch.stamps
+        generation = self._scratch.generation
+        budget = max_expansions if max_expansions is not None else -1
+
+        while open_heap:
+            if budget == 0:
+                return False
+            budget -= 1
+            f, h, index = heapq.heappop(open_heap)
+            if index == goal:
+                path = []
+                while index != -1:
+                    path.append(index)
+                    index = came_from[index]
+                path.reverse()
+                self.pathfinder._finish_search(self, path)
+                return True
+            cost = f - h
+            if cost > costs[index]:
+                continue  # Stale entry
+            self.expansions += 1
+            cost += 1
+            for neighbour in (index - stride, index + stride, index - 1, index + 1):
+                if walkable[neighbour] and (stamps[neighbour] != generation or cost < costs[neighbour]):
+                    stamps[neighbour] = generation
+                    costs[neighbour] = cost
+                    came_from[neighbour] = index
+                    y, x = divmod(neighbour, stride)
+                    h = abs(x - goal_x) + abs(y - goal_y)
+                    heapq.heappush(open_heap, (cost + h, h, neighbour))
+
+        self.finish(None)
+        return True
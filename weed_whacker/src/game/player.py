@@ -4,6 +4,49 @@ Weed Whacker - Player Movement and Actions
 
 from .grid import TileType
 
+
+def chop_tiles(grid, tool, center_x, center_y, movement_count):
+    """Damage the weeds in a tool's reach, applying regrowth first
+
+    Shared by the player and helper workers so both follow the same rules.
+
+    Args:
+        grid: Game grid
+        tool: Tool being used
+        center_x, center_y: Tile the tool's reach is centered on
+        movement_count: Player movement count, the clock weeds regrow by
+
+    Returns:
+        True if at least one weed took damage
+    """
+    chopped_any = False
+    for dx, dy in tool.reach:
+        target_x = center_x + dx
+        target_y = center_y + dy
+        tile = grid.get_tile(target_x, target_y)
+        
+        if tile and tile.tile_type == TileType.WEED and tile.weed_type:
+            # Calculate regrowth since last damage
+            if tile.weed_health < tile.weed_type.toughness:
+                movements_since_damage = movement_count - tile.last_movement_count
+                regrowth_amount = movements_since_damage // tile.weed_type.regrow
+                tile.weed_health = min(tile.weed_type.toughness, tile.weed_health + regrowth_amount)
+            
+            # Deal damage based on tool efficiency
+            tile.weed_health -= tool.efficiency
+            tile.last_movement_count = movement_count
+            
+            # Check if weed is destroyed
+            if tile.weed_health <= 0:
+                tile.tile_type = TileType.GRASS
+                tile.weed_type = None
+                tile.weed_health = 0.0
+                grid.mark_changed(target_x, target_y)
+                
+            chopped_any = True
+    return chopped_any
+
+
 class Player:
     """Player character with tile-based movement"""
 
@@ -75,11 +118,12 @@ class Player:
 
         return False
 
-    def try_chop(self, chop_cooldown_time):
+    def try_chop(self, chop_cooldown_time, target=None):
         """Attempt to chop weeds based on current tool's reach
 
         Args:
             chop_cooldown_time: Cooldown duration in ms
+            target: (x, y) tile the reach is centered on; defaults to the player's tile
 
         Returns:
             Tuple of (True if chop was successful (damage dealt to at least one weed), Broken tool key or None)
@@ -91,32 +135,9 @@ class Player:
         from .tools import get_tool
         tool = get_tool(self.current_tool)
         
-        chopped_any = False
+        center_x, center_y = target if target is not None else (self.x, self.y)
+        chopped_any = chop_tiles(self.grid, tool, center_x, center_y, self.movement_count)
         
-        for dx, dy in tool.reach:
-            target_x = self.x + dx
-            target_y = self.y + dy
-            tile = self.grid.get_tile(target_x, target_y)
-            
-            if tile and tile.tile_type == TileType.WEED and tile.weed_type:
-                # Calculate regrowth since last damage
-                if tile.weed_health < tile.weed_type.toughness:
-                    movements_since_damage = self.movement_count - tile.last_movement_count
-                    regrowth_amount = movements_since_damage // tile.weed_type.regrow
-                    tile.weed_health = min(tile.weed_type.toughness, tile.weed_health + regrowth_amount)
-                
-                # Deal damage based on tool efficiency
-                tile.weed_health -= tool.efficiency
-                tile.last_movement_count = self.movement_count
-                
-                # Check if weed is destroyed
-                if tile.weed_health <= 0:
-                    tile.tile_type = TileType.GRASS
-                    tile.weed_type = None
-                    tile.weed_health = 0.0
-                    
-                chopped_any = True
-                
         if chopped_any:
             # Play tool sound if it has one
             if tool.sound_file and hasattr(self, 'asset_manager'):
@@ -140,6 +161,20 @@ class Player:
 
         return False, None
 
+    def get_auto_target(self, chop_range):
+        """Pick the weed nearest the player within chopping range
+
+        Args:
+            chop_range: Tiles from the player (diagonals included) that can be targeted
+
+        Returns:
+            (x, y) of the nearest weed in range, or None
+        """
+        weeds = self.grid.weeds_in_radius(self.x, self.y, chop_range)
+        if not weeds:
+            return None
+        return min(weeds, key=lambda weed: ((weed[0] - self.x) ** 2 + (weed[1] - self.y) ** 2, weed[1], weed[0]))
+
     def get_chop_cooldown_percent(self):
         """Get chop cooldown progress as percentage
 
@@ -0,0 +1,122 @@
+"""
+Weed Whacker - Weed Spatial Index
+Bucket grid over weed tiles for nearest-weed and radius queries.
+"""
+
+
+class WeedIndex:
+    """Weed tile positions bucketed into square cells
+
+    Nearest-weed queries search rings of buckets outwards from the query
+    point and stop once no unsearched bucket can hold anything closer, so
+    they only touch the buckets around the answer instead of the whole
+    world. Radius queries only visit the buckets the square overlaps.
+    """
+
+    def __init__(self, world_size, bucket_size=8):
+        """Initialize weed index
+
+        Args:
+            world_size: Grid width and height in tiles
+            bucket_size: Width and height of a bucket in tiles
+        """
+        self.bucket_size = bucket_size
+        self.columns = (world_size + bucket_size - 1) // bucket_size
+        self.buckets = [None] * (self.columns * self.columns)  # bucket index -> set of (x, y)
+        self.count = 0
+
+    def add(self, x, y):
+        """Record a weed at a tile (no-op if already recorded)"""
+        index = (y // self.bucket_size) * self.columns + x // self.bucket_size
+        bucket = self.buckets[index]
+        if bucket is None:
+            bucket = self.buckets[index] = set()
+        if (x, y) not in bucket:
+            bucket.add((x, y))
+            self.count += 1
+
+    def discard(self, x, y):
+        """Forget a weed at a tile (no-op if not recorded)"""
+        bucket = self.buckets[(y // self.bucket_size) * self.columns + x // self.bucket_size]
+        if bucket is not None and (x, y) in bucket:
+            bucket.remove((x, y))
+            self.count -= 1
+
+    def nearest(self, x, y, max_distance=None):
+        """Find the weed closest to a tile by straight-line distance
+
+        Args:
+            x, y: Tile coordinates to search from
+            max_distance: Optional furthest distance in tiles to consider
+
+        Returns:
+            (x, y) of the nearest weed, or None
+        """
+        if not self.count:
+            return None
+        size = self.bucket_size
+        columns = self.columns
+        center_x = x // size
+        center_y = y // size
+        best = None
+        best_distance = float('inf') if max_distance is None else max_distance * max_distance + 1e-9
+
+        for ring in range(columns):
+            # Anything in this ring is at least this far away along one axis
+            reach = (ring - 1) * size + 1 if ring else 0
+            if reach * reach > best_distance:
+                break
+            for bucket_x, bucket_y in self._ring(center_x, center_y, ring):
+                bucket = self.buckets[bucket_y * columns + bucket_x]
+                if not bucket:
+                    continue
+                for weed_x, weed_y in bucket:
+                    distance = (weed_x - x) ** 2 + (weed_y - y) ** 2
+                    if distance < best_distance:
+                        best_distance = distance
+                        best = (weed_x, weed_y)
+        return best
+
+    def in_radius(self, x, y, radius):
+        """Find all weeds within a square around a tile
+
+        Args:
+            x, y: Tile coordinates at the center
+            radius: Tiles from the center in each direction, diagonals included
+
+        Returns:
+            List of (x, y) weed tiles
+        """
+        if not self.count:
+            return []
+        size = self.bucket_size
+        last = self.columns - 1
+        found = []
+        for bucket_y in range(max(0, (y - radius) // size), min(last, (y + radius) // size) + 1):
+            for bucket_x in range(max(0, (x - radius) // size), min(last, (x + radius) // size) + 1):
+                bucket = self.buckets[bucket_y * self.columns + bucket_x]
+                if not bucket:
+                    continue
+                for weed_x, weed_y in bucket:
+                    if abs(weed_x - x) <= radius and abs(weed_y - y) <= radius:
+                        found.append((weed_x, weed_y))
+        return found
+
+    def _ring(self, center_x, center_y, ring):
+        """Yield the in-bounds bucket coordinates at a Chebyshev ring distance"""
+        last = self.columns - 1
+        if ring == 0:
+            yield center_x, center_y
+            return
+        low_x, high_x = center_x - ring, center_x + ring
+        low_y, high_y = center_y - ring, center_y + ring
+        for bucket_x in range(max(0, low_x), min(last, high_x) + 1):
+            if low_y >= 0:
+                yield bucket_x, low_y
+            if high_y <= last:
+                yield bucket_x, high_y
+        for bucket_y in range(max(0, low_y + 1), min(last, high_y - 1) + 1):
+            if low_x >= 0:
+                yield low_x, bucket_y
+            if high_x <= last:
+                yield high_x, bucket_y
@@ -0,0 +1,324 @@
+"""
+Weed Whacker - Helper Workers
+Hired helpers that walk to the nearest weed and chop it, steering by one
+distance field shared between all of them.
+"""
+
+from array import array
+from collections import deque
+
+from .grid import TileType
+from .player import chop_tiles
+from .tools import get_tool
+
+# Distance of a tile no weed can be reached from
+UNREACHABLE = 0x7fffffff
+
+
+class WeedDistanceField:
+    """Walking distance from every tile to its nearest weed
+
+    A multi-source breadth-first fill from all weeds over the pathfinder's
+    walkability bitmap. Grid changes update it incrementally:
+        weed spawned or tile bought: distances only shrink, so a fill from
+            that tile lowers just the tiles now closer to a weed
+        weed cleared: tiles whose every shortest route led to that weed are
+            invalidated, then refilled from the intact tiles around them
+    Either way the work is bounded by the region whose distances changed,
+    not by the size of the farm or the number of workers.
+    """
+
+    def __init__(self, grid, pathfinder):
+        """Initialize weed distance field
+
+        Create it after the pathfinder, so the pathfinder's bitmap already
+        reflects a tile change when this field hears about it.
+
+        Args:
+            grid: Game grid
+            pathfinder: Pathfinder whose walkability bitmap is shared
+        """
+        self.grid = grid
+        self.walkable = pathfinder.walkable
+        self.stride = pathfinder.stride
+        self.distances = array('i', [UNREACHABLE]) * len(self.walkable)
+        self.sources = set()
+        self.cells_updated = 0
+
+        for bucket in grid.weeds.buckets:
+            for x, y in bucket or ():
+                index = self._index(x, y)
+                self.sources.add(index)
+                self.distances[index] = 0
+        self._lower(list(self.sources))
+        grid.add_change_listener(self._on_tile_changed, self._on_region_changed)
+
+    def distance(self, x, y):
+        """Get the walking distance from a tile to the nearest weed
+
+        Args:
+            x, y: Tile coordinates
+
+        Returns:
+            Number of steps, or UNREACHABLE
+        """
+        return self.distances[self._index(x, y)]
+
+    def next_step(self, x, y, preference=0):
+        """Get the neighbouring tile one step closer to a weed
+
+        Args:
+            x, y: Tile coordinates
+            preference: Which of equally good neighbours to prefer; workers
+                pass different values so they fan out instead of queueing
+
+        Returns:
+            (x, y) of the next tile, or None if on a weed or none is reachable
+        """
+        distances = self.distances
+        index = self._index(x, y)
+        distance = distances[index]
+        if distance == 0 or distance == UNREACHABLE:
+            return None
+        stride = self.stride
+        neighbours = (index - stride, index + 1, index + stride, index - 1)
+        for turn in range(4):
+            neighbour = neighbours[(preference + turn) % 4]
+            if distances[neighbour] == distance - 1:
+                y, x = divmod(neighbour, stride)
+                return x - 1, y - 1
+        return None
+
+    def _on_tile_changed(self, x, y):
+        """Apply a weed spawning, a weed being cleared or a tile being bought"""
+        index = self._index(x, y)
+        is_weed = self.grid.tiles[y][x].tile_type == TileType.WEED
+        if is_weed and index not in self.sources:
+            self.sources.add(index)
+            self.distances[index] = 0
+            self._lower([index])
+        elif not is_weed and index in self.sources:
+            self.sources.discard(index)
+            self._raise(index)
+        elif self.walkable[index] and self.distances[index] == UNREACHABLE:
+            # Newly walkable: it may connect to, and shorten routes to, weeds
+            stride = self.stride
+            closest = min(self.distances[neighbour] for neighbour in (index - stride, index + stride, index - 1, index + 1))
+            if closest != UNREACHABLE:
+                self.distances[index] = closest + 1
+                self._lower([index])
+
+    def _on_region_changed(self, tiles):
+        """Apply many tile changes, lowering distances in one pass
+
+        Cleared weeds are raised one by one first, while the rest of the
+        field is still consistent. New weeds and tiles that became walkable
+        (a bulk purchase) then seed a single fill together.
+        """
+        distances = self.distances
+        walkable = self.walkable
+        stride = self.stride
+        sources = self.sources
+        rows = self.grid.tiles
+        for x, y in tiles:
+            index = self._index(x, y)
+            if index in sources and rows[y][x].tile_type != TileType.WEED:
+                sources.discard(index)
+                self._raise(index)
+
+        seeds = []
+        for x, y in tiles:
+            index = self._index(x, y)
+            if rows[y][x].tile_type == TileType.WEED:
+                if index not in sources:
+                    sources.add(index)
+                    distances[index] = 0
+                    seeds.append(index)
+            elif walkable[index] and distances[index] == UNREACHABLE:
+                closest = min(distances[index - stride], distances[index + stride], distances[index - 1], distances[index + 1])
+                if closest != UNREACHABLE:
+                    distances[index] = closest + 1
+                    seeds.append(index)
+        if seeds:
+            # Nearest seeds first, so most tiles are settled on their first visit
+            seeds.sort(key=distances.__getitem__)
+            self._lower(seeds)
+
+    def _lower(self, seeds):
+        """Spread smaller distances out from tiles whose distance just dropped"""
+        distances = self.distances
+        walkable = self.walkable
+        stride = self.stride
+        queue = deque(seeds)
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            for neighbour in (index - stride, index + stride, index - 1, index + 1):
+                if walkable[neighbour] and distances[neighbour] > distance:
+                    distances[neighbour] = distance
+                    queue.append(neighbour)
+                    self.cells_updated += 1
+
+    def _raise(self, source):
+        """Recompute the tiles that depended on a weed that was cleared"""
+        distances = self.distances
+        stride = self.stride
+
+        # Invalidate in order of distance, so every tile's other supports
+        # one step closer are settled before it is checked
+        distances[source] = UNREACHABLE
+        invalid = [source]
+        queue = deque([(source, 0)])
+        while queue:
+            index, distance = queue.popleft()
+            for neighbour in (index - stride, index + stride, index - 1, index + 1):
+                if distances[neighbour] != distance + 1:
+                    continue
+                supported = False
+                for other in (neighbour - stride, neighbour + stride, neighbour - 1, neighbour + 1):
+                    if distances[other] == distance:
+                        supported = True
+                        break
+                if not supported:
+                    distances[neighbour] = UNREACHABLE
+                    invalid.append(neighbour)
+                    queue.append((neighbour, distance + 1))
+        self.cells_updated += len(invalid)
+
+        # Refill the invalidated region from its intact border. Seeds enter
+        # the breadth-first queue in distance order, so it stays sorted.
+        seeds = []
+        for index in invalid:
+            closest = min(distances[neighbour] for neighbour in (index - stride, index + stride, index - 1, index + 1))
+            if closest != UNREACHABLE:
+                seeds.append((closest + 1, index))
+        seeds.sort()
+        walkable = self.walkable
+        queue = deque()
+        next_seed = 0
+        while queue or next_seed < len(seeds):
+            if next_seed < len(seeds) and (not queue or seeds[next_seed][0] <= distances[queue[0]]):
+                distance, index = seeds[next_seed]
+                next_seed += 1
+                if distance >= distances[index]:
+                    continue
+                distances[index] = distance
+            else:
+                index = queue.popleft()
+            distance = distances[index] + 1
+            for neighbour in (index - stride, index + stride, index - 1, index + 1):
+                if walkable[neighbour] and distances[neighbour] > distance:
+                    distances[neighbour] = distance
+                    queue.append(neighbour)
+
+    def _index(self, x, y):
+        return (y + 1) * self.stride + x + 1
+
+
+class Worker:
+    """A helper that walks to the nearest weed and chops it"""
+
+    def __init__(self, worker_id, x, y, tool_key, move_cooldown_time):
+        """Initialize worker
+
+        Args:
+            worker_id: Number used to spread workers over equally short routes
+            x, y: Starting tile coordinates
+            tool_key: Key into TOOLS of the worker's tool
+            move_cooldown_time: Time between steps in ms
+        """
+        self.worker_id = worker_id
+        self.x = x
+        self.y = y
+        self.tool_key = tool_key
+        self.tool_uses = 0
+        self.move_cooldown_time = move_cooldown_time
+        self.move_cooldown = 0
+        self.chop_cooldown = 0
+
+    def update(self, dt, grid, field, movement_count, cooldown_mult=1.0):
+        """Chop the weed underfoot, or take a step towards the nearest one
+
+        Args:
+            dt: Delta time in milliseconds
+            grid: Game grid
+            field: Shared WeedDistanceField
+            movement_count: Player movement count, the clock weeds regrow by
+            cooldown_mult: Multiplier on tool cooldowns from events
+
+        Returns:
+            True if the worker moved or chopped
+        """
+        if self.move_cooldown > 0:
+            self.move_cooldown -= dt
+        if self.chop_cooldown > 0:
+            self.chop_cooldown -= dt
+
+        if grid.tiles[self.y][self.x].tile_type == TileType.WEED:
+            if self.chop_cooldown > 0:
+                return False
+            tool = get_tool(self.tool_key)
+            if not chop_tiles(grid, tool, self.x, self.y, movement_count):
+                return False
+            self.chop_cooldown = tool.cooldown * cooldown_mult
+            self.tool_uses += 1
+            # Worn out tools are swapped for a hand hoe, as for the player
+            if 0 < tool.longevity <= self.tool_uses:
+                self.tool_key = 'hand_hoe'
+                self.tool_uses = 0
+            return True
+
+        if self.move_cooldown > 0:
+            return False
+        step = field.next_step(self.x, self.y, self.worker_id)
+        if step is None:
+            return False
+        self.x, self.y = step
+        self.move_cooldown = self.move_cooldown_time
+        return True
+
+
+class WorkerCrew:
+    """All hired workers and the distance field they share"""
+
+    def __init__(self, grid, pathfinder, move_cooldown_time):
+        """Initialize worker crew
+
+        Args:
+            grid: Game grid
+            pathfinder: Pathfinder whose walkability bitmap the field shares
+            move_cooldown_time: Time between worker steps in ms
+        """
+        self.grid = grid
+        self.field = WeedDistanceField(grid, pathfinder)
+        self.move_cooldown_time = move_cooldown_time
+        self.workers = []
+        # Bumped whenever a worker moves or chops, for frame keys
+        self.revision = 0
+
+    def hire(self, x, y, tool_key='hand_hoe'):
+        """Add a worker
+
+        Args:
+            x, y: Tile the worker starts on
+            tool_key: Key into TOOLS of the worker's tool
+
+        Returns:
+            The new Worker
+        """
+        worker = Worker(len(self.workers), x, y, tool_key, self.move_cooldown_time)
+        self.workers.append(worker)
+        self.revision += 1
+        return worker
+
+    def update(self, dt, movement_count, cooldown_mult=1.0):
+        """Update every worker
+
+        Args:
+            dt: Delta time in milliseconds
+            movement_count: Player movement count, the clock weeds regrow by
+            cooldown_mult: Multiplier on tool cooldowns from events
+        """
+        for worker in self.workers:
+            if worker.update(dt, self.grid, self.field, movement_count, cooldown_mult):
+                self.revision += 1
@@ -4,15 +4,24 @@ Weed Whacker - Main Game State and Loop Logic
 
 import pygame # type: ignore
 import random
+from collections import deque
 from .constants.colors import BLACK
 
 from .game.grid import Grid, TileType
 from .game.player import Player
 from .game.economy import Economy
 from .game.weeds import WEED_BASIC
+from .game.tools import get_tool
+from .game.camera import Camera
+from .game.pathfinding import Pathfinder
+from .game.workers import WorkerCrew
 from .ui.hud import UI
+from .ui.shared import ModalStack, NotificationQueue, MessageDialog
+from .input_handler import InputHandler, TilePicker, BUFFERED_ACTIONS, MOVE_DIRECTIONS
 from .render.grid_renderer import GridRenderer
 from .render.player_renderer import PlayerRenderer
+from .render.overview_renderer import OverviewRenderer
+from .render.target_renderer import TargetRenderer
 from ..assets.managers.asset_manager import AssetManager
 from ..config import (
     TILE_SIZE,
@@ -21,11 +30,29 @@ from ..config import (
     STARTING_GRID_SIZE,
     WORLD_GRID_SIZE,
     PLAYER_MOVE_COOLDOWN,
+    INPUT_BUFFER_MS,
+    PATH_EXPANSIONS_PER_STEP,
+    REGION_TILES_PER_STEP,
     CHOP_COOLDOWN,
+    CHOP_RANGE,
+    AUTO_TARGET,
     WEED_SPAWN_INTERVAL,
     INCOME_PER_TILE_PER_SECOND,
     TILE_BASE_COST,
-    TILE_COST_INCREMENT
+    TILE_COST_INCREMENT,
+    WORKER_BASE_COST,
+    WORKER_COST_INCREMENT,
+    WORKER_MOVE_COOLDOWN,
+    WORKER_TOOL,
+    CAMERA_DEADZONE_TILES,
+    CAMERA_SMOOTHING_MS,
+    GROUND_CHUNK_TILES,
+    ZOOM_TILE_SIZES,
+    OVERVIEW_MAX_TILE_SIZE,
+    SPRITE_ATLAS_CACHE,
+    SPRITE_DISK_CACHE,
+    USE_ASSET_PACK,
+    SPRITE_MEMORY_BUDGET
 )
 
 
@@ -44,46 +71,81 @@ class Game:
             self.grid,
             INCOME_PER_TILE_PER_SECOND,
             TILE_BASE_COST,
-            TILE_COST_INCREMENT
+            TILE_COST_INCREMENT,
+            WORKER_BASE_COST,
+            WORKER_COST_INCREMENT
         )
         
         from weed_whacker.src.game.events import EventManager
         self.event_manager = EventManager()
         
         # Initialize asset manager
-        self.asset_manager = AssetManager(TILE_SIZE)
+        self.asset_manager = AssetManager(
+            TILE_SIZE, SPRITE_ATLAS_CACHE, SPRITE_DISK_CACHE, USE_ASSET_PACK, SPRITE_MEMORY_BUDGET
+        )
         
         # Initialize renderers
-        self.grid_renderer = GridRenderer(self.asset_manager)
+        self.grid_renderer = GridRenderer(self.asset_manager, GROUND_CHUNK_TILES)
         self.player_renderer = PlayerRenderer(self.asset_manager)
+        self.overview_renderer = OverviewRenderer(self.grid_renderer)
+        self.target_renderer = TargetRenderer()
+        
+        # Zoom levels as tile sizes, largest first
+        self.zoom_levels = sorted(set(ZOOM_TILE_SIZES) | {TILE_SIZE}, reverse=True)
+        self.zoom_index = self.zoom_levels.index(TILE_SIZE)
+        self.tile_size = TILE_SIZE
         
         # Initialize UI
         self.ui = UI()
+        self.notifications = NotificationQueue()
         from weed_whacker.src.ui.inventory_ui import InventoryUI
-        self.inventory_ui = InventoryUI()
+        self.inventory_ui = InventoryUI(self.notifications)
+        self.message_dialog = MessageDialog()
+        self.input = InputHandler(INPUT_BUFFER_MS)
+        self.picker = TilePicker()
+        self.modal_stack = ModalStack()
         
         # Initialize grid
         self.grid = Grid(WORLD_GRID_SIZE, STARTING_GRID_SIZE)
         
-        # Calculate camera offset to center the grid on screen
-        # The grid is WORLD_GRID_SIZE tiles, we want to center it
-        grid_pixel_width = WORLD_GRID_SIZE * TILE_SIZE
-        grid_pixel_height = WORLD_GRID_SIZE * TILE_SIZE
-        self.camera_offset = (
-            (grid_pixel_width - INTERNAL_WIDTH) // 2,
-            (grid_pixel_height - INTERNAL_HEIGHT) // 2
-        )
-        
         # Initialize player at center of starting plot
         center_tile = WORLD_GRID_SIZE // 2
         self.player = Player(center_tile, center_tile, self.grid, self.asset_manager)
         
+        # Click-to-move: a search in progress, then the tiles left to walk
+        self.pathfinder = Pathfinder(self.grid)
+        self.walk_search = None
+        self.walk_path = deque()
+        
+        # Helper workers share a distance field built on the pathfinder's bitmap
+        self.crew = WorkerCrew(self.grid, self.pathfinder, WORKER_MOVE_COOLDOWN)
+        
+        # Spacebar chops aim at the nearest weed in range while this is on
+        self.auto_target = AUTO_TARGET
+        
+        # Shift-drag region purchase: corner tiles, and the cached purchase order
+        self.region_start = None
+        self.region_end = None
+        self._region_key = None
+        self._region_order = []
+        self._nearest_weed_key = None
+        self._nearest_weed = None
+        
+        # Camera follows the player within the owned plot
+        self.camera = Camera(
+            INTERNAL_WIDTH, INTERNAL_HEIGHT, TILE_SIZE, CAMERA_DEADZONE_TILES, CAMERA_SMOOTHING_MS
+        )
+        self.camera.snap(*self._camera_focus(), self.grid.owned_bounds)
+        self.camera_offset = self.camera.offset
+        
         # Initialize economy system
         self.economy = Economy(
             self.grid,
             INCOME_PER_TILE_PER_SECOND,
             TILE_BASE_COST,
-            TILE_COST_INCREMENT
+            TILE_COST_INCREMENT,
+            WORKER_BASE_COST,
+            WORKER_COST_INCREMENT
         )
         
         # Weed spawning timer
@@ -92,6 +154,7 @@ class Game:
 
     def handle_event(self, event):
         """Handle pygame events"""
+        action = self.input.action_for_event(event)
         if event.type == pygame.KEYDOWN:
             # DEBUG CHEATS (F1-F12 keys)
             if event.key == pygame.K_F1:
@@ -116,81 +179,202 @@ class Game:
                             tile.weed_type = WEED_BASIC
                             tile.weed_health = WEED_BASIC.toughness
                             tile.last_movement_count = self.player.movement_count
+                            self.grid.mark_changed(x, y)
                 print("DEBUG: Spawned weeds everywhere")
+            elif event.key == pygame.K_F4:
+                # Print sprite residency counters
+                print(f"DEBUG: Sprite stats {self.asset_manager.get_sprite_stats()}")
+            
+            # Zoom in and out
+            if action == "zoom_in":
+                self._set_zoom(self.zoom_index - 1)
+            elif action == "zoom_out":
+                self._set_zoom(self.zoom_index + 1)
 
             # Handle inventory toggling
-            if event.key == pygame.K_i:
+            if action == "toggle_inventory":
                 self.inventory_ui.toggle()
-            elif event.key == pygame.K_ESCAPE and self.inventory_ui.is_open:
+            elif action == "close" and self.inventory_ui.is_open:
                 self.inventory_ui.toggle()
+            elif action == "close" and self.region_start is not None:
+                self.region_start = self.region_end = None
                 
             # Ignore other inputs if inventory is open
             if self.inventory_ui.is_open:
+                self.input.clear()
                 return
 
-            # Movement with WASD or arrow keys
-            move_cooldown = PLAYER_MOVE_COOLDOWN * self.event_manager.get_player_speed_mult()
-            if event.key in (pygame.K_w, pygame.K_UP):
-                self.player.try_move(0, -1, move_cooldown)
-            elif event.key in (pygame.K_s, pygame.K_DOWN):
-                self.player.try_move(0, 1, move_cooldown)
-            elif event.key in (pygame.K_a, pygame.K_LEFT):
-                self.player.try_move(-1, 0, move_cooldown)
-            elif event.key in (pygame.K_d, pygame.K_RIGHT):
-                self.player.try_move(1, 0, move_cooldown)
-            # Chop action
-            elif event.key == pygame.K_SPACE:
-                from weed_whacker.src.game.tools import get_tool
-                current_tool = get_tool(self.player.current_tool)
-                chop_cooldown = current_tool.cooldown * self.event_manager.get_tool_cooldown_mult()
-                success, broken_tool = self.player.try_chop(chop_cooldown)
-                if broken_tool:
-                    from weed_whacker.src.game.tools import get_tool
-                    tool_name = get_tool(broken_tool).name
-                    from weed_whacker.src.ui.shared import MessageDialog
-                    if not hasattr(self, 'message_dialog'):
-                        self.message_dialog = MessageDialog()
-                    self.message_dialog.show(
-                        "Tool Broke!",
-                        f"Your {tool_name} broke and was removed from your inventory."
-                    )
+            # Moves and chops wait in the input buffer until their cooldown allows them
+            if action in BUFFERED_ACTIONS:
+                if action in MOVE_DIRECTIONS:
+                    self._stop_walking()
+                self.input.buffer(action)
             # Buy tile
-            elif event.key == pygame.K_b:
+            elif action == "buy_tile":
                 self._try_purchase_selected_tile()
             # Cycle through purchasable tiles
-            elif event.key == pygame.K_TAB:
+            elif action == "cycle_tile":
                 purchasable_tiles = self._get_all_purchasable_tiles()
                 self.ui.cycle_selected_tile(1, len(purchasable_tiles))
+            # Buy the whole ring around the plot, nearest tiles first
+            elif action == "buy_frontier":
+                self._buy_region(sorted(
+                    self.grid.frontier,
+                    key=lambda tile: (abs(tile[0] - self.player.x) + abs(tile[1] - self.player.y), tile[1], tile[0])
+                ))
+            elif action == "hire_worker":
+                self._try_hire_worker()
+            elif action == "toggle_auto_target":
+                self.auto_target = not self.auto_target
+                self.notifications.show(f"Auto-target {'on' if self.auto_target else 'off'}")
+        
+        elif event.type == pygame.MOUSEWHEEL:
+            if not self.inventory_ui.is_open:
+                self._set_zoom(self.zoom_index - event.y)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
+            pos = self.picker.to_internal(event.pos)
+
             # Handle message dialog clicks
-            if hasattr(self, 'message_dialog') and self.message_dialog.active:
+            if self.message_dialog.active:
                 if event.button == 1:
-                    self.message_dialog.handle_click(event.pos)
+                    self.message_dialog.handle_click(pos)
                 return
 
             # Handle inventory clicks if open
             if self.inventory_ui.is_open:
                 if event.button == 1: # Left click
-                    self.inventory_ui.handle_click(event.pos, self.player, self.economy)
+                    self.inventory_ui.handle_click(pos, self.player, self.economy)
                 return
                 
-            # Left click to chop
-            if event.button == 1:
-                from weed_whacker.src.game.tools import get_tool
-                current_tool = get_tool(self.player.current_tool)
-                chop_cooldown = current_tool.cooldown * self.event_manager.get_tool_cooldown_mult()
-                success, broken_tool = self.player.try_chop(chop_cooldown)
-                if broken_tool:
-                    from weed_whacker.src.game.tools import get_tool
-                    tool_name = get_tool(broken_tool).name
-                    from weed_whacker.src.ui.shared import MessageDialog
-                    if not hasattr(self, 'message_dialog'):
-                        self.message_dialog = MessageDialog()
-                    self.message_dialog.show(
-                        "Tool Broke!",
-                        f"Your {tool_name} broke and was removed from your inventory."
-                    )
+            # Shift and left drag to select a region to buy
+            if event.button == 1 and pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                self.region_start = self.region_end = self.picker.pick(event.pos, self.tile_size, self.camera_offset)
+            # Left click to chop at the clicked tile
+            elif event.button == 1:
+                target = self.picker.pick(event.pos, self.tile_size, self.camera_offset)
+                if self._in_chop_range(target):
+                    self.input.buffer("chop", target)
+            # Right click to walk to the clicked tile
+            elif event.button == 3:
+                target = self.picker.pick(event.pos, self.tile_size, self.camera_offset)
+                self._walk_to(target)
+        
+        elif event.type == pygame.MOUSEMOTION:
+            if self.region_start is not None:
+                self.region_end = self.picker.pick(event.pos, self.tile_size, self.camera_offset)
+        
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1 and self.region_start is not None:
+                self.region_end = self.picker.pick(event.pos, self.tile_size, self.camera_offset)
+                self._buy_region(self.economy.get_rectangle_tiles(*self.region_start, *self.region_end))
+                self.region_start = self.region_end = None
+
+    def _perform_action(self, action, target=None):
+        """Run a cooldown-gated action from the input buffer or a held key
+
+        Args:
+            action: Action name from BUFFERED_ACTIONS
+            target: (x, y) tile the action is aimed at, or None for the player's tile
+
+        Returns:
+            False while the action's cooldown blocks it, True once it ran
+        """
+        if action in MOVE_DIRECTIONS:
+            if self.player.move_cooldown > 0:
+                return False
+            move_cooldown = PLAYER_MOVE_COOLDOWN * self.event_manager.get_player_speed_mult()
+            self.player.try_move(*MOVE_DIRECTIONS[action], move_cooldown)
+            return True
+        if action == "chop":
+            if self.player.chop_cooldown > 0:
+                return False
+            if target is None and self.auto_target:
+                target = self.player.get_auto_target(CHOP_RANGE)
+            # The player may have walked away from a clicked tile while waiting
+            if target is None or self._in_chop_range(target):
+                self._chop(target)
+        return True
+
+    def _chop(self, target=None):
+        """Chop with the current tool, reporting a tool that breaks
+
+        Args:
+            target: (x, y) tile to center the tool's reach on, or None for the player's tile
+        """
+        current_tool = get_tool(self.player.current_tool)
+        chop_cooldown = current_tool.cooldown * self.event_manager.get_tool_cooldown_mult()
+        success, broken_tool = self.player.try_chop(chop_cooldown, target)
+        if broken_tool:
+            tool_name = get_tool(broken_tool).name
+            self.message_dialog.show(
+                "Tool Broke!",
+                f"Your {tool_name} broke and was removed from your inventory."
+            )
+
+    def _walk_to(self, target):
+        """Start walking along a shortest path to a tile
+
+        Args:
+            target: (x, y) tile coordinates; unreachable tiles are ignored
+        """
+        if not self.pathfinder.is_walkable(*target):
+            return
+        self._stop_walking()
+        self.walk_search = self.pathfinder.start_search((self.player.x, self.player.y), target)
+
+    def _stop_walking(self):
+        """Cancel click-to-move"""
+        if self.walk_search is not None:
+            self.walk_search.cancel()
+            self.walk_search = None
+        self.walk_path.clear()
+
+    def _update_walk(self):
+        """Advance the path search, then take the next step when the move cooldown allows"""
+        if self.walk_search is not None:
+            # Long searches are spread over several updates to stay within the frame budget
+            if not self.walk_search.step(PATH_EXPANSIONS_PER_STEP):
+                return
+            self.walk_path.extend(self.walk_search.path or ())
+            self.walk_search = None
+
+        if not self.walk_path or self.player.move_cooldown > 0:
+            return
+        next_x, next_y = self.walk_path[0]
+        move_cooldown = PLAYER_MOVE_COOLDOWN * self.event_manager.get_player_speed_mult()
+        if self.player.try_move(next_x - self.player.x, next_y - self.player.y, move_cooldown):
+            self.walk_path.popleft()
+        else:
+            self._stop_walking()
+
+    def _in_chop_range(self, target):
+        """Check whether the player can chop at a tile
+
+        Args:
+            target: (x, y) tile coordinates
+
+        Returns:
+            True if the tile is in the world and within CHOP_RANGE of the player
+        """
+        if self.grid.get_tile(*target) is None:
+            return False
+        return max(abs(target[0] - self.player.x), abs(target[1] - self.player.y)) <= CHOP_RANGE
+
+    def _get_hover_target(self):
+        """Get the tile under the mouse for the reach preview
+
+        Returns:
+            Tuple of ((x, y), in_range), or None when there is nothing to preview
+        """
+        if self.tile_size <= OVERVIEW_MAX_TILE_SIZE or self.inventory_ui.is_open or self.message_dialog.active:
+            return None
+        if not pygame.mouse.get_focused():
+            return None
+        target = self.picker.pick(pygame.mouse.get_pos(), self.tile_size, self.camera_offset)
+        if self.grid.get_tile(*target) is None:
+            return None
+        return target, self._in_chop_range(target)
 
     def update(self, dt):
         """Update game state
@@ -208,79 +392,228 @@ class Game:
         # Update player cooldowns
         self.player.update(dt)
         
+        # Buffered and held actions fire as soon as their cooldown ends
+        if not self.inventory_ui.is_open:
+            self.input.update(self._perform_action)
+            self._update_walk()
+        
+        # Bulk purchases reach the pathfinder, helpers and renderers a slice at a time
+        self.grid.flush_changes(REGION_TILES_PER_STEP)
+        
+        # Helpers keep working while menus are open
+        self.crew.update(dt, self.player.movement_count, self.event_manager.get_tool_cooldown_mult())
+        
         # Update economy (income accumulation)
         self.economy.update(dt)
         
-        # Update UI components
-        if self.inventory_ui.is_open:
-            self.inventory_ui.update()
+        # Follow the player; renderers and highlights read the live offset
+        self.camera.update(dt, *self._camera_focus(), self.grid.owned_bounds)
+        self.camera_offset = self.camera.offset
+        
+        # Toasts run on the game clock
+        self.notifications.update(dt)
         
         # Update weed spawn timer
         self.weed_spawn_timer += dt
         spawn_interval = WEED_SPAWN_INTERVAL / self.event_manager.get_weed_spawn_rate_mult()
-        if self.weed_spawn_timer >= spawn_interval:
-            self.weed_spawn_timer = 0
+        # Keep the remainder so long steps don't lose spawn time
+        while self.weed_spawn_timer >= spawn_interval:
+            self.weed_spawn_timer -= spawn_interval
             self._spawn_weed()
 
     def render(self, surface):
         """Render game to surface
 
+        While a modal is open the world beneath it is drawn into a frozen
+        backdrop once, and redrawn only when something visible changes.
+
+        Args:
+            surface: Pygame surface to render to
+        """
+        modal_layers = self._get_modal_layers()
+        if not modal_layers:
+            self._render_world(surface)
+        else:
+            self.modal_stack.render(surface, modal_layers, self._get_world_key(), self._render_world)
+
+        # Notifications stay live above any dialog
+        self.notifications.render(surface, INTERNAL_WIDTH, INTERNAL_HEIGHT)
+
+    def get_frame_key(self):
+        """Get a summary of everything render() draws
+
+        Returns:
+            Hashable tuple; frames with equal keys look the same
+        """
+        modal_key = None
+        modal_layers = self._get_modal_layers()
+        if modal_layers:
+            # Hover states follow the mouse
+            modal_key = (
+                tuple(layer[0] for layer in modal_layers), pygame.mouse.get_pos(),
+                self.inventory_ui.get_render_key(self.player)
+            )
+        return (self._get_world_key(), modal_key, self.notifications.get_render_key())
+
+    def _render_world(self, surface):
+        """Render the grid, player, highlights and HUD
+
         Args:
             surface: Pygame surface to render to
         """
         # Clear screen
         surface.fill(BLACK)
 
-        # Render grid using renderer
-        self.grid_renderer.render(surface, self.grid, TILE_SIZE, self.camera_offset)
-        
-        # Render player using renderer
-        self.player_renderer.render(surface, self.player, TILE_SIZE, self.camera_offset)
-        
-        # Render purchasable tile highlights
         purchasable_tiles = self._get_all_purchasable_tiles()
-        for i, (tile_x, tile_y) in enumerate(purchasable_tiles):
-            is_selected = (i == self.ui.get_selected_index())
-            self.ui.render_tile_highlight(surface, tile_x, tile_y, TILE_SIZE, self.camera_offset, is_selected)
+        region = self._get_region_preview()
+        if self.tile_size <= OVERVIEW_MAX_TILE_SIZE:
+            # Zoomed far out: one pixel per tile instead of sprites
+            self.overview_renderer.render(surface, self.grid, self.tile_size, self.camera_offset)
+            self.overview_renderer.render_player_marker(surface, self.player, self.tile_size, self.camera_offset)
+        else:
+            # Render grid using renderer
+            self.grid_renderer.render(surface, self.grid, self.tile_size, self.camera_offset)
+            
+            # Preview the current tool's reach around the hovered tile
+            hover = self._get_hover_target()
+            if hover:
+                target, in_range = hover
+                self.target_renderer.render(
+                    surface, self.player.current_tool, target, self.tile_size, self.camera_offset, in_range
+                )
+            
+            # Render helpers, then the player on top
+            self.player_renderer.render_workers(surface, self.crew.workers, self.tile_size, self.camera_offset)
+            self.player_renderer.render(surface, self.player, self.tile_size, self.camera_offset)
+            
+            # Render purchasable tile highlights
+            self.ui.render_tile_highlights(
+                surface, purchasable_tiles, self.tile_size, self.camera_offset, self.ui.get_selected_index()
+            )
+            if region:
+                self.ui.render_region_highlights(surface, region[0], region[1], self.tile_size, self.camera_offset)
+            
+            # Point to the nearest weed when it is off screen
+            self._render_weed_arrow(surface)
         
         # Render UI/HUD
         money = self.economy.money
         income_rate = self.economy.income_rate
-        owned_tiles = self.economy.get_owned_tile_count()
+        owned_tiles = self.grid.count_owned_tiles()
         self.ui.render_hud(surface, money, income_rate, owned_tiles, self.player, self.asset_manager, self.event_manager, INTERNAL_WIDTH)
         
-        # Render purchase UI if tiles available
-        if purchasable_tiles:
+        # Render purchase UI for the dragged region, or if tiles are available
+        if region:
+            order, count, cost = region
+            self.ui.render_region_purchase_ui(surface, count, len(order), cost, INTERNAL_WIDTH, INTERNAL_HEIGHT)
+        elif purchasable_tiles:
             cost = self.economy.get_next_tile_cost()
             can_afford = self.economy.can_afford_tile()
             self.ui.render_purchase_ui(surface, purchasable_tiles, cost, can_afford, INTERNAL_WIDTH, INTERNAL_HEIGHT)
-            
-        # Render store UI (renders on top of everything else if open)
-        self.inventory_ui.render(surface, INTERNAL_WIDTH, INTERNAL_HEIGHT, self.player, self.asset_manager)
 
-        # Render message dialog if active
-        if hasattr(self, 'message_dialog') and self.message_dialog.active:
-            self.message_dialog.render(surface, INTERNAL_WIDTH, INTERNAL_HEIGHT)
+    def _get_nearest_weed(self):
+        """Get the weed nearest the player, cached until the grid or player changes
+
+        Returns:
+            (x, y) of the nearest weed, or None
+        """
+        key = (self.grid.revision, self.player.x, self.player.y)
+        if key != self._nearest_weed_key:
+            self._nearest_weed_key = key
+            self._nearest_weed = self.grid.nearest_weed(self.player.x, self.player.y)
+        return self._nearest_weed
+
+    def _render_weed_arrow(self, surface):
+        """Render the HUD arrow towards the nearest weed if it is outside the view
+
+        Args:
+            surface: Pygame surface to render to
+        """
+        weed = self._get_nearest_weed()
+        if weed is None:
+            return
+        half = self.tile_size // 2
+        weed_x = weed[0] * self.tile_size - self.camera_offset[0]
+        weed_y = weed[1] * self.tile_size - self.camera_offset[1]
+        if -half < weed_x < INTERNAL_WIDTH - half and -half < weed_y < INTERNAL_HEIGHT - half:
+            return
+        player_x = self.player.x * self.tile_size - self.camera_offset[0] + half
+        player_y = self.player.y * self.tile_size - self.camera_offset[1] + half
+        self.ui.render_weed_arrow(
+            surface, (player_x, player_y), (weed_x + half, weed_y + half), INTERNAL_WIDTH, INTERNAL_HEIGHT
+        )
+
+    def _get_modal_layers(self):
+        """Get the open modals as ModalStack layers, bottom first"""
+        layers = self.inventory_ui.get_modal_layers(self.player, self.asset_manager)
+        if self.message_dialog.active:
+            layers.append(self.message_dialog.get_modal_layer())
+        return layers
+
+    def _get_world_key(self):
+        """Get a summary of everything _render_world draws
+
+        Checked on every loop iteration, idle wake-ups included, so it is
+        built from grid.revision and the grid's cached counts and never
+        scans the tiles.
+
+        Returns:
+            Hashable tuple that changes whenever the world visibly changes
+        """
+        purchasable_tiles = self._get_all_purchasable_tiles()
+        purchase_key = None
+        if purchasable_tiles:
+            purchase_key = (
+                tuple(purchasable_tiles), self.ui.get_selected_index(),
+                self.economy.get_next_tile_cost(), self.economy.can_afford_tile()
+            )
+        hud_key = self.ui.get_hud_key(
+            self.economy.money, self.economy.income_rate, self.grid.count_owned_tiles(),
+            self.player, self.event_manager
+        )
+        hover = self._get_hover_target()
+        hover_key = (hover, self.player.current_tool) if hover else None
+        region = self._get_region_preview()
+        region_key = (self.region_start, self.region_end, region[1]) if region else None
+        return (
+            self.grid.revision, self.tile_size, self.camera_offset,
+            self.player.x, self.player.y, purchase_key, hud_key, hover_key, self.crew.revision, region_key
+        )
+
+    def _camera_focus(self):
+        """Get the player's center in world pixels at the current zoom"""
+        return (
+            self.player.x * self.tile_size + self.tile_size / 2,
+            self.player.y * self.tile_size + self.tile_size / 2
+        )
+
+    def _set_zoom(self, zoom_index):
+        """Switch to another zoom level; its sprites are pre-scaled once and cached
+
+        Args:
+            zoom_index: Index into zoom_levels, clamped to the valid range
+        """
+        zoom_index = max(0, min(len(self.zoom_levels) - 1, zoom_index))
+        if zoom_index == self.zoom_index:
+            return
+        self.zoom_index = zoom_index
+        self.tile_size = self.zoom_levels[zoom_index]
+        self.camera.set_tile_size(self.tile_size)
+        self.camera_offset = self.camera.offset
 
     def _spawn_weed(self):
         """Spawn a weed on a random GRASS tile"""
         
-        # Collect all GRASS tiles
-        grass_tiles = []
-        for y in range(self.grid.world_size):
-            for x in range(self.grid.world_size):
-                tile = self.grid.get_tile(x, y)
-                if tile and tile.tile_type == TileType.GRASS:
-                    grass_tiles.append((x, y))
-        
-        # If there are valid grass tiles, spawn on a random one
-        if grass_tiles:
-            x, y = random.choice(grass_tiles)
+        # Picked from the grid's tile codes rather than a list of every GRASS tile
+        spot = self.grid.random_grass_tile(random)
+        if spot:
+            x, y = spot
             tile = self.grid.get_tile(x, y)
             tile.tile_type = TileType.WEED
             tile.weed_type = WEED_BASIC
             tile.weed_health = WEED_BASIC.toughness
             tile.last_movement_count = self.player.movement_count
+            self.grid.mark_changed(x, y)
 
     def _get_all_purchasable_tiles(self):
         """Get all coordinates of purchasable tiles adjacent to the player
@@ -311,6 +644,51 @@ class Game:
         
         return purchasable
 
+    def _buy_region(self, tiles):
+        """Buy as many of the tiles as affordable in one payment
+
+        Args:
+            tiles: (x, y) candidates, in order of preference
+        """
+        money_before = self.economy.money
+        next_cost = self.economy.get_next_tile_cost()
+        bought = self.economy.try_purchase_region(tiles)
+        if bought:
+            self.ui.reset_selection()
+            self.notifications.show(f"Bought {len(bought)} tiles for ${round(money_before - self.economy.money)}")
+        elif self.economy.get_connected_purchase_order(tiles):
+            self.notifications.show(f"The next tile costs ${next_cost}")
+        else:
+            self.notifications.show("No tiles there connect to your land")
+
+    def _get_region_preview(self):
+        """Get what releasing the current region drag would buy
+
+        Returns:
+            Tuple of (purchase order, affordable count, cost of that count),
+            or None while not dragging
+        """
+        if self.region_start is None:
+            return None
+        key = (self.region_start, self.region_end, self.economy.tiles_purchased)
+        if key != self._region_key:
+            # One flood pass per change of selection or of owned land, not per frame
+            self._region_key = key
+            self._region_order = self.economy.get_connected_purchase_order(
+                self.economy.get_rectangle_tiles(*self.region_start, *self.region_end)
+            )
+        count = min(len(self._region_order), self.economy.get_max_affordable_tiles())
+        return self._region_order, count, self.economy.get_bulk_cost(count)
+
+    def _try_hire_worker(self):
+        """Hire a helper worker on the player's tile if affordable"""
+        cost = self.economy.get_next_worker_cost()
+        if self.economy.try_hire_worker():
+            self.crew.hire(self.player.x, self.player.y, WORKER_TOOL)
+            self.notifications.show(f"Hired helper #{len(self.crew.workers)} for ${cost}")
+        else:
+            self.notifications.show(f"A helper costs ${cost}")
+
     def _try_purchase_selected_tile(self):
         """Attempt to purchase the currently selected tile"""
         purchasable_tiles = self._get_all_purchasable_tiles()
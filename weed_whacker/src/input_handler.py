@@ -0,0 +1,237 @@
+"""
+Weed Whacker - Input Actions
+Maps raw pygame events to game actions, buffers cooldown-gated actions,
+tracks held movement keys and picks the tile under the pointer.
+"""
+
+import time
+
+import pygame # type: ignore
+
+# Keyboard bindings: key -> action
+KEY_BINDINGS = {
+    pygame.K_w: "move_up",
+    pygame.K_UP: "move_up",
+    pygame.K_s: "move_down",
+    pygame.K_DOWN: "move_down",
+    pygame.K_a: "move_left",
+    pygame.K_LEFT: "move_left",
+    pygame.K_d: "move_right",
+    pygame.K_RIGHT: "move_right",
+    pygame.K_SPACE: "chop",
+    pygame.K_b: "buy_tile",
+    pygame.K_TAB: "cycle_tile",
+    pygame.K_r: "buy_frontier",
+    pygame.K_t: "toggle_auto_target",
+    pygame.K_h: "hire_worker",
+    pygame.K_i: "toggle_inventory",
+    pygame.K_ESCAPE: "close",
+    pygame.K_EQUALS: "zoom_in",
+    pygame.K_PLUS: "zoom_in",
+    pygame.K_KP_PLUS: "zoom_in",
+    pygame.K_MINUS: "zoom_out",
+    pygame.K_KP_MINUS: "zoom_out",
+}
+
+# Movement actions -> (dx, dy)
+MOVE_DIRECTIONS = {
+    "move_up": (0, -1),
+    "move_down": (0, 1),
+    "move_left": (-1, 0),
+    "move_right": (1, 0),
+}
+
+# Actions gated by a player cooldown; a press during the cooldown is buffered
+BUFFERED_ACTIONS = frozenset(MOVE_DIRECTIONS) | {"chop"}
+
+# Event types the game reads; everything else is kept out of the queue
+ALLOWED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+    pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED,
+    pygame.WINDOWSHOWN, pygame.WINDOWHIDDEN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE,
+]
+
+
+def restrict_events():
+    """Only queue the event types in ALLOWED_EVENTS
+
+    Call once after the display is created.
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(ALLOWED_EVENTS)
+
+
+class InputHandler:
+    """Turns events into actions and holds back actions until they can run
+
+    Cooldown-gated actions (moves and chops) go into a one-slot buffer;
+    a newer press replaces an older one. The game retries the buffered
+    action every simulation step, so a press made just before a cooldown
+    ends fires the moment it does instead of being dropped. Movement keys
+    that stay held repeat the move each time the cooldown allows.
+
+    Latency from key press to the action running is recorded per action.
+    """
+
+    def __init__(self, buffer_ms=150):
+        """Initialize input handler
+
+        Args:
+            buffer_ms: How long a buffered action waits for its cooldown before it is dropped
+        """
+        self.buffer_ms = buffer_ms
+        self.buffered = None
+        self.buffered_target = None
+        self._buffered_at = 0.0
+        self._held_moves = []  # Held movement actions, most recent last
+
+        # action -> [count, total seconds, longest seconds]
+        self.latency = {}
+        self.expired = 0
+
+    def action_for_event(self, event):
+        """Get the action an event maps to, tracking held movement keys
+
+        Args:
+            event: Pygame event
+
+        Returns:
+            Action name, or None
+        """
+        if event.type == pygame.KEYDOWN:
+            action = KEY_BINDINGS.get(event.key)
+            if action in MOVE_DIRECTIONS:
+                if action in self._held_moves:
+                    self._held_moves.remove(action)
+                self._held_moves.append(action)
+            return action
+        if event.type == pygame.KEYUP:
+            action = KEY_BINDINGS.get(event.key)
+            if action in self._held_moves:
+                self._held_moves.remove(action)
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Key releases are not delivered to an unfocused window
+            self._held_moves.clear()
+        return None
+
+    def buffer(self, action, target=None):
+        """Hold an action until its cooldown allows it
+
+        Args:
+            action: Action name from BUFFERED_ACTIONS
+            target: Optional (x, y) tile the action is aimed at, such as a clicked tile
+        """
+        self.buffered = action
+        self.buffered_target = target
+        self._buffered_at = time.perf_counter()
+
+    def clear(self):
+        """Drop the buffered action and forget held keys"""
+        self.buffered = None
+        self.buffered_target = None
+        self._held_moves.clear()
+
+    def update(self, perform):
+        """Run the buffered action, or repeat a held move, if its cooldown allows
+
+        Args:
+            perform: Function taking an action name and a target tile (or
+                None), returning False while the action's cooldown blocks it
+                (and True once it ran)
+        """
+        if self.buffered is not None:
+            now = time.perf_counter()
+            if perform(self.buffered, self.buffered_target):
+                self._record(self.buffered, now - self._buffered_at)
+                self.buffered = None
+                self.buffered_target = None
+                return
+            if (now - self._buffered_at) * 1000 > self.buffer_ms:
+                self.buffered = None
+                self.buffered_target = None
+                self.expired += 1
+
+        # The most recently pressed movement key that is still held wins
+        if self._held_moves and self.buffered is None:
+            perform(self._held_moves[-1], None)
+
+    def _record(self, action, latency):
+        """Add one press-to-action latency sample"""
+        stats = self.latency.setdefault("move" if action in MOVE_DIRECTIONS else action, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += latency
+        stats[2] = max(stats[2], latency)
+
+    def report(self):
+        """Summarize press-to-action latency
+
+        Returns:
+            Summary string
+        """
+        parts = []
+        for action, (count, total, longest) in sorted(self.latency.items()):
+            parts.append(f"{action} {count}x avg {total / count * 1000:.1f}ms max {longest * 1000:.1f}ms")
+        summary = ", ".join(parts) if parts else "no actions"
+        return f"Input latency: {summary}; {self.expired} buffered presses expired"
+
+
+class TilePicker:
+    """Maps pointer positions in the window to world tiles
+
+    A window position goes through the display scale to the internal
+    resolution, then through the camera offset and tile size to a tile.
+    The inverse of the display scale is worked out once, so each pick is a
+    multiply, an add and an integer floor division per axis.
+    """
+
+    def __init__(self, pointer_scale=1):
+        """Initialize tile picker
+
+        Args:
+            pointer_scale: Window pixels per internal pixel in pointer
+                coordinates (1 when SDL already reports internal coordinates)
+        """
+        self.set_pointer_scale(pointer_scale)
+
+    def set_pointer_scale(self, pointer_scale):
+        """Change the window scale pointer positions are reported in
+
+        Args:
+            pointer_scale: Window pixels per internal pixel
+        """
+        self.pointer_scale = pointer_scale
+        self._inverse_scale = 1.0 / pointer_scale
+
+    def to_internal(self, window_pos):
+        """Convert a pointer position to internal resolution pixels
+
+        Args:
+            window_pos: (x, y) pointer position in window pixels
+
+        Returns:
+            (x, y) integer position in internal pixels
+        """
+        if self.pointer_scale == 1:
+            return window_pos
+        return (int(window_pos[0] * self._inverse_scale), int(window_pos[1] * self._inverse_scale))
+
+    def pick(self, window_pos, tile_size, camera_offset):
+        """Get the world tile under a pointer position
+
+        Args:
+            window_pos: (x, y) pointer position in window pixels
+            tile_size: Size of tiles in pixels
+            camera_offset: (x, y) camera offset in pixels
+
+        Returns:
+            (x, y) tile coordinates, which may lie outside the world
+        """
+        internal_x, internal_y = self.to_internal(window_pos)
+        # Integer floor division keeps tile edges exact, including left of the world
+        return (
+            (internal_x + camera_offset[0]) // tile_size,
+            (internal_y + camera_offset[1]) // tile_size,
+        )
@@ -0,0 +1,23 @@
+"""
+Batched blit submission
+"""
+
+import pygame
+
+# pygame-ce's fblits skips building the per-blit rect list entirely
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+
+def submit_blits(surface, blit_sequence):
+    """Draw a whole layer of sprites with a single call
+    
+    Args:
+        surface: Target surface
+        blit_sequence: List of (source surface, (x, y)) pairs, drawn in order
+    """
+    if not blit_sequence:
+        return
+    if _HAS_FBLITS:
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
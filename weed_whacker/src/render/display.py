@@ -0,0 +1,91 @@
+"""
+Display pipeline - maps the internal resolution onto the window
+"""
+
+import pygame
+
+# Ways to get a frame from the internal resolution onto the window
+DISPLAY_SCALING_MODES = ('auto', 'direct', 'scaled', 'scale_by', 'scale')
+
+
+class Display:
+    """Owns the window and the surface the game renders into
+
+    Modes:
+        direct: Render straight into the window (scale factor 1 only)
+        scaled: Render straight into a pygame.SCALED window; SDL scales on
+            present and picks the largest integer window that fits the desktop
+        scale_by: Render off-screen, then one nearest-neighbour scale_by into the window
+        scale: Render off-screen, then transform.scale to the window size
+            (any factor, including fractional ones)
+        auto: direct at scale 1, scale_by for integer factors, scale otherwise
+            (scaled when vsync is requested)
+
+    With vsync, present() blocks until the next display refresh. SDL only
+    honours it for renderer-backed windows, which in pygame means 'scaled';
+    other modes pass the request on but may not wait.
+    """
+
+    def __init__(self, internal_width, internal_height, scale_factor, mode='auto', vsync=False):
+        """Create the window
+
+        Args:
+            internal_width: Render width in pixels
+            internal_height: Render height in pixels
+            scale_factor: Window size multiplier
+            mode: One of DISPLAY_SCALING_MODES
+            vsync: Whether to request a vsync-paced window
+
+        Raises:
+            ValueError: If the mode is unknown or direct is used with a scale other than 1
+        """
+        if mode not in DISPLAY_SCALING_MODES:
+            raise ValueError(f"Unknown display scaling mode: {mode}")
+        if mode == 'auto':
+            if vsync:
+                mode = 'scaled'
+            elif scale_factor == 1:
+                mode = 'direct'
+            elif scale_factor == int(scale_factor):
+                mode = 'scale_by'
+            else:
+                mode = 'scale'
+        if mode == 'direct' and scale_factor != 1:
+            raise ValueError("Direct display scaling requires SCALE_FACTOR = 1")
+
+        self.mode = mode
+        self.vsync = vsync
+        self.scale_factor = scale_factor
+        internal_size = (internal_width, internal_height)
+        self.window_size = (round(internal_width * scale_factor), round(internal_height * scale_factor))
+
+        if mode == 'direct':
+            self.screen = pygame.display.set_mode(internal_size, vsync=int(vsync))
+            self.surface = self.screen
+        elif mode == 'scaled':
+            self.screen = pygame.display.set_mode(internal_size, pygame.SCALED, vsync=int(vsync))
+            self.surface = self.screen
+            self.window_size = pygame.display.get_window_size()
+        else:
+            self.screen = pygame.display.set_mode(self.window_size, vsync=int(vsync))
+            # Internal surface for pixel-perfect rendering, in the window's format
+            self.surface = pygame.Surface(internal_size).convert()
+
+    @property
+    def pointer_scale(self):
+        """Window pixels per internal pixel in mouse positions
+
+        pygame.SCALED windows already report mouse positions in internal
+        pixels; the other modes report window pixels.
+        """
+        if self.mode in ('direct', 'scaled'):
+            return 1
+        return self.scale_factor
+
+    def present(self):
+        """Scale the rendered frame into the window if needed and show it"""
+        if self.mode == 'scale_by':
+            pygame.transform.scale_by(self.surface, self.scale_factor, self.screen)
+        elif self.mode == 'scale':
+            pygame.transform.scale(self.surface, self.window_size, self.screen)
+        pygame.display.flip()
@@ -3,53 +3,225 @@ Grid rendering module
 """
 
 import pygame
+from ..constants.colors import BLACK
 from ..game.grid import TileType
+from ..game.weeds import WEED_BASIC
+from .batch import submit_blits
+
+# Number of grass sprite variations (grass_1 .. grass_3)
+GRASS_VARIATIONS = 3
 
 
 class GridRenderer:
     """Handles grid and tile rendering"""
     
-    def __init__(self, asset_manager):
+    def __init__(self, asset_manager, chunk_tiles=8):
         """Initialize grid renderer
         
         Args:
             asset_manager: AssetManager instance
+            chunk_tiles: Edge length in tiles of each cached ground chunk at the loaded tile size
         """
         self.asset_manager = asset_manager
+        
+        # Current zoom level's (TileType, weed sprite name or None, variation)
+        # -> opaque surface, each composited the first time a tile needs it
+        self.tile_sprites = {}
+        self.purchasable_sprite = None
+        self._table_evictions = 0
+        
+        # Ground is drawn once into chunk surfaces and patched when tiles change.
+        # Chunks keep the same pixel size at every zoom level, so zoomed out
+        # chunks span more tiles.
+        self.chunk_tiles = chunk_tiles
+        self.chunks = {}  # (chunk_x, chunk_y) -> opaque surface
+        self.chunk_builds = 0
+        self._chunk_span = chunk_tiles
+        self._chunk_tile_size = None
+        self._grid = None
+    
+    def compose_tile(self, state, tile_size):
+        """Get the surface drawn for an owned tile state
+        
+        The grass variation and the tile's weed are flattened onto the
+        clear color, so each owned tile is one opaque blit instead of up to
+        two alpha blits. Any weed sprite works, so new weed types need no
+        changes here, and only the weeds actually on the farm are loaded.
+        
+        Args:
+            state: (TileType, weed sprite name or None, variation)
+            tile_size: Size of each tile in pixels
+            
+        Returns:
+            Opaque surface from the asset manager's composite cache
+        """
+        tile_type, weed_name, variation = state
+        grass_name = f'grass_{variation + 1}'
+        if tile_type is TileType.GRASS:
+            # Grass tiles may keep the type of their last chopped weed
+            return self.asset_manager.get_composite([grass_name], BLACK, tile_size)
+        # Weeds without a type fall back to the basic weed
+        return self.asset_manager.get_composite([grass_name, weed_name or WEED_BASIC.sprite_name], BLACK, tile_size)
     
     def render(self, surface, grid, tile_size, camera_offset):
         """Render the grid to a surface
         
+        The ground is drawn from cached chunk surfaces, one opaque blit per
+        chunk in view. Chunks scrolling into view are built once, chunks
+        well out of view are dropped, and tile changes reported by the grid
+        patch the cached chunks in place (or, for bulk changes, drop them).
+        
         Args:
             surface: Pygame surface to render to
             grid: Grid instance
             tile_size: Size of each tile in pixels
             camera_offset: (x, y) camera offset in pixels
         """
-        for y in range(grid.world_size):
-            for x in range(grid.world_size):
-                tile = grid.tiles[y][x]
-                
-                # Calculate screen position with camera offset
-                screen_x = x * tile_size - camera_offset[0]
-                screen_y = y * tile_size - camera_offset[1]
-                
-                # Render base tile (only owned and purchasable tiles)
-                if tile.tile_type == TileType.GRASS or tile.tile_type == TileType.WEED:
-                    # Use variation based on tile position for visual variety (1-3 to match assets)
-                    variation = ((x + y) % 3) + 1
-                    grass_sprite = f'grass_{variation}'
-                    self.asset_manager.render_sprite(surface, grass_sprite, screen_x, screen_y)
-                elif tile.tile_type == TileType.UNOWNED:
-                    # Only render if purchasable (adjacent to owned tiles)
-                    if self._is_purchasable(grid, x, y):
-                        sprite_name = 'unowned_purchasable'
-                        self.asset_manager.render_sprite(surface, sprite_name, screen_x, screen_y)
-                    # Skip rendering non-purchasable unowned tiles
-                
-                # Render weed overlay on top of grass
-                if tile.tile_type == TileType.WEED:
-                    self.asset_manager.render_sprite(surface, 'weed_basic', screen_x, screen_y)
+        if grid is not self._grid:
+            self._grid = grid
+            grid.add_change_listener(self._on_tile_changed, self._on_region_changed)
+            self.chunks.clear()
+        if tile_size != self._chunk_tile_size:
+            # Zoom level changed: swap to its pre-scaled sprites
+            self._chunk_tile_size = tile_size
+            self.tile_sprites = {}
+            self.purchasable_sprite = self.asset_manager.get_scaled_sprite('unowned_purchasable', tile_size)
+            self._chunk_span = max(self.chunk_tiles, self.chunk_tiles * self.asset_manager.tile_size // tile_size)
+            self.chunks.clear()
+        evictions = self.asset_manager.sprite_budget.evictions
+        if evictions != self._table_evictions:
+            # Let go of composites the sprite budget has evicted; the rest are looked up again
+            self._table_evictions = evictions
+            self.tile_sprites = {}
+        
+        chunk_span = self._chunk_span
+        chunk_pixels = chunk_span * tile_size
+        last_chunk = (grid.world_size - 1) // chunk_span
+        offset_x, offset_y = camera_offset
+        view_width, view_height = surface.get_size()
+        first_x = max(0, offset_x // chunk_pixels)
+        first_y = max(0, offset_y // chunk_pixels)
+        last_x = min(last_chunk, (offset_x + view_width - 1) // chunk_pixels)
+        last_y = min(last_chunk, (offset_y + view_height - 1) // chunk_pixels)
+        
+        chunk_blits = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is None:
+                    chunk = self._build_chunk(grid, chunk_x, chunk_y, tile_size)
+                position = (chunk_x * chunk_pixels - offset_x, chunk_y * chunk_pixels - offset_y)
+                chunk_blits.append((chunk, position))
+        submit_blits(surface, chunk_blits)
+        
+        # Stream out chunks more than one chunk away from the view
+        if len(self.chunks) > len(chunk_blits):
+            for chunk_x, chunk_y in list(self.chunks):
+                if not (first_x - 1 <= chunk_x <= last_x + 1 and first_y - 1 <= chunk_y <= last_y + 1):
+                    del self.chunks[(chunk_x, chunk_y)]
+    
+    def _build_chunk(self, grid, chunk_x, chunk_y, tile_size):
+        """Draw one chunk of tiles onto a new cached surface
+        
+        Args:
+            grid: Grid instance
+            chunk_x, chunk_y: Chunk coordinates
+            tile_size: Size of each tile in pixels
+            
+        Returns:
+            Opaque surface with the chunk's tiles over the clear color
+        """
+        first_x = chunk_x * self._chunk_span
+        first_y = chunk_y * self._chunk_span
+        last_x = min(grid.world_size, first_x + self._chunk_span)
+        last_y = min(grid.world_size, first_y + self._chunk_span)
+        
+        chunk = pygame.Surface(((last_x - first_x) * tile_size, (last_y - first_y) * tile_size))
+        chunk.fill(BLACK)
+        tile_blits = []
+        for y in range(first_y, last_y):
+            for x in range(first_x, last_x):
+                sprite = self._tile_sprite(grid, x, y)
+                if sprite:
+                    tile_blits.append((sprite, ((x - first_x) * tile_size, (y - first_y) * tile_size)))
+        submit_blits(chunk, tile_blits)
+        
+        self.chunks[(chunk_x, chunk_y)] = chunk
+        self.chunk_builds += 1
+        return chunk
+    
+    def _tile_sprite(self, grid, x, y):
+        """Get the surface drawn for a tile
+        
+        Args:
+            grid: Grid instance
+            x, y: Tile coordinates
+            
+        Returns:
+            Surface, or None for tiles left at the clear color
+        """
+        tile = grid.tiles[y][x]
+        if tile.tile_type is TileType.UNOWNED:
+            # Only render if purchasable (adjacent to owned tiles)
+            if self._is_purchasable(grid, x, y):
+                return self.purchasable_sprite
+            return None
+        # Grass (with its weed already composited), varied by position
+        weed = tile.weed_type
+        state = (tile.tile_type, weed.sprite_name if weed else None, (x + y) % GRASS_VARIATIONS)
+        sprite = self.tile_sprites.get(state)
+        if sprite is None:
+            sprite = self.tile_sprites[state] = self.compose_tile(state, self._chunk_tile_size)
+        return sprite
+    
+    def _on_tile_changed(self, x, y):
+        """Redraw a changed tile and its neighbours in any cached chunk
+        
+        Neighbours are included because buying a tile changes which
+        unowned tiles next to it are purchasable.
+        
+        Args:
+            x, y: Tile coordinates
+        """
+        if not self.chunks:
+            return
+        grid = self._grid
+        tile_size = self._chunk_tile_size
+        chunk_span = self._chunk_span
+        for tile_x, tile_y in ((x, y), (x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if not (0 <= tile_x < grid.world_size and 0 <= tile_y < grid.world_size):
+                continue
+            chunk = self.chunks.get((tile_x // chunk_span, tile_y // chunk_span))
+            if chunk is None:
+                continue
+            position = ((tile_x % chunk_span) * tile_size, (tile_y % chunk_span) * tile_size)
+            chunk.fill(BLACK, (position, (tile_size, tile_size)))
+            sprite = self._tile_sprite(grid, tile_x, tile_y)
+            if sprite:
+                chunk.blit(sprite, position)
+    
+    def _on_region_changed(self, tiles):
+        """Drop the cached chunks holding any changed tile or its neighbours
+        
+        They are rebuilt in one pass each when next in view, instead of
+        being patched tile by tile.
+        
+        Args:
+            tiles: List of (x, y) tile coordinates
+        """
+        if not self.chunks:
+            return
+        chunk_span = self._chunk_span
+        stale = set()
+        for x, y in tiles:
+            stale.update((
+                ((x - 1) // chunk_span, y // chunk_span),
+                ((x + 1) // chunk_span, y // chunk_span),
+                (x // chunk_span, (y - 1) // chunk_span),
+                (x // chunk_span, (y + 1) // chunk_span),
+            ))
+        for key in stale:
+            self.chunks.pop(key, None)
     
     def _is_purchasable(self, grid, x, y):
         """Check if an unowned tile is purchasable (adjacent to owned tiles)
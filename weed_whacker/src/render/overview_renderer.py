@@ -0,0 +1,211 @@
+"""
+Overview rendering module
+"""
+
+import pygame
+
+from ..constants.colors import OVERVIEW_PLAYER_MARKER
+from ..game.grid import TileType, CODE_GRASS
+from .grid_renderer import GRASS_VARIATIONS
+
+
+class OverviewRenderer:
+    """Renders the grid at one or a few pixels per tile for extreme zoom-out
+
+    The whole grid is kept as a surface with one pixel per tile, built once
+    from the grid's tile code array and patched when the grid reports a
+    changed tile.
+    Each frame only the visible part is blitted (or scaled up with nearest
+    neighbour), so the cost follows the view size, not the farm size.
+    """
+
+    def __init__(self, grid_renderer):
+        """Initialize overview renderer
+
+        Args:
+            grid_renderer: GridRenderer whose tile sprites give the overview colors
+        """
+        # Each tile state is drawn in the average color of its sprite, worked out on first use
+        self.grid_renderer = grid_renderer
+        self.colors = {}  # (TileType, weed sprite name or None, variation) -> RGB bytes
+        self.purchasable_color = self._average_color(
+            grid_renderer.asset_manager.get_scaled_sprite('unowned_purchasable', grid_renderer.asset_manager.tile_size)
+        )
+        self.empty_color = bytes(3)
+
+        self.tiles_surface = None  # One pixel per tile
+        self.builds = 0
+        self._grid = None
+        self._revision = 0
+        self._view = None
+        self._view_key = None
+
+    @staticmethod
+    def _average_color(sprite):
+        if sprite is None:
+            return bytes(3)
+        return bytes(pygame.transform.average_color(sprite)[:3])
+
+    def _state_color(self, state):
+        """Get the overview color of an owned tile state
+
+        Args:
+            state: (TileType, weed sprite name or None, variation)
+
+        Returns:
+            RGB bytes
+        """
+        color = self.colors.get(state)
+        if color is None:
+            sprite = self.grid_renderer.compose_tile(state, self.grid_renderer.asset_manager.tile_size)
+            color = self.colors[state] = self._average_color(sprite)
+        return color
+
+    def render(self, surface, grid, tile_size, camera_offset):
+        """Render the visible part of the grid
+
+        Args:
+            surface: Pygame surface to render to
+            grid: Grid instance
+            tile_size: Pixels per tile (small, typically 1-4)
+            camera_offset: (x, y) camera offset in pixels
+        """
+        if grid is not self._grid:
+            self._grid = grid
+            grid.add_change_listener(self._on_tile_changed, self._on_region_changed)
+            self._build(grid)
+
+        offset_x, offset_y = camera_offset
+        view_width, view_height = surface.get_size()
+        first_x = max(0, offset_x // tile_size)
+        first_y = max(0, offset_y // tile_size)
+        last_x = min(grid.world_size, -(-(offset_x + view_width) // tile_size))
+        last_y = min(grid.world_size, -(-(offset_y + view_height) // tile_size))
+        if first_x >= last_x or first_y >= last_y:
+            return
+
+        # Rescale only when the visible tiles, the zoom or the grid changed
+        view_key = (first_x, first_y, last_x, last_y, tile_size, self._revision)
+        if view_key != self._view_key:
+            region = self.tiles_surface.subsurface((first_x, first_y, last_x - first_x, last_y - first_y))
+            if tile_size == 1:
+                self._view = region
+            else:
+                self._view = pygame.transform.scale(region, (region.get_width() * tile_size, region.get_height() * tile_size))
+            self._view_key = view_key
+        surface.blit(self._view, (first_x * tile_size - offset_x, first_y * tile_size - offset_y))
+
+    def render_player_marker(self, surface, player, tile_size, camera_offset):
+        """Outline the player's tile so it stays visible when tiles are a few pixels wide
+
+        Args:
+            surface: Pygame surface to render to
+            player: Player instance
+            tile_size: Pixels per tile
+            camera_offset: (x, y) camera offset in pixels
+        """
+        margin = 2
+        screen_x = player.x * tile_size - camera_offset[0] - margin
+        screen_y = player.y * tile_size - camera_offset[1] - margin
+        size = tile_size + margin * 2
+        pygame.draw.rect(surface, OVERVIEW_PLAYER_MARKER, (screen_x, screen_y, size, size), 1)
+
+    def _build(self, grid):
+        """Draw every tile's pixel from the grid's tile codes
+
+        Each tile's palette index is its tile code and grass variation,
+        produced a row phase at a time with bytes.translate, then the
+        purchasable frontier is marked. Python only loops over rows and
+        frontier tiles, never over every tile.
+
+        Args:
+            grid: Grid instance
+        """
+        size = grid.world_size
+        codes = grid.tile_codes
+        weed_names = {code: name for name, code in grid.weed_codes.items()}
+        states = max(weed_names, default=CODE_GRASS) + 1
+        purchasable_index = states * GRASS_VARIATIONS
+        if purchasable_index > 255:
+            raise ValueError('too many weed types for an 8-bit overview palette')
+
+        # Palette index = tile code * GRASS_VARIATIONS + variation
+        palette = [self.empty_color] * 256
+        translations = []
+        for variation in range(GRASS_VARIATIONS):
+            palette[CODE_GRASS * GRASS_VARIATIONS + variation] = self._state_color((TileType.GRASS, None, variation))
+            for code, name in weed_names.items():
+                palette[code * GRASS_VARIATIONS + variation] = self._state_color((TileType.WEED, name, variation))
+            translations.append(bytes(
+                code * GRASS_VARIATIONS + variation if code < states else 0 for code in range(256)
+            ))
+        palette[purchasable_index] = self.purchasable_color
+
+        # (x + y) % GRASS_VARIATIONS is constant along every third tile of a row
+        indexes = bytearray(size * size)
+        for y in range(size):
+            row_start = y * size
+            row_end = row_start + size
+            for variation, translation in enumerate(translations):
+                first = row_start + (variation - y) % GRASS_VARIATIONS
+                indexes[first:row_end:GRASS_VARIATIONS] = codes[first:row_end:GRASS_VARIATIONS].translate(translation)
+        for x, y in grid.frontier:
+            indexes[y * size + x] = purchasable_index
+
+        tiles_surface = pygame.image.frombytes(bytes(indexes), (size, size), 'P')
+        tiles_surface.set_palette([tuple(color) for color in palette])
+        self.tiles_surface = tiles_surface.convert()
+        self.builds += 1
+        self._revision += 1
+
+    def _tile_color(self, grid, x, y):
+        """Get the overview color of a single tile
+
+        Args:
+            grid: Grid instance
+            x, y: Tile coordinates
+
+        Returns:
+            RGB bytes
+        """
+        tile = grid.tiles[y][x]
+        if tile.is_owned():
+            weed = tile.weed_type
+            return self._state_color((tile.tile_type, weed.sprite_name if weed else None, (x + y) % GRASS_VARIATIONS))
+        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            neighbor = grid.get_tile(x + dx, y + dy)
+            if neighbor and neighbor.is_owned():
+                return self.purchasable_color
+        return self.empty_color
+
+    def _on_tile_changed(self, x, y):
+        """Repaint a changed tile and its neighbours
+
+        Args:
+            x, y: Tile coordinates
+        """
+        if self.tiles_surface is None:
+            return
+        grid = self._grid
+        for tile_x, tile_y in ((x, y), (x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if 0 <= tile_x < grid.world_size and 0 <= tile_y < grid.world_size:
+                self.tiles_surface.set_at((tile_x, tile_y), tuple(self._tile_color(grid, tile_x, tile_y)))
+        self._revision += 1
+
+    def _on_region_changed(self, tiles):
+        """Repaint many changed tiles and their neighbours, each tile once
+
+        Args:
+            tiles: List of (x, y) tile coordinates
+        """
+        if self.tiles_surface is None:
+            return
+        grid = self._grid
+        size = grid.world_size
+        dirty = set()
+        for x, y in tiles:
+            dirty.update(((x, y), (x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)))
+        for tile_x, tile_y in dirty:
+            if 0 <= tile_x < size and 0 <= tile_y < size:
+                self.tiles_surface.set_at((tile_x, tile_y), tuple(self._tile_color(grid, tile_x, tile_y)))
+        self._revision += 1
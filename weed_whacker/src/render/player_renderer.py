@@ -5,6 +5,7 @@ Player rendering module
 import pygame
 
 from ..constants.colors import COOLDOWN_COOLING, COOLDOWN_READY, BAR_BG_DARK
+from .batch import submit_blits
 
 
 class PlayerRenderer:
@@ -17,6 +18,7 @@ class PlayerRenderer:
             asset_manager: AssetManager instance
         """
         self.asset_manager = asset_manager
+        self._tool_sprite_ids = {}  # tool key -> sprite id
     
     def render(self, surface, player, tile_size, camera_offset):
         """Render the player sprite
@@ -27,12 +29,46 @@ class PlayerRenderer:
             tile_size: Size of tiles in pixels
             camera_offset: (x, y) camera offset
         """
+        submit_blits(surface, self.get_blits(player, tile_size, camera_offset))
+    
+    def get_blits(self, player, tile_size, camera_offset):
+        """Build the player layer's blit sequence
+        
+        Args:
+            player: Player instance
+            tile_size: Size of tiles in pixels
+            camera_offset: (x, y) camera offset
+            
+        Returns:
+            List of (surface, (x, y)) pairs
+        """
+        # Looked up every frame so the sprite budget sees it in use
+        sprite = self.asset_manager.get_scaled_sprite('player', tile_size)
+        if not sprite:
+            return []
+        
         # Calculate player screen position
         screen_x = player.x * tile_size - camera_offset[0]
         screen_y = player.y * tile_size - camera_offset[1]
+        return [(sprite, (screen_x, screen_y))]
+    
+    def render_workers(self, surface, workers, tile_size, camera_offset):
+        """Render helper workers with one batched blit
         
-        # Render player sprite
-        self.asset_manager.render_sprite(surface, 'player', screen_x, screen_y)
+        Args:
+            surface: Pygame surface to render to
+            workers: Iterable of Worker instances
+            tile_size: Size of tiles in pixels
+            camera_offset: (x, y) camera offset
+        """
+        sprite = self.asset_manager.get_scaled_sprite('worker', tile_size)
+        if not sprite:
+            return
+        offset_x, offset_y = camera_offset
+        submit_blits(surface, [
+            (sprite, (worker.x * tile_size - offset_x, worker.y * tile_size - offset_y))
+            for worker in workers
+        ])
     
     def render_cooldown(self, surface, player, tile_size, camera_offset):
         """Render the chop cooldown bar below the player with tool icon
@@ -48,7 +84,11 @@ class PlayerRenderer:
         player_screen_y = player.y * tile_size - camera_offset[1]
         
         # Get tool sprite
-        tool_sprite = self.asset_manager.get_sprite(player.current_tool)
+        tool_id = self._tool_sprite_ids.get(player.current_tool)
+        if tool_id is None:
+            tool_id = self.asset_manager.sprite_id(player.current_tool)
+            self._tool_sprite_ids[player.current_tool] = tool_id
+        tool_sprite = self.asset_manager.get_sprite_by_id(tool_id) if tool_id is not None else None
         icon_size = tool_sprite.get_width() if tool_sprite else 8
         
         # Position bar at bottom of player tile
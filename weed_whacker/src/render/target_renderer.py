@@ -0,0 +1,81 @@
+"""
+Chop target preview rendering module
+"""
+
+import pygame
+
+from ..constants.colors import TARGET_FILL, TARGET_BORDER
+from ..game.tools import TOOLS
+
+
+class TargetRenderer:
+    """Draws the current tool's reach around the tile under the mouse"""
+
+    # Alpha of the preview when the hovered tile is out of chopping range
+    OUT_OF_RANGE_ALPHA = 90
+
+    def __init__(self):
+        """Initialize target renderer"""
+        self._stencils = {}  # tile size -> {tool key: (surface, (offset_x, offset_y))}
+
+    def render(self, surface, tool_key, target, tile_size, camera_offset, in_range):
+        """Render the reach preview with one blit
+
+        Args:
+            surface: Pygame surface to render to
+            tool_key: Key into TOOLS of the equipped tool
+            target: (x, y) hovered tile coordinates
+            tile_size: Size of tiles in pixels
+            camera_offset: (x, y) camera offset
+            in_range: Whether the player can chop at target
+        """
+        stencil, (offset_x, offset_y) = self.get_stencil(tool_key, tile_size)
+        stencil.set_alpha(255 if in_range else self.OUT_OF_RANGE_ALPHA)
+        surface.blit(stencil, (
+            target[0] * tile_size - camera_offset[0] + offset_x,
+            target[1] * tile_size - camera_offset[1] + offset_y
+        ))
+
+    def get_stencil(self, tool_key, tile_size):
+        """Get a tool's pre-rendered reach footprint
+
+        The stencils for every tool in TOOLS are drawn together the first
+        time a tile size is used.
+
+        Args:
+            tool_key: Key into TOOLS
+            tile_size: Size of tiles in pixels
+
+        Returns:
+            Tuple of (SRCALPHA surface, (x, y) pixel offset of its top-left
+            corner from the target tile)
+        """
+        stencils = self._stencils.get(tile_size)
+        if stencils is None:
+            stencils = self._stencils[tile_size] = {
+                key: self._build_stencil(tool.reach, tile_size) for key, tool in TOOLS.items()
+            }
+        return stencils[tool_key]
+
+    @staticmethod
+    def _build_stencil(reach, tile_size):
+        """Draw a reach footprint: a tinted, outlined square per reached tile
+
+        Args:
+            reach: List of (dx, dy) tile offsets from the target
+            tile_size: Size of tiles in pixels
+
+        Returns:
+            Tuple of (SRCALPHA surface, (x, y) pixel offset from the target tile)
+        """
+        min_dx = min(dx for dx, _ in reach)
+        min_dy = min(dy for _, dy in reach)
+        width = max(dx for dx, _ in reach) - min_dx + 1
+        height = max(dy for _, dy in reach) - min_dy + 1
+
+        stencil = pygame.Surface((width * tile_size, height * tile_size), pygame.SRCALPHA)
+        for dx, dy in reach:
+            rect = ((dx - min_dx) * tile_size, (dy - min_dy) * tile_size, tile_size, tile_size)
+            stencil.fill(TARGET_FILL, rect)
+            pygame.draw.rect(stencil, TARGET_BORDER, rect, 1)
+        return stencil, (min_dx * tile_size, min_dy * tile_size)
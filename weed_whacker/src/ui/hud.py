@@ -2,26 +2,51 @@
 Weed Whacker - HUD and UI Rendering
 """
 
+import math
+
 import pygame # type: ignore
-from pathlib import Path
 from ..constants.colors import (
     PANEL_BG, PANEL_BORDER, UI_TEXT, UI_TEXT_SHADOW, UI_LABEL,
     COOLDOWN_COOLING, COOLDOWN_READY,
     AFFORDABLE, AFFORDABLE_DARK, UNAFFORDABLE, UNAFFORDABLE_DARK,
-    HIGHLIGHT_ACTIVE, HIGHLIGHT_INACTIVE,
+    HIGHLIGHT_ACTIVE, HIGHLIGHT_INACTIVE, WEED_ARROW,
     FALLBACK_ICON, BAR_BG, BAR_BORDER,
     STORE_ICON_FALLBACK, STORE_INSTRUCTION, INNER_HIGHLIGHT,
     WHITE
 )
+from .shared import get_text_cache, RetainedPanel, GlyphAtlas
+from ..render.batch import submit_blits
 
 
 class UI:
     """Handles HUD rendering and display"""
 
+    HUD_MARGIN = 12
+    PANEL_PADDING = 8
+    ARROW_SIZE = 24
+    ARROW_MARGIN = 48
+    ARROW_ANGLE_STEP = 5  # degrees; arrows are pre-rotated to these steps
+
     def __init__(self):
         """Initialize UI"""
         self.font = None
         self.selected_purchase_index = 0
+        self.text_cache = get_text_cache()
+        self._asset_manager = None
+        
+        # Retained HUD panels, redrawn only when their inputs change
+        self._money_panel = RetainedPanel(self._build_money_panel)
+        self._tiles_panel = RetainedPanel(self._build_tiles_panel)
+        self._tool_panel = RetainedPanel(self._build_tool_panel)
+        self._tool_bar = RetainedPanel(self._build_tool_bar)
+        self._event_panel = RetainedPanel(self._build_event_panel)
+        self._event_bar = RetainedPanel(self._build_event_bar)
+        self._purchase_panel = RetainedPanel(self._build_purchase_panel)
+        self._region_panel = RetainedPanel(self._build_region_panel)
+        self._tool_bar_rect = (0, 0, 0, 0)
+        self._event_bar_rect = (0, 0, 0, 0)
+        self._highlights = {}  # (tile_size, is_selected) -> outline stencil
+        self._arrows = {}  # angle step -> rotated arrow surface
         self._init_font()
 
     def _init_font(self):
@@ -30,46 +55,18 @@ class UI:
             pygame.font.init()
         self.font = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 18)
-
-    def _wrap_text(self, text, font, max_width):
-        """Wrap text to fit within a specific width
         
-        Args:
-            text: String to wrap
-            font: Pygame font object
-            max_width: Maximum width in pixels
-            
-        Returns:
-            List of strings, each fitting within max_width
-        """
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            current_line.append(word)
-            test_line = ' '.join(current_line)
-            width, _ = font.size(test_line)
-            
-            if width > max_width:
-                # Word is too long, push it to the next line
-                if len(current_line) > 1:
-                    current_line.pop()
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Single word is longer than max_width, just add it
-                    lines.append(' '.join(current_line))
-                    current_line = []
-                    
-        if current_line:
-            lines.append(' '.join(current_line))
-            
-        return lines
+        # Bitmap glyphs for the counters that change every frame
+        self.money_glyphs = GlyphAtlas(self.font, UI_TEXT, shadow=UI_TEXT_SHADOW)
+        self.income_glyphs = GlyphAtlas(self.font_small, AFFORDABLE)
+        self.count_glyphs = GlyphAtlas(self.font, UI_TEXT)
 
     def render_hud(self, surface, money, income_rate, owned_tiles, player, asset_manager=None, event_manager=None, internal_width=0):
         """Render the heads-up display
         
+        Each panel is a retained surface that is only redrawn when the
+        values it shows change, so a steady HUD costs a few blits per frame.
+        
         Args:
             surface: Pygame surface to render to
             money: Current money (integer)
@@ -80,288 +77,349 @@ class UI:
             event_manager: EventManager instance (for event info)
             internal_width: Screen width
         """
-        # HUD styling
-        panel_bg = PANEL_BG
-        panel_border = PANEL_BORDER
-        text_color = UI_TEXT
-        text_shadow = UI_TEXT_SHADOW
-        label_color = UI_LABEL
-        
-        margin = 12
-        panel_padding = 8
+        if asset_manager:
+            self._asset_manager = asset_manager
+        
+        margin = self.HUD_MARGIN
         panel_spacing = 6  # Small gap between stacked panels
         y_pos = margin
         
         # === MONEY PANEL (top left) ===
-        money_panel_x = margin
-        money_text = f"${int(money)}"
-        income_text = f"+${income_rate:.2f}/sec"
+        money_panel = self._money_panel.get(int(money), f"+${income_rate:.2f}/sec")
+        surface.blit(money_panel, (margin, y_pos))
+        money_panel_width, money_panel_height = money_panel.get_size()
         
-        money_surface = self.font.render(money_text, True, text_color)
-        income_surface = self.font_small.render(income_text, True, AFFORDABLE)
+        # === TILES PANEL (below money, vertically stacked, matching its size) ===
+        tiles_panel = self._tiles_panel.get(owned_tiles, money_panel_width, money_panel_height)
+        surface.blit(tiles_panel, (margin, y_pos + money_panel_height + panel_spacing))
         
-        money_panel_width = max(money_surface.get_width(), income_surface.get_width()) + panel_padding * 2 + 64
-        money_panel_height = money_surface.get_height() + income_surface.get_height() + panel_padding * 2 + 2
+        # === TOOL PANEL (right side, spans full height of money + tiles + gap) ===
+        if player and asset_manager:
+            tool_panel_x = margin + money_panel_width + 10
+            tool_panel_height = money_panel_height + panel_spacing + money_panel_height
+            current_uses = player.tool_uses.get(player.current_tool, 0)
+            
+            tool_panel = self._tool_panel.get(player.current_tool, current_uses, tool_panel_height)
+            surface.blit(tool_panel, (tool_panel_x, y_pos))
+            
+            # Cooldown bar only redraws when its fill moves by a whole pixel
+            bar_x, bar_y, bar_width, bar_height = self._tool_bar_rect
+            fill_width, cooling = self._tool_bar_fill(player)
+            bar = self._tool_bar.get(bar_width, bar_height, fill_width, cooling)
+            surface.blit(bar, (tool_panel_x + bar_x, y_pos + bar_y))
+            
+        # === EVENT PANEL (top right) ===
+        if event_manager and internal_width > 0:
+            current_event = event_manager.current_event
+            event_panel = self._event_panel.get(current_event.id)
+            event_panel_x = internal_width - event_panel.get_width() - margin
+            surface.blit(event_panel, (event_panel_x, margin))
+            
+            bar_x, bar_y, bar_width, bar_height = self._event_bar_rect
+            bar = self._event_bar.get(bar_width, bar_height, self._event_bar_fill(event_manager), current_event.duration <= 0)
+            surface.blit(bar, (event_panel_x + bar_x, margin + bar_y))
+
+    def get_hud_key(self, money, income_rate, owned_tiles, player, event_manager=None):
+        """Get a summary of everything the HUD shows
         
-        self._draw_panel(surface, money_panel_x, y_pos, money_panel_width, money_panel_height, panel_bg, panel_border)
+        The key changes exactly when render_hud would draw something
+        different, so callers can tell whether a frame containing the HUD
+        can be reused.
         
-        # Money icon (gold coin)
-        assets_dir = Path(__file__).parent.parent.parent / 'assets' / 'sprites' / 'objects'
-        coin_path = assets_dir / 'coin.png'
+        Args:
+            money: Current money (integer)
+            income_rate: Income per second (float)
+            owned_tiles: Total owned tiles
+            player: Player instance (for tool info)
+            event_manager: EventManager instance (for event info)
+            
+        Returns:
+            Hashable tuple
+        """
+        key = (int(money), f"+${income_rate:.2f}/sec", owned_tiles)
+        if player:
+            key += (player.current_tool, player.tool_uses.get(player.current_tool, 0), self._tool_bar_fill(player))
+        if event_manager:
+            key += (event_manager.current_event.id, self._event_bar_fill(event_manager))
+        return key
+
+    def _tool_bar_fill(self, player):
+        """Get the cooldown bar's fill width in pixels and whether it is cooling down"""
+        bar_width = self._tool_bar_rect[2]
+        cooldown_percent = player.get_chop_cooldown_percent()
+        if cooldown_percent > 0:
+            return int(bar_width * cooldown_percent), True
+        return bar_width, False
+
+    def _event_bar_fill(self, event_manager):
+        """Get the event progress bar's fill width in pixels"""
+        bar_width = self._event_bar_rect[2]
+        if event_manager.current_event.duration <= 0:
+            return bar_width
+        return int(bar_width * event_manager.get_progress_percent())
+
+    def _build_money_panel(self, money, income_text):
+        """Build the money panel surface
+        
+        Args:
+            money: Whole-dollar money value
+            income_text: Formatted income rate
+        """
+        panel_padding = self.PANEL_PADDING
+        icon_size = 36
         
-        icon_size = 36 
-        coin_x = money_panel_x + panel_padding + 8
-        coin_y = y_pos + (money_panel_height - icon_size) // 2
+        money_text = f"${money}"
+        money_width, money_height = self.money_glyphs.size(money_text)
+        income_width, income_height = self.income_glyphs.size(income_text)
         
-        if coin_path.exists():
-            original_coin = pygame.image.load(str(coin_path)).convert_alpha()
-            scaled_coin = pygame.transform.smoothscale(original_coin, (icon_size, icon_size))
-            surface.blit(scaled_coin, (coin_x, coin_y))
+        width = max(money_width, income_width) + panel_padding * 2 + 64
+        height = money_height + income_height + panel_padding * 2 + 2
+        panel = self._create_panel(width, height)
+        
+        # Money icon (gold coin)
+        coin_x = panel_padding + 8
+        coin_y = (height - icon_size) // 2
+        coin = self._load_icon('objects', 'coin', icon_size)
+        if coin:
+            panel.blit(coin, (coin_x, coin_y))
         
         # Money text with shadow (aligned with tiles text)
         text_x = coin_x + icon_size + 12
-        text_y = y_pos + panel_padding
-        surface.blit(self.font.render(money_text, True, text_shadow), (text_x + 1, text_y + 1))
-        surface.blit(money_surface, (text_x, text_y))
+        text_y = panel_padding
+        self.money_glyphs.render_to(panel, money_text, (text_x, text_y))
         
         # Income text
-        surface.blit(income_surface, (text_x, text_y + money_surface.get_height() + 2))
-        
-        # === TILES PANEL (below money, vertically stacked) ===
-        tiles_panel_x = money_panel_x  # Same x position as money panel
-        tiles_panel_y = y_pos + money_panel_height + panel_spacing  # Below money with small gap
-        tiles_label = str(owned_tiles)
-        tiles_text = "Owned Tiles"
-        
-        tiles_label_surface = self.font.render(tiles_label, True, text_color)
-        tiles_surface = self.font_small.render(tiles_text, True, label_color)
+        self.income_glyphs.render_to(panel, income_text, (text_x, text_y + money_height + 2))
+        return panel
+
+    def _build_tiles_panel(self, owned_tiles, width, height):
+        """Build the owned tiles panel surface
         
-        tiles_panel_width = money_panel_width  # Match money panel width
-        tiles_panel_height = money_panel_height  # Match money panel height
+        Args:
+            owned_tiles: Total owned tiles
+            width, height: Panel dimensions (matches the money panel)
+        """
+        panel_padding = self.PANEL_PADDING
+        icon_size = 36
+        panel = self._create_panel(width, height)
         
-        self._draw_panel(surface, tiles_panel_x, tiles_panel_y, tiles_panel_width, tiles_panel_height, panel_bg, panel_border)
+        tiles_surface = self.text_cache.render(self.font_small, "Owned Tiles", UI_LABEL)
         
         # Tile icon
-        tile_path = assets_dir / 'tile.png'
-        tile_icon_x = tiles_panel_x + panel_padding + 8
-        tile_icon_y = tiles_panel_y + (tiles_panel_height - icon_size) // 2
-        
-        if tile_path.exists():
-            original_tile = pygame.image.load(str(tile_path)).convert_alpha()
-            scaled_tile = pygame.transform.smoothscale(original_tile, (icon_size, icon_size))
-            surface.blit(scaled_tile, (tile_icon_x, tile_icon_y))
+        tile_icon_x = panel_padding + 8
+        tile_icon_y = (height - icon_size) // 2
+        tile_icon = self._load_icon('objects', 'tile', icon_size)
+        if tile_icon:
+            panel.blit(tile_icon, (tile_icon_x, tile_icon_y))
         
         # Tiles text
         text_x = tile_icon_x + icon_size + 12
-        text_y = tiles_panel_y + panel_padding
-        surface.blit(tiles_label_surface, (text_x, text_y))
-        surface.blit(tiles_surface, (text_x, text_y + tiles_label_surface.get_height() + 2))
+        text_y = panel_padding
+        label_rect = self.count_glyphs.render_to(panel, str(owned_tiles), (text_x, text_y))
+        panel.blit(tiles_surface, (text_x, text_y + label_rect.height + 2))
+        return panel
+
+    def _build_tool_panel(self, tool_key, current_uses, height):
+        """Build the equipped tool panel surface (everything but the cooldown fill)
         
-        # === TOOL PANEL (right side, spans full height of money + tiles + gap) ===
-        if player and asset_manager:
-            from ..game.tools import get_tool
-            from ...config import TILE_SIZE
-            
-            tool = get_tool(player.current_tool)
-            
-            # Tool panel positioned to right of money/tiles stack
-            tool_panel_x = money_panel_x + money_panel_width + 10
-            tool_panel_y = y_pos
-            
-            # Calculate total height: money + gap + tiles
-            total_left_height = money_panel_height + panel_spacing + tiles_panel_height
-            
-            # Tool panel dimensions
-            tool_panel_width = 300  # Wider to accommodate inventory instruction
-            tool_panel_height = total_left_height  # Spans full height of left panels
-            
-            self._draw_panel(surface, tool_panel_x, tool_panel_y, tool_panel_width, tool_panel_height, panel_bg, panel_border)
-            
-            # Tool icon - scale to fill panel height snugly (with small padding)
-            icon_size = tool_panel_height - (panel_padding * 2) - 20  # Make room for instruction text at bottom
-            icon_x = tool_panel_x + panel_padding
-            icon_y = tool_panel_y + panel_padding
-            
-            # Load tool sprite at original high resolution for crisp rendering
-            tool_sprite_path = Path(__file__).parent.parent.parent / 'assets' / 'sprites' / 'tools' / f'{player.current_tool}.png'
-            
-            if tool_sprite_path.exists():
-                # Load original high-res PNG
-                original_sprite = pygame.image.load(str(tool_sprite_path)).convert_alpha()
-                # Convert with alpha to preserve transparency
-                original_sprite = original_sprite.convert_alpha()
-                # Scale down from original for crisp rendering
-                scaled_sprite = pygame.transform.smoothscale(original_sprite, (icon_size, icon_size))
-                surface.blit(scaled_sprite, (icon_x, icon_y))
-            else:
-                # Fallback: try asset manager or draw simple icon
-                tool_sprite = asset_manager.get_sprite(player.current_tool)
-                if tool_sprite:
-                    scaled_sprite = pygame.transform.smoothscale(tool_sprite, (icon_size, icon_size))
-                    surface.blit(scaled_sprite, (icon_x, icon_y))
-                else:
-                    fallback_size = icon_size // 2
-                    pygame.draw.rect(surface, FALLBACK_ICON, (icon_x + icon_size//4, icon_y + icon_size//4, fallback_size, fallback_size))
-            
-            # Tool name
-            tool_name_surface = self.font.render(tool.name, True, text_color)
-            text_x = icon_x + icon_size + 10
-            text_y = tool_panel_y + panel_padding + 4
-            surface.blit(self.font.render(tool.name, True, text_shadow), (text_x + 1, text_y + 1))
-            surface.blit(tool_name_surface, (text_x, text_y))
-            
-            # Cooldown bar (wider to fit nicely in panel)
-            bar_x = text_x
-            bar_y = text_y + tool_name_surface.get_height() + 6
-            bar_width = tool_panel_width - (text_x - tool_panel_x) - panel_padding
-            bar_height = 12
-            
-            # Cooldown percentage
-            cooldown_percent = player.get_chop_cooldown_percent()
-            
-            # Bar background with border
-            pygame.draw.rect(surface, BAR_BG, (bar_x, bar_y, bar_width, bar_height))
-            pygame.draw.rect(surface, BAR_BORDER, (bar_x, bar_y, bar_width, bar_height), 1)
-            
-            # Fill bar
-            if cooldown_percent > 0:
-                # Cooling down - red
-                fill_color = COOLDOWN_COOLING
-                fill_width = int(bar_width * cooldown_percent)
-            else:
-                # Ready - bright green
-                fill_color = COOLDOWN_READY
-                fill_width = bar_width
-            
-            if fill_width > 0:
-                pygame.draw.rect(surface, fill_color, (bar_x + 1, bar_y + 1, fill_width - 2, bar_height - 2))
-                # Add highlight for 3D effect
-                highlight_color = tuple(min(255, c + 40) for c in fill_color)
-                pygame.draw.rect(surface, highlight_color, (bar_x + 1, bar_y + 1, fill_width - 2, 2))
-            
-            # Tool usage counter below cooldown bar
-            current_uses = player.tool_uses.get(player.current_tool, 0)
-            usage_text = f"Tool Used: {current_uses}"
-            usage_surface = self.font_small.render(usage_text, True, label_color)
-            usage_y = bar_y + bar_height + 6
-            surface.blit(usage_surface, (text_x, usage_y))
-            
-            # Inventory Instruction Text
-            inv_inst_text = "Press 'I' to open your inventory"
-            inv_inst_surface = self.font_small.render(inv_inst_text, True, STORE_INSTRUCTION)
-            inst_x = tool_panel_x + (tool_panel_width - inv_inst_surface.get_width()) // 2
-            inst_y = tool_panel_y + tool_panel_height - inv_inst_surface.get_height() - panel_padding + 4
-            surface.blit(inv_inst_surface, (inst_x, inst_y))
-            
-        # === EVENT PANEL (top right) ===
-        if event_manager and internal_width > 0:
-            current_event = event_manager.current_event
-            
-            # Event panel dimensions
-            event_panel_width = 280
-            
-            # Text surfaces
-            title_surface = self.font.render(current_event.name, True, text_color)
-            
-            # Prepare description lines
-            desc_max_width = event_panel_width - (panel_padding * 2)
-            desc_lines = self._wrap_text(current_event.description, self.font_small, desc_max_width)
-            
-            # Text height (title + gap + bar)
-            bar_height = 12
-            top_area_height = title_surface.get_height() + 6 + bar_height
-            
-            # Icon dimensions
-            icon_size = 48
-            
-            # Calculate height needed for the top area (icon vs text)
-            top_section_height = max(icon_size, top_area_height)
-            
-            # Calculate height needed for description
-            desc_line_height = self.font_small.get_linesize()
-            desc_total_height = len(desc_lines) * desc_line_height
-            
-            # Total panel height (padding + top section + gap + desc section + padding)
-            desc_gap = 10
-            event_panel_height = panel_padding + top_section_height + desc_gap + desc_total_height + panel_padding
-            
-            event_panel_x = internal_width - event_panel_width - margin
-            event_panel_y = margin
-            
-            self._draw_panel(surface, event_panel_x, event_panel_y, event_panel_width, event_panel_height, panel_bg, panel_border)
-            
-            # Draw Event Icon
-            event_icon_x = event_panel_x + panel_padding
-            event_icon_y = event_panel_y + panel_padding
-            
-            # Try to load the event icon
-            event_icon_path = Path(__file__).parent.parent.parent / 'assets' / 'sprites' / 'events' / f'{current_event.icon_name}.png'
-            
-            if event_icon_path.exists():
-                original_icon = pygame.image.load(str(event_icon_path)).convert_alpha()
-                scaled_icon = pygame.transform.smoothscale(original_icon, (icon_size, icon_size))
-                surface.blit(scaled_icon, (event_icon_x, event_icon_y))
-            else:
-                # Placeholder for icon if missing
-                pygame.draw.rect(surface, FALLBACK_ICON, (event_icon_x, event_icon_y, icon_size, icon_size), border_radius=8)
-            
-            # Draw Texts
-            text_x = event_icon_x + icon_size + 12
-            start_text_y = event_panel_y + panel_padding
-            
-            # Title
-            surface.blit(self.font.render(current_event.name, True, text_shadow), (text_x + 1, start_text_y + 1))
-            surface.blit(title_surface, (text_x, start_text_y))
-            
-            # Cooldown bar
-            bar_y = start_text_y + title_surface.get_height() + 6
-            bar_width = event_panel_width - (text_x - event_panel_x) - panel_padding
-            
-            pygame.draw.rect(surface, BAR_BG, (text_x, bar_y, bar_width, bar_height))
-            pygame.draw.rect(surface, BAR_BORDER, (text_x, bar_y, bar_width, bar_height), 1)
-            
-            # If infinite (duration <= 0), show full bar (deactivated state)
-            if current_event.duration <= 0:
-                fill_color = (100, 200, 255) # A nice deactivated/infinite color
-                pygame.draw.rect(surface, fill_color, (text_x + 1, bar_y + 1, bar_width - 2, bar_height - 2))
-                highlight_color = tuple(min(255, c + 40) for c in fill_color)
-                pygame.draw.rect(surface, highlight_color, (text_x + 1, bar_y + 1, bar_width - 2, 2))
-            else:
-                progress = event_manager.get_progress_percent()
-                if progress > 0:
-                    fill_color = COOLDOWN_COOLING
-                    fill_width = int(bar_width * progress)
-                    pygame.draw.rect(surface, fill_color, (text_x + 1, bar_y + 1, fill_width - 2, bar_height - 2))
-                    highlight_color = tuple(min(255, c + 40) for c in fill_color)
-                    pygame.draw.rect(surface, highlight_color, (text_x + 1, bar_y + 1, fill_width - 2, 2))
-            
-            # Draw Description lines below everything else
-            desc_y = event_panel_y + panel_padding + top_section_height + desc_gap
-            for line in desc_lines:
-                desc_surface = self.font_small.render(line, True, label_color)
-                surface.blit(desc_surface, (event_panel_x + panel_padding, desc_y))
-                desc_y += desc_line_height
+        Args:
+            tool_key: Key of the equipped tool
+            current_uses: Times the equipped tool has been used
+            height: Panel height (spans the money and tiles panels)
+        """
+        from ..game.tools import get_tool
+        
+        tool = get_tool(tool_key)
+        panel_padding = self.PANEL_PADDING
+        width = 300  # Wider to accommodate inventory instruction
+        panel = self._create_panel(width, height)
+        
+        # Tool icon - scale to fill panel height snugly (with small padding)
+        icon_size = height - (panel_padding * 2) - 20  # Make room for instruction text at bottom
+        icon_x = panel_padding
+        icon_y = panel_padding
+        
+        # Prefer the original high resolution PNG for crisp rendering
+        tool_icon = self._load_icon('tools', tool_key, icon_size)
+        if tool_icon is None and self._asset_manager:
+            # Fallback: scale the asset manager sprite
+            tool_sprite = self._asset_manager.get_sprite(tool_key)
+            if tool_sprite:
+                tool_icon = pygame.transform.smoothscale(tool_sprite, (icon_size, icon_size))
+        if tool_icon:
+            panel.blit(tool_icon, (icon_x, icon_y))
+        else:
+            fallback_size = icon_size // 2
+            pygame.draw.rect(panel, FALLBACK_ICON, (icon_x + icon_size//4, icon_y + icon_size//4, fallback_size, fallback_size))
+        
+        # Tool name
+        tool_name_surface = self.text_cache.render(self.font, tool.name, UI_TEXT, shadow=UI_TEXT_SHADOW)
+        text_x = icon_x + icon_size + 10
+        text_y = panel_padding + 4
+        panel.blit(tool_name_surface, (text_x, text_y))
+        
+        # Cooldown bar slot (wider to fit nicely in panel); the fill is its own retained surface
+        bar_y = text_y + tool_name_surface.get_height() + 6
+        bar_width = width - text_x - panel_padding
+        bar_height = 12
+        self._tool_bar_rect = (text_x, bar_y, bar_width, bar_height)
+        
+        # Tool usage counter below cooldown bar
+        usage_surface = self.text_cache.render(self.font_small, f"Tool Used: {current_uses}", UI_LABEL)
+        panel.blit(usage_surface, (text_x, bar_y + bar_height + 6))
+        
+        # Inventory Instruction Text
+        inv_inst_surface = self.text_cache.render(self.font_small, "Press 'I' to open your inventory", STORE_INSTRUCTION)
+        inst_x = (width - inv_inst_surface.get_width()) // 2
+        inst_y = height - inv_inst_surface.get_height() - panel_padding + 4
+        panel.blit(inv_inst_surface, (inst_x, inst_y))
+        return panel
+
+    def _build_event_panel(self, event_id):
+        """Build the current event panel surface (everything but the progress fill)
+        
+        Args:
+            event_id: ID of the current event
+        """
+        from ..game.events import EVENTS
+        
+        current_event = EVENTS[event_id]
+        panel_padding = self.PANEL_PADDING
+        width = 280
+        
+        # Text surfaces
+        title_surface = self.text_cache.render(self.font, current_event.name, UI_TEXT, shadow=UI_TEXT_SHADOW)
+        
+        # Prepare description lines
+        desc_max_width = width - (panel_padding * 2)
+        desc_lines = self.text_cache.wrap(current_event.description, self.font_small, desc_max_width)
+        
+        # Text height (title + gap + bar)
+        bar_height = 12
+        top_area_height = title_surface.get_height() + 6 + bar_height
+        
+        # Icon dimensions
+        icon_size = 48
+        
+        # Calculate height needed for the top area (icon vs text)
+        top_section_height = max(icon_size, top_area_height)
+        
+        # Calculate height needed for description
+        desc_line_height = self.font_small.get_linesize()
+        desc_total_height = len(desc_lines) * desc_line_height
+        
+        # Total panel height (padding + top section + gap + desc section + padding)
+        desc_gap = 10
+        height = panel_padding + top_section_height + desc_gap + desc_total_height + panel_padding
+        panel = self._create_panel(width, height)
+        
+        # Draw Event Icon
+        event_icon_x = panel_padding
+        event_icon_y = panel_padding
+        event_icon = self._load_icon('events', current_event.icon_name, icon_size)
+        if event_icon:
+            panel.blit(event_icon, (event_icon_x, event_icon_y))
+        else:
+            # Placeholder for icon if missing
+            pygame.draw.rect(panel, FALLBACK_ICON, (event_icon_x, event_icon_y, icon_size, icon_size), border_radius=8)
+        
+        # Title
+        text_x = event_icon_x + icon_size + 12
+        start_text_y = panel_padding
+        panel.blit(title_surface, (text_x, start_text_y))
+        
+        # Progress bar slot; the fill is its own retained surface
+        bar_y = start_text_y + title_surface.get_height() + 6
+        bar_width = width - text_x - panel_padding
+        self._event_bar_rect = (text_x, bar_y, bar_width, bar_height)
+        
+        # Draw Description lines below everything else
+        desc_y = panel_padding + top_section_height + desc_gap
+        for line in desc_lines:
+            desc_surface = self.text_cache.render(self.font_small, line, UI_LABEL)
+            panel.blit(desc_surface, (panel_padding, desc_y))
+            desc_y += desc_line_height
+        return panel
+
+    def _build_tool_bar(self, width, height, fill_width, cooling):
+        """Build the tool cooldown bar surface
+        
+        Args:
+            width, height: Bar dimensions
+            fill_width: Filled width in pixels
+            cooling: True while the tool is cooling down
+        """
+        fill_color = COOLDOWN_COOLING if cooling else COOLDOWN_READY
+        return self._create_bar(width, height, fill_width, fill_color)
+
+    def _build_event_bar(self, width, height, fill_width, infinite):
+        """Build the event progress bar surface
+        
+        Args:
+            width, height: Bar dimensions
+            fill_width: Filled width in pixels
+            infinite: True if the event never ends (shows a full deactivated bar)
+        """
+        if infinite:
+            fill_color = (100, 200, 255) # A nice deactivated/infinite color
+        else:
+            fill_color = COOLDOWN_COOLING
+        return self._create_bar(width, height, fill_width, fill_color)
+
+    def _create_bar(self, width, height, fill_width, fill_color):
+        """Create a bordered progress bar surface
+        
+        Args:
+            width, height: Bar dimensions
+            fill_width: Filled width in pixels
+            fill_color: Fill color
+        """
+        bar = pygame.Surface((width, height))
+        
+        # Bar background with border
+        bar.fill(BAR_BG)
+        pygame.draw.rect(bar, BAR_BORDER, (0, 0, width, height), 1)
+        
+        if fill_width > 0:
+            pygame.draw.rect(bar, fill_color, (1, 1, fill_width - 2, height - 2))
+            # Add highlight for 3D effect
+            highlight_color = tuple(min(255, c + 40) for c in fill_color)
+            pygame.draw.rect(bar, highlight_color, (1, 1, fill_width - 2, 2))
+        return bar
 
-    def _draw_panel(self, surface, x, y, width, height, bg_color, border_color):
-        """Draw a panel with background and border
+    def _create_panel(self, width, height):
+        """Create a panel surface with background and border
         
         Args:
-            surface: Surface to draw on
-            x, y: Top-left coordinates
             width, height: Dimensions
-            bg_color: Fill color
-            border_color: Border color
+            
+        Returns:
+            Semi-transparent pygame surface to draw panel contents on
         """
-        # Create semi-transparent panel surface
         panel = pygame.Surface((width, height), pygame.SRCALPHA)
-        panel.fill(bg_color)
-        surface.blit(panel, (x, y))
+        panel.fill(PANEL_BG)
         
         # Draw border
-        pygame.draw.rect(surface, border_color, (x, y, width, height), 2)
+        pygame.draw.rect(panel, PANEL_BORDER, (0, 0, width, height), 2)
         
         # Draw subtle inner highlight
-        pygame.draw.line(surface, INNER_HIGHLIGHT, (x + 2, y + 2), (x + width - 2, y + 2), 1)
+        pygame.draw.line(panel, INNER_HIGHLIGHT, (2, 2), (width - 2, 2), 1)
+        return panel
+
+    def _load_icon(self, category, name, size):
+        """Get a sprite smoothscaled to an icon size from the asset manager
+        
+        Args:
+            category: Sprite subdirectory (tools, objects, events)
+            name: Sprite name (without extension)
+            size: Icon edge length in pixels
+            
+        Returns:
+            Pygame surface or None if the sprite is missing
+        """
+        if not self._asset_manager:
+            return None
+        return self._asset_manager.get_icon(category, name, size)
 
     def render_purchase_ui(self, surface, purchasable_tiles, cost, can_afford, internal_width, internal_height):
         """Render purchase UI with tile selection
@@ -380,14 +438,23 @@ class UI:
         # Ensure selected index is valid
         if self.selected_purchase_index >= len(purchasable_tiles):
             self.selected_purchase_index = 0
-            
-        # HUD styling matching the top panels
-        panel_bg = PANEL_BG
-        panel_border = PANEL_BORDER
-        text_color = UI_TEXT
-        text_shadow = UI_TEXT_SHADOW
-        label_color = UI_LABEL
         
+        panel = self._purchase_panel.get(cost, can_afford, self.selected_purchase_index, len(purchasable_tiles))
+        
+        # Position at bottom center
+        panel_x = (internal_width - panel.get_width()) // 2
+        panel_y = internal_height - panel.get_height() - 20
+        surface.blit(panel, (panel_x, panel_y))
+
+    def _build_purchase_panel(self, cost, can_afford, selected_index, tile_count):
+        """Build the land purchase panel surface
+        
+        Args:
+            cost: Cost of next tile
+            can_afford: Whether player can afford
+            selected_index: Index of the selected purchasable tile
+            tile_count: Number of purchasable tiles
+        """
         # Determine colors based on affordability
         if can_afford:
             cost_color = AFFORDABLE
@@ -397,18 +464,15 @@ class UI:
             icon_color = UNAFFORDABLE_DARK
             
         # Create text surfaces
-        action_text = "Buy Land"
-        action_surface = self.font.render(action_text, True, text_color)
-        
-        cost_text = f"${cost}"
-        cost_surface = self.font.render(cost_text, True, cost_color)
+        action_surface = self.text_cache.render(self.font, "Buy Land", UI_TEXT, shadow=UI_TEXT_SHADOW)
+        cost_surface = self.text_cache.render(self.font, f"${cost}", cost_color, shadow=UI_TEXT_SHADOW)
         
-        if len(purchasable_tiles) > 1:
-            instruction_text = f"Press B to buy • Tab to cycle ({self.selected_purchase_index + 1}/{len(purchasable_tiles)})"
+        if tile_count > 1:
+            instruction_text = f"Press B to buy • Tab to cycle ({selected_index + 1}/{tile_count})"
         else:
             instruction_text = "Press B to buy"
             
-        instruction_surface = self.font_small.render(instruction_text, True, label_color)
+        instruction_surface = self.text_cache.render(self.font_small, instruction_text, UI_LABEL)
         
         # Calculate panel dimensions
         panel_padding = 12
@@ -423,42 +487,90 @@ class UI:
         
         panel_width = text_width + (panel_padding * 2)
         panel_height = action_surface.get_height() + instruction_surface.get_height() + (panel_padding * 2) + 4
-        
-        # Position at bottom center
-        panel_x = (internal_width - panel_width) // 2
-        panel_y = internal_height - panel_height - 20
-        
-        # Draw the panel background and border
-        self._draw_panel(surface, panel_x, panel_y, panel_width, panel_height, panel_bg, panel_border)
-        
-        # Draw icon (a stylized 'plus' or 'land' icon)
-        icon_x = panel_x + panel_padding
-        icon_y = panel_y + panel_padding
+        panel = self._create_panel(panel_width, panel_height)
         
         # Draw a little land/plus icon
-        pygame.draw.rect(surface, icon_color, (icon_x, icon_y, icon_size, icon_size), border_radius=4)
-        pygame.draw.rect(surface, WHITE, (icon_x, icon_y, icon_size, icon_size), 2, border_radius=4)
+        icon_x = panel_padding
+        icon_y = panel_padding
+        pygame.draw.rect(panel, icon_color, (icon_x, icon_y, icon_size, icon_size), border_radius=4)
+        pygame.draw.rect(panel, WHITE, (icon_x, icon_y, icon_size, icon_size), 2, border_radius=4)
         # Plus sign inside
-        pygame.draw.line(surface, WHITE, (icon_x + 6, icon_y + 12), (icon_x + 18, icon_y + 12), 2)
-        pygame.draw.line(surface, WHITE, (icon_x + 12, icon_y + 6), (icon_x + 12, icon_y + 18), 2)
+        pygame.draw.line(panel, WHITE, (icon_x + 6, icon_y + 12), (icon_x + 18, icon_y + 12), 2)
+        pygame.draw.line(panel, WHITE, (icon_x + 12, icon_y + 6), (icon_x + 12, icon_y + 18), 2)
         
-        # Draw text
+        # Action text with shadow, cost text next to it
         text_x = icon_x + icon_size + 10
-        text_y = panel_y + panel_padding + (icon_size - action_surface.get_height()) // 2
-        
-        # Action text with shadow
-        surface.blit(self.font.render(action_text, True, text_shadow), (text_x + 1, text_y + 1))
-        surface.blit(action_surface, (text_x, text_y))
-        
-        # Cost text next to action text
-        cost_x = text_x + action_surface.get_width() + 8
-        surface.blit(self.font.render(cost_text, True, text_shadow), (cost_x + 1, text_y + 1))
-        surface.blit(cost_surface, (cost_x, text_y))
+        text_y = panel_padding + (icon_size - action_surface.get_height()) // 2
+        panel.blit(action_surface, (text_x, text_y))
+        panel.blit(cost_surface, (text_x + action_surface.get_width() + 8, text_y))
         
         # Instruction text below
-        inst_x = panel_x + (panel_width - instruction_surface.get_width()) // 2
-        inst_y = panel_y + panel_padding + max(icon_size, action_surface.get_height()) + 4
-        surface.blit(instruction_surface, (inst_x, inst_y))
+        inst_x = (panel_width - instruction_surface.get_width()) // 2
+        inst_y = panel_padding + max(icon_size, action_surface.get_height()) + 4
+        panel.blit(instruction_surface, (inst_x, inst_y))
+        return panel
+
+    def render_region_purchase_ui(self, surface, count, available, cost, internal_width, internal_height):
+        """Render the panel for a region being selected for purchase
+
+        Args:
+            surface: Pygame surface to render to
+            count: Tiles the money covers
+            available: Connected unowned tiles in the region
+            cost: Total cost of count tiles
+            internal_width: Screen width for positioning
+            internal_height: Screen height for positioning
+        """
+        panel = self._region_panel.get(count, available, cost)
+        panel_x = (internal_width - panel.get_width()) // 2
+        panel_y = internal_height - panel.get_height() - 20
+        surface.blit(panel, (panel_x, panel_y))
+
+    def _build_region_panel(self, count, available, cost):
+        """Build the region purchase panel surface
+
+        Args:
+            count: Tiles the money covers
+            available: Connected unowned tiles in the region
+            cost: Total cost of count tiles
+        """
+        cost_color = AFFORDABLE if 0 < count == available else UNAFFORDABLE
+        action_surface = self.text_cache.render(
+            self.font, f"Buy {count}/{available} tiles", UI_TEXT, shadow=UI_TEXT_SHADOW
+        )
+        cost_surface = self.text_cache.render(self.font, f"${cost:g}", cost_color, shadow=UI_TEXT_SHADOW)
+        instruction_surface = self.text_cache.render(self.font_small, "Release to buy • Esc to cancel", UI_LABEL)
+
+        panel_padding = 12
+        top_row_width = action_surface.get_width() + 8 + cost_surface.get_width()
+        panel_width = max(top_row_width, instruction_surface.get_width()) + panel_padding * 2
+        panel_height = action_surface.get_height() + instruction_surface.get_height() + panel_padding * 2 + 4
+        panel = self._create_panel(panel_width, panel_height)
+
+        text_x = (panel_width - top_row_width) // 2
+        panel.blit(action_surface, (text_x, panel_padding))
+        panel.blit(cost_surface, (text_x + action_surface.get_width() + 8, panel_padding))
+        inst_x = (panel_width - instruction_surface.get_width()) // 2
+        panel.blit(instruction_surface, (inst_x, panel_padding + action_surface.get_height() + 4))
+        return panel
+
+    def render_region_highlights(self, surface, tiles, affordable_count, tile_size, camera_offset):
+        """Render highlights on a region's tiles, brighter on the affordable ones
+
+        Args:
+            surface: Pygame surface to render to
+            tiles: List of (x, y) tile coordinates in purchase order
+            affordable_count: How many tiles from the start of tiles the money covers
+            tile_size: Size of tiles in pixels
+            camera_offset: Camera offset tuple (x, y)
+        """
+        normal = self._get_highlight(tile_size, False)
+        selected = self._get_highlight(tile_size, True)
+        offset_x, offset_y = camera_offset
+        submit_blits(surface, [
+            (selected if i < affordable_count else normal, (tile_x * tile_size - offset_x, tile_y * tile_size - offset_y))
+            for i, (tile_x, tile_y) in enumerate(tiles)
+        ])
 
     def render_tile_highlight(self, surface, tile_x, tile_y, tile_size, camera_offset, is_selected):
         """Render highlight on purchasable tiles
@@ -472,17 +584,104 @@ class UI:
         """
         screen_x = tile_x * tile_size - camera_offset[0]
         screen_y = tile_y * tile_size - camera_offset[1]
+        surface.blit(self._get_highlight(tile_size, is_selected), (screen_x, screen_y))
+
+    def render_tile_highlights(self, surface, tiles, tile_size, camera_offset, selected_index):
+        """Render highlights on all purchasable tiles with one batched blit
         
-        # Highlight color - brighter if selected
-        if is_selected:
-            color = HIGHLIGHT_ACTIVE
-            thickness = 2
-        else:
-            color = HIGHLIGHT_INACTIVE
-            thickness = 1
+        Args:
+            surface: Pygame surface to render to
+            tiles: List of (x, y) tile coordinates
+            tile_size: Size of tiles in pixels
+            camera_offset: Camera offset tuple (x, y)
+            selected_index: Index into tiles of the selected tile
+        """
+        normal = self._get_highlight(tile_size, False)
+        selected = self._get_highlight(tile_size, True)
+        offset_x, offset_y = camera_offset
+        highlight_blits = [
+            (selected if i == selected_index else normal, (tile_x * tile_size - offset_x, tile_y * tile_size - offset_y))
+            for i, (tile_x, tile_y) in enumerate(tiles)
+        ]
+        submit_blits(surface, highlight_blits)
+
+    def _get_highlight(self, tile_size, is_selected):
+        """Get the outline stencil for a tile highlight, drawn once per size
         
-        # Draw highlight border
-        pygame.draw.rect(surface, color, (screen_x, screen_y, tile_size, tile_size), thickness)
+        Args:
+            tile_size: Size of tiles in pixels
+            is_selected: Whether this is the selected tile's brighter outline
+            
+        Returns:
+            Colorkeyed surface with only the border opaque
+        """
+        key = (tile_size, is_selected)
+        if key not in self._highlights:
+            # Highlight color - brighter if selected
+            if is_selected:
+                color = HIGHLIGHT_ACTIVE
+                thickness = 2
+            else:
+                color = HIGHLIGHT_INACTIVE
+                thickness = 1
+            
+            # RLE colorkey blits skip the transparent interior in runs
+            transparent = (255, 0, 255)
+            stencil = pygame.Surface((tile_size, tile_size))
+            stencil.fill(transparent)
+            pygame.draw.rect(stencil, color, (0, 0, tile_size, tile_size), thickness)
+            stencil.set_colorkey(transparent, pygame.RLEACCEL)
+            self._highlights[key] = stencil
+        return self._highlights[key]
+
+    def render_weed_arrow(self, surface, origin, target, internal_width, internal_height):
+        """Render an arrow at the screen edge pointing towards an off-screen weed
+
+        Args:
+            surface: Pygame surface to render to
+            origin: (x, y) screen position the arrow points away from (the player)
+            target: (x, y) screen position of the weed
+            internal_width: Surface width in pixels
+            internal_height: Surface height in pixels
+        """
+        dx = target[0] - origin[0]
+        dy = target[1] - origin[1]
+        if dx == 0 and dy == 0:
+            return
+
+        # Walk from the origin towards the target until the inset screen edge
+        margin = self.ARROW_MARGIN
+        limits = []
+        if dx:
+            limits.append(((internal_width - margin if dx > 0 else margin) - origin[0]) / dx)
+        if dy:
+            limits.append(((internal_height - margin if dy > 0 else margin) - origin[1]) / dy)
+        scale = max(0.0, min(limits))
+        x = origin[0] + dx * scale
+        y = origin[1] + dy * scale
+
+        step = round(-math.degrees(math.atan2(dy, dx)) / self.ARROW_ANGLE_STEP) % (360 // self.ARROW_ANGLE_STEP)
+        arrow = self._get_arrow(step)
+        surface.blit(arrow, (round(x) - arrow.get_width() // 2, round(y) - arrow.get_height() // 2))
+
+    def _get_arrow(self, step):
+        """Get the arrow rotated to an angle step, drawn once per step
+
+        Args:
+            step: Counter-clockwise angle in ARROW_ANGLE_STEP increments, 0 pointing right
+
+        Returns:
+            SRCALPHA pygame surface
+        """
+        arrow = self._arrows.get(step)
+        if arrow is None:
+            size = self.ARROW_SIZE
+            base = pygame.Surface((size, size), pygame.SRCALPHA)
+            points = [(size - 1, size // 2), (0, 2), (size // 4, size // 2), (0, size - 3)]
+            pygame.draw.polygon(base, WEED_ARROW, points)
+            pygame.draw.polygon(base, UI_TEXT_SHADOW, points, 2)
+            arrow = self._arrows[step] = pygame.transform.rotate(base, step * self.ARROW_ANGLE_STEP)
+        return arrow
 
     def cycle_selected_tile(self, direction, max_tiles):
         """Cycle through purchasable tiles
@@ -3,34 +3,73 @@ Weed Whacker - Inventory UI
 Handles the rendering and logic of the in-game inventory and store.
 """
 
+import math
+
 import pygame # type: ignore
-from pathlib import Path
 
 from ..constants.colors import (
     PANEL_BG, PANEL_BORDER, UI_TEXT, UI_TEXT_SHADOW,
     OVERLAY_BG, PLACEHOLDER_TEXT, CLOSE_TEXT, WHITE
 )
+from .shared import get_text_cache, get_surface_pool, GlyphAtlas, RetainedPanel
+
+# Sort bar buttons: (label, sort key)
+SORT_OPTIONS = [("Cost", "cost"), ("Cooldown", "cooldown"), ("Longevity", "longevity")]
+
 
 class InventoryUI:
-    """Handles the Inventory UI rendering and interaction"""
-    
-    def __init__(self):
-        """Initialize Inventory UI"""
+    """Handles the Inventory UI rendering and interaction
+
+    Every tool row is a retained surface rebuilt only when its sort position,
+    ownership, equip state or sell price changes. Hovering a button blits a
+    pre-rendered highlighted copy over the row, so an idle store costs a
+    handful of blits per frame.
+    """
+
+    PADDING = 15
+    ITEM_HEIGHT = 80
+    ITEM_SPACING = 10
+    ICON_SIZE = 48
+    BUTTON_SIZE = (80, 30)
+    SELL_BUTTON_WIDTH = 100
+    SORT_BUTTON_SIZE = (80, 24)
+    SORT_BUTTON_SPACING = 90
+
+    def __init__(self, notifications=None):
+        """Initialize Inventory UI
+
+        Args:
+            notifications: NotificationQueue for store messages; its owner
+                advances and draws it (a private queue is made if omitted)
+        """
         self.is_open = False
         self.font = None
         self.font_large = None
         self.font_small = None
-        self.buttons = []  # Store clickable rects: [(rect, action, tool_key)]
-        
+        self.text_cache = get_text_cache()
+        self.buttons = []  # Store clickable rects: [(rect, action, key)]
+
         self.sort_by = "cost"
         self.sort_descending = False
-        
-        from .shared import Toast, ConfirmDialog
-        self.toast = Toast()
+
+        from .shared import NotificationQueue, ConfirmDialog
+        self.notifications = notifications if notifications is not None else NotificationQueue()
         self.confirm_dialog = ConfirmDialog()
-        
+
+        # Retained surfaces
+        self._asset_manager = None
+        self._rows = {}  # tool_key -> RetainedPanel of the tool's row
+        self._sort_bar = RetainedPanel(self._build_sort_bar)
+        self._button_surfaces = {}  # (action, hovered, sell_price) -> button surface
+        self._sorted_tools = None
+        self._sorted_key = None
+        self._layout_key = None
+        self._sort_pos = (0, 0)
+        self._row_positions = []
+        self._hover_overlays = []  # [(rect, highlighted surface)]
+
         self._init_fonts()
-        
+
     def _init_fonts(self):
         """Initialize fonts for rendering text"""
         if not hasattr(pygame.font, '_initialized') or not pygame.font.get_init():
@@ -38,69 +77,127 @@ class InventoryUI:
         self.font_large = pygame.font.Font(None, 48)
         self.font = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 18)
-        
+
+        # Bitmap glyphs for price labels
+        self.price_glyphs = GlyphAtlas(self.font, (100, 255, 100))
+        self.sell_glyphs = GlyphAtlas(self.font_small, WHITE)
+
     def toggle(self):
         """Toggle inventory open/closed state"""
         self.is_open = not self.is_open
-        
+
+    @staticmethod
+    def sell_price(tool, uses):
+        """Get what a tool sells for after some uses
+
+        Sell price = floor((cost / 2) * (1 - uses/longevity))
+
+        Args:
+            tool: Tool instance
+            uses: Times the tool has been used
+
+        Returns:
+            Whole-dollar sell price
+        """
+        if tool.longevity <= 0:
+            longevity_ratio = 1.0
+        else:
+            longevity_ratio = max(0, 1 - (uses / tool.longevity))
+        return math.floor((tool.cost / 2) * longevity_ratio)
+
     def handle_click(self, mouse_pos, player, economy):
         """Handle mouse clicks when inventory is open"""
         if not self.is_open:
             return False
-            
+
         if self.confirm_dialog.active:
             if self.confirm_dialog.handle_click(mouse_pos):
                 return True
-            
-        for rect, action, tool_key in self.buttons:
+
+        for rect, action, key in self.buttons:
             if rect.collidepoint(mouse_pos):
-                if action == "equip":
-                    player.current_tool = tool_key
+                if action == "sort":
+                    # Clicking the active sort flips its direction
+                    if self.sort_by == key:
+                        self.sort_descending = not self.sort_descending
+                    else:
+                        self.sort_by = key
+                        self.sort_descending = False
+                    return True
+                elif action == "equip":
+                    player.current_tool = key
                     return True
                 elif action == "buy":
                     from ..game.tools import TOOLS
-                    tool = TOOLS[tool_key]
+                    tool = TOOLS[key]
                     if economy.money >= tool.cost:
                         economy.money -= tool.cost
-                        player.owned_tools.append(tool_key)
-                        player.current_tool = tool_key
+                        player.owned_tools.append(key)
+                        player.current_tool = key
                     else:
-                        self.toast.show(f"Not enough money! Need ${tool.cost}", duration=2.0)
+                        self.notifications.show(f"Not enough money! Need ${tool.cost}", duration=2.0)
                     return True
                 elif action == "sell":
                     if len(player.owned_tools) <= 1:
-                        self.toast.show("Cannot sell your only tool!", duration=2.0)
+                        self.notifications.show("Cannot sell your only tool!", duration=2.0)
                         return True
-                        
+
                     from ..game.tools import TOOLS
-                    tool = TOOLS[tool_key]
-                    uses = player.tool_uses.get(tool_key, 0)
-                    # Sell price = floor((cost / 2) * (1 - uses/longevity))
-                    import math
-                    if tool.longevity <= 0:
-                        longevity_ratio = 1.0
-                    else:
-                        longevity_ratio = max(0, 1 - (uses / tool.longevity))
-                    sell_price = math.floor((tool.cost / 2) * longevity_ratio)
-                    
+                    tool = TOOLS[key]
+                    sell_price = self.sell_price(tool, player.tool_uses.get(key, 0))
+                    tool_key = key
+
                     def on_sell_confirm():
                         economy.money += sell_price
                         player.owned_tools.remove(tool_key)
                         if player.current_tool == tool_key:
                             player.current_tool = player.owned_tools[0]
-                            
+
                     self.confirm_dialog.show(f"Sell {tool.name} for ${sell_price}?", on_sell_confirm)
                     return True
-                    
+
         return True # Handled click on UI (prevent propagating to game)
-        
-    def update(self):
-        """Update active components like toasts"""
-        self.toast.update()
-        
+
+    def get_render_key(self, player):
+        """Get a summary of the store state render_contents draws
+
+        Hover states are not included; they follow the mouse position.
+
+        Args:
+            player: Player instance
+
+        Returns:
+            Hashable tuple
+        """
+        return (
+            self.sort_by, self.sort_descending, tuple(player.owned_tools), player.current_tool,
+            tuple(player.tool_uses.get(tool_key, 0) for tool_key in player.owned_tools)
+        )
+
+    def get_modal_layers(self, player, asset_manager):
+        """Get the inventory and its confirm dialog as ModalStack layers
+
+        Args:
+            player: Player instance
+            asset_manager: AssetManager instance
+
+        Returns:
+            List of (key, overlay_color, render_backdrop, render_contents) tuples
+        """
+        if not self.is_open:
+            return []
+
+        def render_contents(surface, internal_width, internal_height):
+            self.render_contents(surface, internal_width, internal_height, player, asset_manager)
+
+        layers = [("inventory", OVERLAY_BG, self.render_backdrop, render_contents)]
+        if self.confirm_dialog.active:
+            layers.append(self.confirm_dialog.get_modal_layer())
+        return layers
+
     def render(self, surface, internal_width, internal_height, player, asset_manager):
         """Render the inventory dialog
-        
+
         Args:
             surface: Pygame surface to render to
             internal_width: Screen width
@@ -110,241 +207,367 @@ class InventoryUI:
         """
         if not self.is_open:
             return
-            
-        self.buttons.clear()
-            
-        # Dialog dimensions
+
+        # Semi-transparent overlay for background
+        surface.blit(get_surface_pool().overlay((internal_width, internal_height), OVERLAY_BG), (0, 0))
+        self.render_backdrop(surface, internal_width, internal_height)
+        self.render_contents(surface, internal_width, internal_height, player, asset_manager)
+
+        # Render shared components over the inventory UI
+        self.notifications.render(surface, internal_width, internal_height)
+        self.confirm_dialog.render(surface, internal_width, internal_height)
+
+    def render_backdrop(self, surface, internal_width, internal_height):
+        """Render the static dialog chrome: panel, title and close hint
+
+        Args:
+            surface: Pygame surface to render to
+            internal_width: Screen width
+            internal_height: Screen height
+        """
         dialog_width = internal_width - 100
         dialog_height = internal_height - 100
         dialog_x = (internal_width - dialog_width) // 2
         dialog_y = (internal_height - dialog_height) // 2
-        
-        # Colors
-        bg_color = PANEL_BG
-        border_color = PANEL_BORDER
-        text_color = UI_TEXT
-        text_shadow = UI_TEXT_SHADOW
-        
-        # Create semi-transparent overlay for background
-        overlay = pygame.Surface((internal_width, internal_height), pygame.SRCALPHA)
-        overlay.fill(OVERLAY_BG)
-        surface.blit(overlay, (0, 0))
-        
-        # Draw main dialog panel
-        dialog_surface = pygame.Surface((dialog_width, dialog_height), pygame.SRCALPHA)
-        dialog_surface.fill(bg_color)
-        surface.blit(dialog_surface, (dialog_x, dialog_y))
-        pygame.draw.rect(surface, border_color, (dialog_x, dialog_y, dialog_width, dialog_height), 3, border_radius=8)
-        
-        # Title
-        title_text = "Inventory & Store"
-        title_surface = self.font_large.render(title_text, True, text_color)
-        title_x = dialog_x + (dialog_width - title_surface.get_width()) // 2
-        title_y = dialog_y + 20
-        
-        surface.blit(self.font_large.render(title_text, True, text_shadow), (title_x + 2, title_y + 2))
-        surface.blit(title_surface, (title_x, title_y))
-        
-        # Render tools list
+
+        panel = get_surface_pool().panel((dialog_width, dialog_height), PANEL_BG, PANEL_BORDER)
+        surface.blit(panel, (dialog_x, dialog_y))
+
+        title = self.text_cache.render(self.font_large, "Inventory & Store", UI_TEXT, shadow=UI_TEXT_SHADOW, shadow_offset=(2, 2))
+        surface.blit(title, (dialog_x + (dialog_width - title.get_width()) // 2, dialog_y + 20))
+
+        close = self.text_cache.render(self.font_small, "Press 'I' or 'ESC' to close", CLOSE_TEXT)
+        c_x = dialog_x + (dialog_width - close.get_width()) // 2
+        c_y = dialog_y + dialog_height - close.get_height() - 20
+        surface.blit(close, (c_x, c_y))
+
+    def render_contents(self, surface, internal_width, internal_height, player, asset_manager):
+        """Render the sort bar and tool rows with the hovered button highlighted
+
+        Args:
+            surface: Pygame surface to render to
+            internal_width: Screen width
+            internal_height: Screen height
+            player: Player instance
+            asset_manager: AssetManager instance
+        """
+        if asset_manager is not self._asset_manager:
+            self._asset_manager = asset_manager
+            self._rows.clear()
+
+        # Row states decide both the row surfaces and which buttons exist
         from ..game.tools import TOOLS
-        
-        # Sort tools
-        tools_list = list(TOOLS.items())
-        if self.sort_by == "cost":
-            tools_list.sort(key=lambda item: item[1].cost, reverse=self.sort_descending)
-        elif self.sort_by == "cooldown":
-            tools_list.sort(key=lambda item: item[1].cooldown, reverse=self.sort_descending)
-        elif self.sort_by == "longevity":
-            # For longevity, treat -1 (infinite) as infinity for sorting
-            tools_list.sort(key=lambda item: float('inf') if item[1].longevity <= 0 else item[1].longevity, reverse=self.sort_descending)
-            
-        list_y = title_y + title_surface.get_height() + 50
-        item_height = 80
-        padding = 15
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Render Sort Controls
-        sort_y = title_y + title_surface.get_height() + 10
-        sort_label = self.font.render("Sort by:", True, text_color)
-        surface.blit(sort_label, (dialog_x + padding, sort_y))
-        
-        sort_options = [("Cost", "cost"), ("Cooldown", "cooldown"), ("Longevity", "longevity")]
-        sort_x = dialog_x + padding + sort_label.get_width() + 15
-        
-        for label, sort_key in sort_options:
-            btn_rect = pygame.Rect(sort_x, sort_y - 2, 80, 24)
-            is_hovered = btn_rect.collidepoint(mouse_pos)
-            is_active = self.sort_by == sort_key
-            
-            # Handle click
-            if is_hovered and pygame.mouse.get_pressed()[0]:
-                if is_active:
-                    self.sort_descending = not self.sort_descending
-                else:
-                    self.sort_by = sort_key
-                    self.sort_descending = False
-                    
-                # Small delay to prevent multiple toggles
-                pygame.time.wait(100)
-                
-            bg_color = (80, 100, 80) if is_active else ((60, 60, 80) if is_hovered else (40, 40, 50))
-            pygame.draw.rect(surface, bg_color, btn_rect, border_radius=4)
-            pygame.draw.rect(surface, WHITE if is_active else (150, 150, 150), btn_rect, 1, border_radius=4)
-            
-            # Add arrow if active
-            display_label = label
-            if is_active:
-                display_label += " ↓" if self.sort_descending else " ↑"
-                
-            txt_color = WHITE if is_active else (200, 200, 200)
-            txt_surface = self.font_small.render(display_label, True, txt_color)
-            surface.blit(txt_surface, (sort_x + (80 - txt_surface.get_width()) // 2, sort_y + 4))
-            
-            sort_x += 90
-        
-        for tool_key, tool in tools_list:
+        row_width = internal_width - 100 - self.PADDING * 2
+        row_keys = []
+        for tool_key in self._get_sorted_tools():
+            tool = TOOLS[tool_key]
             is_owned = tool_key in player.owned_tools
-            is_equipped = tool_key == player.current_tool
-            
-            # Tool Item Background
-            item_rect = (dialog_x + padding, list_y, dialog_width - (padding * 2), item_height)
-            
-            # Highlight if equipped
-            if is_equipped:
-                pygame.draw.rect(surface, (60, 70, 60), item_rect, border_radius=6)
-                pygame.draw.rect(surface, (100, 255, 100), item_rect, 2, border_radius=6)
+            sell_price = None
+            if is_owned and tool.longevity > 0:
+                sell_price = self.sell_price(tool, player.tool_uses.get(tool_key, 0))
+            row_keys.append((tool_key, is_owned, tool_key == player.current_tool, sell_price, row_width))
+
+        layout_key = (internal_width, internal_height, self.sort_by, self.sort_descending, tuple(row_keys))
+        if layout_key != self._layout_key:
+            self._build_layout(internal_width, internal_height, row_keys)
+            self._layout_key = layout_key
+
+        surface.blit(self._sort_bar.get(self.sort_by, self.sort_descending), self._sort_pos)
+        for row_key, row_pos in zip(row_keys, self._row_positions):
+            panel = self._rows.get(row_key[0])
+            if panel is None:
+                panel = self._rows[row_key[0]] = RetainedPanel(self._build_row)
+            surface.blit(panel.get(*row_key), row_pos)
+
+        # Highlighted copy of whichever button is under the mouse
+        mouse_pos = pygame.mouse.get_pos()
+        for rect, hover_surface in self._hover_overlays:
+            if rect.collidepoint(mouse_pos):
+                surface.blit(hover_surface, rect)
+                break
+
+    def _get_sorted_tools(self):
+        """Get tool keys in display order, re-sorting only when the sort changes
+
+        Returns:
+            List of tool keys
+        """
+        sort_key = (self.sort_by, self.sort_descending)
+        if sort_key != self._sorted_key:
+            from ..game.tools import TOOLS
+            tools_list = list(TOOLS.items())
+            if self.sort_by == "cost":
+                tools_list.sort(key=lambda item: item[1].cost, reverse=self.sort_descending)
+            elif self.sort_by == "cooldown":
+                tools_list.sort(key=lambda item: item[1].cooldown, reverse=self.sort_descending)
+            elif self.sort_by == "longevity":
+                # For longevity, treat -1 (infinite) as infinity for sorting
+                tools_list.sort(key=lambda item: float('inf') if item[1].longevity <= 0 else item[1].longevity, reverse=self.sort_descending)
+            self._sorted_tools = [tool_key for tool_key, _ in tools_list]
+            self._sorted_key = sort_key
+        return self._sorted_tools
+
+    def _build_layout(self, internal_width, internal_height, row_keys):
+        """Place the sort bar and rows, and collect their buttons
+
+        Args:
+            internal_width: Screen width
+            internal_height: Screen height
+            row_keys: Row panel keys in display order
+        """
+        padding = self.PADDING
+        dialog_width = internal_width - 100
+        dialog_height = internal_height - 100
+        dialog_x = (internal_width - dialog_width) // 2
+        dialog_y = (internal_height - dialog_height) // 2
+
+        title_y = dialog_y + 20
+        title_height = self.text_cache.render(
+            self.font_large, "Inventory & Store", UI_TEXT, shadow=UI_TEXT_SHADOW, shadow_offset=(2, 2)
+        ).get_height()
+        sort_y = title_y + title_height + 10
+        list_y = title_y + title_height + 50
+
+        self.buttons = []
+        self._hover_overlays = []
+
+        # Sort buttons; the active one has no hover state
+        sort_x = dialog_x + padding
+        sort_label_width = self.text_cache.render(self.font, "Sort by:", UI_TEXT).get_width()
+        button_x = sort_x + sort_label_width + 15
+        for _, sort_key in SORT_OPTIONS:
+            rect = pygame.Rect((button_x, sort_y - 2), self.SORT_BUTTON_SIZE)
+            self.buttons.append((rect, "sort", sort_key))
+            if sort_key != self.sort_by:
+                self._hover_overlays.append((rect, self._get_sort_button(sort_key, hovered=True)))
+            button_x += self.SORT_BUTTON_SPACING
+
+        # Rows and their buttons
+        row_x = dialog_x + padding
+        row_positions = []
+        for tool_key, is_owned, is_equipped, sell_price, row_width in row_keys:
+            row_positions.append((row_x, list_y))
+            for local_rect, action in self._row_buttons(is_owned, is_equipped, sell_price, row_width):
+                rect = local_rect.move(row_x, list_y)
+                self.buttons.append((rect, action, tool_key))
+                self._hover_overlays.append((rect, self._get_button(action, True, sell_price)))
+            list_y += self.ITEM_HEIGHT + self.ITEM_SPACING
+
+        self._sort_pos = (sort_x, sort_y - 2)
+        self._row_positions = row_positions
+
+    def _row_buttons(self, is_owned, is_equipped, sell_price, row_width):
+        """Get the buttons a row shows, relative to the row
+
+        Args:
+            is_owned: Whether the player owns the tool
+            is_equipped: Whether the tool is equipped
+            sell_price: Sell price, or None if the tool can't be sold
+            row_width: Row width in pixels
+
+        Returns:
+            List of (rect, action)
+        """
+        btn_width, btn_height = self.BUTTON_SIZE
+        btn_x = row_width - btn_width - 10
+        btn_y = (self.ITEM_HEIGHT - btn_height) // 2
+
+        buttons = []
+        if not is_owned:
+            buttons.append((pygame.Rect(btn_x, btn_y, btn_width, btn_height), "buy"))
+        elif not is_equipped:
+            buttons.append((pygame.Rect(btn_x, btn_y, btn_width, btn_height), "equip"))
+
+        # Sell button sits left of the action button
+        if sell_price is not None:
+            sell_x = btn_x - self.SELL_BUTTON_WIDTH - 10
+            buttons.append((pygame.Rect(sell_x, btn_y, self.SELL_BUTTON_WIDTH, btn_height), "sell"))
+        return buttons
+
+    def _build_row(self, tool_key, is_owned, is_equipped, sell_price, row_width):
+        """Build one tool row with its buttons in their resting state
+
+        Args:
+            tool_key: Key of the tool
+            is_owned: Whether the player owns the tool
+            is_equipped: Whether the tool is equipped
+            sell_price: Sell price, or None if the tool can't be sold
+            row_width: Row width in pixels
+        """
+        from ..game.tools import TOOLS
+
+        tool = TOOLS[tool_key]
+        item_height = self.ITEM_HEIGHT
+        row = pygame.Surface((row_width, item_height), pygame.SRCALPHA)
+        row_rect = row.get_rect()
+
+        # Highlight if equipped
+        if is_equipped:
+            pygame.draw.rect(row, (60, 70, 60), row_rect, border_radius=6)
+            pygame.draw.rect(row, (100, 255, 100), row_rect, 2, border_radius=6)
+        else:
+            pygame.draw.rect(row, (40, 40, 50), row_rect, border_radius=6)
+            pygame.draw.rect(row, (80, 80, 100), row_rect, 1, border_radius=6)
+
+        # Tool Icon
+        icon_size = self.ICON_SIZE
+        icon_x = 15
+        icon_y = (item_height - icon_size) // 2
+
+        # Prefer the full-resolution icon, fall back to the tile-sized sprite
+        asset_manager = self._asset_manager
+        tool_icon = asset_manager.get_icon('tools', tool.sprite_name, icon_size) if asset_manager else None
+        if tool_icon:
+            row.blit(tool_icon, (icon_x, icon_y))
+        elif asset_manager:
+            tool_sprite = asset_manager.get_sprite(tool.sprite_name)
+            if tool_sprite:
+                scaled_sprite = pygame.transform.smoothscale(tool_sprite, (icon_size, icon_size))
+                row.blit(scaled_sprite, (icon_x, icon_y))
             else:
-                pygame.draw.rect(surface, (40, 40, 50), item_rect, border_radius=6)
-                pygame.draw.rect(surface, (80, 80, 100), item_rect, 1, border_radius=6)
-            
-            # Tool Icon
-            icon_size = 48
-            icon_x = dialog_x + padding + 15
-            icon_y = list_y + (item_height - icon_size) // 2
-            
-            # Try to load sprite from asset manager or fallback to disk
-            tool_sprite_path = Path(__file__).parent.parent.parent / 'assets' / 'sprites' / 'tools' / f'{tool.sprite_name}.png'
-            if tool_sprite_path.exists():
-                original_sprite = pygame.image.load(str(tool_sprite_path)).convert_alpha()
-                scaled_sprite = pygame.transform.smoothscale(original_sprite, (icon_size, icon_size))
-                surface.blit(scaled_sprite, (icon_x, icon_y))
-            elif asset_manager:
-                tool_sprite = asset_manager.get_sprite(tool.sprite_name)
-                if tool_sprite:
-                    scaled_sprite = pygame.transform.smoothscale(tool_sprite, (icon_size, icon_size))
-                    surface.blit(scaled_sprite, (icon_x, icon_y))
-                else:
-                    pygame.draw.rect(surface, (150, 150, 150), (icon_x, icon_y, icon_size, icon_size))
-            
-            # Tool Info
-            info_x = icon_x + icon_size + 20
-            
-            # Name and Cost
-            name_surface = self.font.render(tool.name, True, text_color)
-            surface.blit(name_surface, (info_x, list_y + 10))
-            
-            cost_text = f"Cost: ${tool.cost}" if not is_owned and tool.cost > 0 else "Owned"
-            cost_color = (100, 255, 100) if not is_owned and tool.cost > 0 else (150, 150, 150)
-            cost_surface = self.font.render(cost_text, True, cost_color)
-            surface.blit(cost_surface, (info_x + name_surface.get_width() + 20, list_y + 10))
-            
-            # Description
-            desc_surface = self.font_small.render(tool.description, True, (200, 200, 200))
-            surface.blit(desc_surface, (info_x, list_y + 35))
-            
-            # Stats (Efficiency, Cooldown, Longevity)
-            durability_text = f"{tool.longevity} uses" if tool.longevity > 0 else "Infinite"
-            stats_text = f"Efficiency: {tool.efficiency}x  |  Cooldown: {tool.cooldown / 1000.0}s  |  Durability: {durability_text}"
-            stats_surface = self.font_small.render(stats_text, True, (150, 200, 255))
-            surface.blit(stats_surface, (info_x, list_y + 55))
-            
-            # Buttons
-            btn_width = 80
-            btn_height = 30
-            btn_x = dialog_x + dialog_width - padding - btn_width - 10
-            btn_y = list_y + (item_height - btn_height) // 2
-            
-            btn_rect = pygame.Rect(btn_x, btn_y, btn_width, btn_height)
-            is_hovered = btn_rect.collidepoint(mouse_pos)
-            
-            # Additional Sell Button (Left of action button)
-            sell_btn_width = 100
-            sell_btn_x = btn_x - sell_btn_width - 10
-            sell_btn_rect = pygame.Rect(sell_btn_x, btn_y, sell_btn_width, btn_height)
-            sell_is_hovered = sell_btn_rect.collidepoint(mouse_pos)
-            
-            if is_owned:
-                if is_equipped:
-                    # Equipped - no button needed or show "Equipped" text
-                    eq_text = "Equipped"
-                    eq_surface = self.font.render(eq_text, True, (100, 255, 100))
-                    surface.blit(eq_surface, (btn_x + (btn_width - eq_surface.get_width()) // 2, btn_y + 5))
-                else:
-                    # Equip button
-                    btn_color = (80, 150, 80) if is_hovered else (50, 120, 50)
-                    pygame.draw.rect(surface, btn_color, btn_rect, border_radius=4)
-                    pygame.draw.rect(surface, WHITE, btn_rect, 1, border_radius=4)
-                    
-                    txt_surface = self.font.render("Equip", True, WHITE)
-                    surface.blit(txt_surface, (btn_x + (btn_width - txt_surface.get_width()) // 2, btn_y + 6))
-                    self.buttons.append((btn_rect, "equip", tool_key))
+                pygame.draw.rect(row, (150, 150, 150), (icon_x, icon_y, icon_size, icon_size))
+
+        # Tool Info
+        info_x = icon_x + icon_size + 20
+
+        # Name and Cost
+        name_surface = self.text_cache.render(self.font, tool.name, UI_TEXT)
+        row.blit(name_surface, (info_x, 10))
+
+        cost_x = info_x + name_surface.get_width() + 20
+        if not is_owned and tool.cost > 0:
+            self.price_glyphs.render_to(row, f"Cost: ${tool.cost}", (cost_x, 10))
+        else:
+            cost_surface = self.text_cache.render(self.font, "Owned", (150, 150, 150))
+            row.blit(cost_surface, (cost_x, 10))
+
+        # Description
+        desc_surface = self.text_cache.render(self.font_small, tool.description, (200, 200, 200))
+        row.blit(desc_surface, (info_x, 35))
+
+        # Stats (Efficiency, Cooldown, Longevity)
+        durability_text = f"{tool.longevity} uses" if tool.longevity > 0 else "Infinite"
+        stats_text = f"Efficiency: {tool.efficiency}x  |  Cooldown: {tool.cooldown / 1000.0}s  |  Durability: {durability_text}"
+        stats_surface = self.text_cache.render(self.font_small, stats_text, (150, 200, 255))
+        row.blit(stats_surface, (info_x, 55))
+
+        # Equipped tools show a label instead of a button
+        if is_equipped:
+            btn_width, btn_height = self.BUTTON_SIZE
+            btn_x = row_width - btn_width - 10
+            btn_y = (item_height - btn_height) // 2
+            eq_surface = self.text_cache.render(self.font, "Equipped", (100, 255, 100))
+            row.blit(eq_surface, (btn_x + (btn_width - eq_surface.get_width()) // 2, btn_y + 5))
+
+        for rect, action in self._row_buttons(is_owned, is_equipped, sell_price, row_width):
+            row.blit(self._get_button(action, False, sell_price), rect)
+        return row
+
+    def _get_button(self, action, hovered, sell_price=None):
+        """Get a row button surface, drawing it once per state
+
+        Args:
+            action: "equip", "buy" or "sell"
+            hovered: Whether to draw the highlighted version
+            sell_price: Price shown on sell buttons
+
+        Returns:
+            Pygame surface of the button
+        """
+        if action != "sell":
+            sell_price = None
+        key = (action, hovered, sell_price)
+        button = self._button_surfaces.get(key)
+        if button is not None:
+            return button
+
+        btn_width, btn_height = self.BUTTON_SIZE
+        if action == "sell":
+            btn_width = self.SELL_BUTTON_WIDTH
+            color = (150, 80, 80) if hovered else (120, 50, 50)
+        elif action == "buy":
+            color = (150, 120, 50) if hovered else (120, 90, 40)
+        else:
+            color = (80, 150, 80) if hovered else (50, 120, 50)
+
+        button = pygame.Surface((btn_width, btn_height), pygame.SRCALPHA)
+        pygame.draw.rect(button, color, button.get_rect(), border_radius=4)
+        pygame.draw.rect(button, WHITE, button.get_rect(), 1, border_radius=4)
+
+        if action == "sell":
+            # Coin icon between the label and the price when available
+            coin_size = 16
+            asset_manager = self._asset_manager
+            scaled_coin = asset_manager.get_icon('objects', 'coin', coin_size) if asset_manager else None
+            if scaled_coin:
+                total_width = self.sell_glyphs.size(f"Sell:   {sell_price}")[0] + coin_size + 2
+                start_x = (btn_width - total_width) // 2
+                label_width = self.sell_glyphs.size("Sell: ")[0]
+                self.sell_glyphs.render_to(button, "Sell:", (start_x, 8))
+                button.blit(scaled_coin, (start_x + label_width, 7))
+                self.sell_glyphs.render_to(button, str(sell_price), (start_x + label_width + coin_size + 2, 8))
             else:
-                # Buy button
-                btn_color = (150, 120, 50) if is_hovered else (120, 90, 40)
-                pygame.draw.rect(surface, btn_color, btn_rect, border_radius=4)
-                pygame.draw.rect(surface, WHITE, btn_rect, 1, border_radius=4)
-                
-                txt_surface = self.font.render("Buy", True, WHITE)
-                surface.blit(txt_surface, (btn_x + (btn_width - txt_surface.get_width()) // 2, btn_y + 6))
-                self.buttons.append((btn_rect, "buy", tool_key))
-                
-            # Render Sell Button if owned
-            if is_owned and tool.longevity > 0:
-                sell_btn_color = (150, 80, 80) if sell_is_hovered else (120, 50, 50)
-                pygame.draw.rect(surface, sell_btn_color, sell_btn_rect, border_radius=4)
-                pygame.draw.rect(surface, WHITE, sell_btn_rect, 1, border_radius=4)
-                
-                import math
-                uses = player.tool_uses.get(tool_key, 0)
-                longevity_ratio = max(0, 1 - (uses / tool.longevity))
-                sell_price = math.floor((tool.cost / 2) * longevity_ratio)
-                
-                # Try to get coin icon
-                coin_path = Path(__file__).parent.parent.parent / 'assets' / 'sprites' / 'objects' / 'coin.png'
-                coin_size = 16
-                text_offset = 0
-                
-                if coin_path.exists():
-                    try:
-                        orig_coin = pygame.image.load(str(coin_path)).convert_alpha()
-                        scaled_coin = pygame.transform.smoothscale(orig_coin, (coin_size, coin_size))
-                        # Center everything together
-                        sell_text = self.font_small.render(f"Sell:   {sell_price}", True, WHITE)
-                        total_width = sell_text.get_width() + coin_size + 2
-                        start_x = sell_btn_x + (sell_btn_width - total_width) // 2
-                        
-                        surface.blit(self.font_small.render("Sell:", True, WHITE), (start_x, btn_y + 8))
-                        surface.blit(scaled_coin, (start_x + self.font_small.size("Sell: ")[0], btn_y + 7))
-                        surface.blit(self.font_small.render(str(sell_price), True, WHITE), (start_x + self.font_small.size("Sell: ")[0] + coin_size + 2, btn_y + 8))
-                        text_offset = 1 # Skip normal text drawing
-                    except: pass
-                
-                if not text_offset:
-                    sell_txt_surface = self.font_small.render(f"Sell: ${sell_price}", True, WHITE)
-                    surface.blit(sell_txt_surface, (sell_btn_x + (sell_btn_width - sell_txt_surface.get_width()) // 2, btn_y + 8))
-                    
-                self.buttons.append((sell_btn_rect, "sell", tool_key))
-            
-            list_y += item_height + 10
-            
-        # Close instruction
-        close_text = "Press 'I' or 'ESC' to close"
-        close_surface = self.font_small.render(close_text, True, CLOSE_TEXT)
-        c_x = dialog_x + (dialog_width - close_surface.get_width()) // 2
-        c_y = dialog_y + dialog_height - close_surface.get_height() - 20
-        surface.blit(close_surface, (c_x, c_y))
-        
-        # Render shared components over the inventory UI
-        self.toast.render(surface, internal_width, internal_height)
-        self.confirm_dialog.render(surface, internal_width, internal_height)
+                sell_text = f"Sell: ${sell_price}"
+                sell_text_width = self.sell_glyphs.size(sell_text)[0]
+                self.sell_glyphs.render_to(button, sell_text, ((btn_width - sell_text_width) // 2, 8))
+        else:
+            label = "Buy" if action == "buy" else "Equip"
+            txt_surface = self.text_cache.render(self.font, label, WHITE)
+            button.blit(txt_surface, ((btn_width - txt_surface.get_width()) // 2, 6))
+
+        self._button_surfaces[key] = button
+        return button
+
+    def _get_sort_button(self, sort_key, active=False, descending=False, hovered=False):
+        """Get a sort button surface, drawing it once per state
+
+        Args:
+            sort_key: Sort key the button selects
+            active: Whether this is the current sort
+            descending: Current sort direction (shown on the active button)
+            hovered: Whether to draw the highlighted version
+
+        Returns:
+            Pygame surface of the button
+        """
+        key = ("sort", sort_key, active, active and descending, hovered and not active)
+        button = self._button_surfaces.get(key)
+        if button is not None:
+            return button
+
+        label = next(label for label, option in SORT_OPTIONS if option == sort_key)
+        width, height = self.SORT_BUTTON_SIZE
+        button = pygame.Surface((width, height), pygame.SRCALPHA)
+        bg_color = (80, 100, 80) if active else ((60, 60, 80) if hovered else (40, 40, 50))
+        pygame.draw.rect(button, bg_color, button.get_rect(), border_radius=4)
+        pygame.draw.rect(button, WHITE if active else (150, 150, 150), button.get_rect(), 1, border_radius=4)
+
+        # Add arrow if active
+        if active:
+            label += " ↓" if descending else " ↑"
+        txt_color = WHITE if active else (200, 200, 200)
+        txt_surface = self.text_cache.render(self.font_small, label, txt_color)
+        button.blit(txt_surface, ((width - txt_surface.get_width()) // 2, 6))
+
+        self._button_surfaces[key] = button
+        return button
+
+    def _build_sort_bar(self, sort_by, descending):
+        """Build the "Sort by:" label and its buttons
+
+        Args:
+            sort_by: Current sort key
+            descending: Whether the sort is descending
+        """
+        sort_label = self.text_cache.render(self.font, "Sort by:", UI_TEXT)
+        button_width, button_height = self.SORT_BUTTON_SIZE
+        button_x = sort_label.get_width() + 15
+        width = button_x + self.SORT_BUTTON_SPACING * (len(SORT_OPTIONS) - 1) + button_width
+        bar = pygame.Surface((width, max(button_height, sort_label.get_height() + 2)), pygame.SRCALPHA)
+        bar.blit(sort_label, (0, 2))
+
+        for _, sort_key in SORT_OPTIONS:
+            active = sort_key == sort_by
+            bar.blit(self._get_sort_button(sort_key, active, descending), (button_x, 0))
+            button_x += self.SORT_BUTTON_SPACING
+        return bar
@@ -1,5 +1,13 @@
-from .toast import Toast
+from .toast import Toast, NotificationQueue
 from .confirm_dialog import ConfirmDialog
 from .message_dialog import MessageDialog
+from .text_cache import TextCache, get_text_cache, wrap_text
+from .retained_panel import RetainedPanel
+from .glyph_atlas import GlyphAtlas
+from .surface_pool import SurfacePool, get_surface_pool
+from .modal_stack import ModalStack
 
-__all__ = ['Toast', 'ConfirmDialog', 'MessageDialog']
+__all__ = [
+    'Toast', 'NotificationQueue', 'ConfirmDialog', 'MessageDialog', 'TextCache', 'get_text_cache', 'wrap_text',
+    'RetainedPanel', 'GlyphAtlas', 'SurfacePool', 'get_surface_pool', 'ModalStack'
+]
@@ -5,16 +5,23 @@ A modal dialog asking the user to confirm or cancel an action
 
 import pygame # type: ignore
 from ...constants.colors import PANEL_BG, PANEL_BORDER, UI_TEXT, UI_TEXT_SHADOW, WHITE
+from .text_cache import get_text_cache
+from .surface_pool import get_surface_pool
 
 class ConfirmDialog:
     """A modal dialog asking the user to confirm or cancel an action"""
     
+    WIDTH = 400
+    HEIGHT = 200
+    OVERLAY_COLOR = (0, 0, 0, 180)
+    
     def __init__(self):
         self.active = False
         self.message = ""
         self.on_confirm = None
         self.font_large = None
         self.font = None
+        self.text_cache = get_text_cache()
         self.buttons = []
         self._init_fonts()
         
@@ -54,50 +61,56 @@ class ConfirmDialog:
                 
         return True # Always consume clicks when active to prevent clicking behind
         
+    def get_modal_layer(self):
+        """Get this dialog as a ModalStack layer
+        
+        Returns:
+            (key, overlay_color, render_backdrop, render_contents) tuple
+        """
+        return (("confirm", self.message), self.OVERLAY_COLOR, self.render_backdrop, self.render_contents)
+        
     def render(self, surface, internal_width, internal_height):
         """Render the confirm dialog if active"""
         if not self.active:
             return
             
-        self.buttons.clear()
-            
-        dialog_width = 400
-        dialog_height = 200
-        dialog_x = (internal_width - dialog_width) // 2
-        dialog_y = (internal_height - dialog_height) // 2
-        
         # Semi-transparent overlay to dim background further
-        overlay = pygame.Surface((internal_width, internal_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = get_surface_pool().overlay((internal_width, internal_height), self.OVERLAY_COLOR)
         surface.blit(overlay, (0, 0))
+        self.render_backdrop(surface, internal_width, internal_height)
+        self.render_contents(surface, internal_width, internal_height)
         
-        # Dialog Background
-        dialog_surface = pygame.Surface((dialog_width, dialog_height), pygame.SRCALPHA)
-        
-        # Determine background color safely for SRCALPHA surface
-        bg_alpha = PANEL_BG[3] if len(PANEL_BG) > 3 else 255
-        bg_color = (*PANEL_BG[:3], bg_alpha)
-        dialog_surface.fill(bg_color)
-        
-        surface.blit(dialog_surface, (dialog_x, dialog_y))
+    def render_backdrop(self, surface, internal_width, internal_height):
+        """Render the parts that only change with the message: panel, title and message"""
+        dialog_x = (internal_width - self.WIDTH) // 2
+        dialog_y = (internal_height - self.HEIGHT) // 2
         
-        border_color = PANEL_BORDER[:3]
-        pygame.draw.rect(surface, border_color, (dialog_x, dialog_y, dialog_width, dialog_height), 3, border_radius=8)
+        # Dialog Background
+        panel = get_surface_pool().panel((self.WIDTH, self.HEIGHT), PANEL_BG, PANEL_BORDER[:3])
+        surface.blit(panel, (dialog_x, dialog_y))
         
         # Title
         title_text = "Confirm"
-        title_surface = self.font_large.render(title_text, True, UI_TEXT)
-        title_x = dialog_x + (dialog_width - title_surface.get_width()) // 2
+        title_surface = self.text_cache.render(self.font_large, title_text, UI_TEXT, shadow=UI_TEXT_SHADOW, shadow_offset=(2, 2))
+        title_x = dialog_x + (self.WIDTH - title_surface.get_width()) // 2
         title_y = dialog_y + 20
-        surface.blit(self.font_large.render(title_text, True, UI_TEXT_SHADOW), (title_x + 2, title_y + 2))
         surface.blit(title_surface, (title_x, title_y))
         
         # Message
-        msg_surface = self.font.render(self.message, True, UI_TEXT)
-        msg_x = dialog_x + (dialog_width - msg_surface.get_width()) // 2
+        msg_surface = self.text_cache.render(self.font, self.message, UI_TEXT)
+        msg_x = dialog_x + (self.WIDTH - msg_surface.get_width()) // 2
         msg_y = dialog_y + 80
         surface.blit(msg_surface, (msg_x, msg_y))
         
+    def render_contents(self, surface, internal_width, internal_height):
+        """Render the buttons with their hover states"""
+        self.buttons.clear()
+        
+        dialog_width = self.WIDTH
+        dialog_height = self.HEIGHT
+        dialog_x = (internal_width - dialog_width) // 2
+        dialog_y = (internal_height - dialog_height) // 2
+        
         # Buttons
         mouse_pos = pygame.mouse.get_pos()
         btn_width = 100
@@ -112,7 +125,7 @@ class ConfirmDialog:
         
         pygame.draw.rect(surface, cancel_color, cancel_rect, border_radius=4)
         pygame.draw.rect(surface, WHITE, cancel_rect, 1, border_radius=4)
-        c_text = self.font.render("Cancel", True, WHITE)
+        c_text = self.text_cache.render(self.font, "Cancel", WHITE)
         surface.blit(c_text, (cancel_x + (btn_width - c_text.get_width()) // 2, btn_y + 8))
         self.buttons.append((cancel_rect, "cancel"))
         
@@ -124,6 +137,6 @@ class ConfirmDialog:
         
         pygame.draw.rect(surface, confirm_color, confirm_rect, border_radius=4)
         pygame.draw.rect(surface, WHITE, confirm_rect, 1, border_radius=4)
-        co_text = self.font.render("Confirm", True, WHITE)
+        co_text = self.text_cache.render(self.font, "Confirm", WHITE)
         surface.blit(co_text, (confirm_x + (btn_width - co_text.get_width()) // 2, btn_y + 8))
         self.buttons.append((confirm_rect, "confirm"))
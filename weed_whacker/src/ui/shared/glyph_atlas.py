@@ -0,0 +1,122 @@
+"""
+Weed Whacker - Bitmap Glyph Atlas
+Pre-baked glyphs for composing numeric counters without font rasterization
+"""
+
+import pygame # type: ignore
+
+
+class GlyphAtlas:
+    """Bitmap atlas of single-character glyphs rendered once from a font
+
+    Counters such as money change almost every frame, so their strings rarely
+    repeat and a text cache cannot help. Composing them from pre-rendered
+    glyph subsurfaces keeps TrueType rasterization out of the frame loop.
+    """
+
+    # Characters used by money, income, tile count and price labels
+    DEFAULT_CHARSET = "0123456789$+-.,/:sec "
+
+    def __init__(self, font, color, shadow=None, shadow_offset=(1, 1), charset=DEFAULT_CHARSET, antialias=True):
+        """Build the atlas from a font
+
+        Args:
+            font: Pygame font object to rasterize glyphs from
+            color: Glyph color
+            shadow: Optional drop shadow color
+            shadow_offset: (x, y) shadow offset in pixels
+            charset: Characters to pre-bake
+            antialias: Whether to antialias the glyphs
+        """
+        self.font = font
+        self.color = color
+        self.shadow = shadow
+        self.shadow_offset = shadow_offset
+        self.antialias = antialias
+        self.height = font.get_height()
+
+        self.glyphs = {}          # char -> text glyph subsurface
+        self.shadow_glyphs = {}   # char -> shadow glyph subsurface
+        self.advances = {}        # char -> horizontal advance in pixels
+        self._build(charset)
+
+    def _build(self, charset):
+        """Rasterize every character into one atlas surface
+
+        Args:
+            charset: Characters to rasterize
+        """
+        chars = [c for c in dict.fromkeys(charset) if c not in self.glyphs]
+        if not chars:
+            return
+
+        renders = [self.font.render(c, self.antialias, self.color) for c in chars]
+        total_width = sum(r.get_width() for r in renders)
+        rows = 2 if self.shadow is not None else 1
+
+        # Text glyphs on the first row, shadow glyphs on the second
+        self.atlas = pygame.Surface((max(1, total_width), self.height * rows), pygame.SRCALPHA)
+        x = 0
+        for char, text_render in zip(chars, renders):
+            width = text_render.get_width()
+            self.atlas.blit(text_render, (x, 0))
+            self.glyphs[char] = self.atlas.subsurface((x, 0, width, self.height))
+            if self.shadow is not None:
+                self.atlas.blit(self.font.render(char, self.antialias, self.shadow), (x, self.height))
+                self.shadow_glyphs[char] = self.atlas.subsurface((x, self.height, width, self.height))
+            self.advances[char] = width
+            x += width
+
+    def _ensure(self, text):
+        """Bake any characters of text missing from the atlas (once per character)"""
+        missing = [c for c in text if c not in self.glyphs]
+        if missing:
+            self._build(''.join(missing))
+
+    def size(self, text):
+        """Get the size text would occupy when composed from glyphs
+
+        Args:
+            text: String to measure
+
+        Returns:
+            (width, height) tuple including the shadow offset
+        """
+        self._ensure(text)
+        width = sum(self.advances[c] for c in text)
+        if self.shadow is not None:
+            return width + abs(self.shadow_offset[0]), self.height + abs(self.shadow_offset[1])
+        return width, self.height
+
+    def render_to(self, surface, text, pos, align="left"):
+        """Compose text onto a surface by blitting glyph subsurfaces
+
+        Args:
+            surface: Surface to draw on
+            text: String to draw
+            pos: (x, y) anchor; x is the left edge, or the right edge if right-aligned
+            align: "left" or "right"
+
+        Returns:
+            Pygame Rect covering the drawn text
+        """
+        width, height = self.size(text)
+        x, y = pos
+        if align == "right":
+            x -= width
+
+        text_blits = []
+        shadow_blits = []
+        dx, dy = self.shadow_offset
+        pen_x = x
+        for char in text:
+            text_blits.append((self.glyphs[char], (pen_x, y)))
+            if self.shadow is not None:
+                shadow_blits.append((self.shadow_glyphs[char], (pen_x + dx, y + dy)))
+            pen_x += self.advances[char]
+
+        # All shadows first so no shadow lands on a neighbouring glyph
+        if shadow_blits:
+            surface.blits(shadow_blits, doreturn=False)
+        surface.blits(text_blits, doreturn=False)
+        return pygame.Rect(x, y, width, height)
@@ -0,0 +1,66 @@
+"""
+Weed Whacker - Modal Layer Stack
+Renders open dialogs over a frozen snapshot of everything beneath them
+"""
+
+from .surface_pool import get_surface_pool
+
+
+class ModalStack:
+    """Stack of open modals drawn over a snapshot of the dimmed frame
+
+    A modal layer is a tuple (key, overlay_color, render_backdrop,
+    render_contents), bottom layer first. key is hashable and changes
+    whenever the layer's static look does; both render functions take
+    (surface, internal_width, internal_height).
+
+    When the stack or the world beneath it changes, the world, every lower
+    layer, the top layer's dimming overlay and its backdrop (panel, title,
+    message) are drawn once and copied into a snapshot. Every other frame
+    blits the snapshot and only draws the top layer's contents, such as
+    buttons with hover states. Lower layers are frozen while a modal sits
+    on top of them.
+    """
+
+    def __init__(self):
+        """Initialize modal stack"""
+        self.backdrop = None
+        self._backdrop_key = None
+        self.snapshots = 0
+
+    def render(self, surface, layers, world_key, render_world):
+        """Render the modal layers, redrawing the world only when it changed
+
+        Args:
+            surface: Pygame surface to render to
+            layers: Modal layer tuples, bottom first (must not be empty)
+            world_key: Hashable summary of what the world beneath looks like
+            render_world: Function taking a surface that draws the world
+        """
+        width, height = surface.get_size()
+        backdrop_key = (world_key, (width, height), tuple(layer[0] for layer in layers))
+        if backdrop_key != self._backdrop_key:
+            render_world(surface)
+            pool = get_surface_pool()
+            top = len(layers) - 1
+            for index, (_, overlay_color, render_backdrop, render_contents) in enumerate(layers):
+                surface.blit(pool.overlay((width, height), overlay_color), (0, 0))
+                render_backdrop(surface, width, height)
+                if index < top:
+                    render_contents(surface, width, height)
+
+            # Reuse the snapshot surface while the size stays the same
+            if self.backdrop is None or self.backdrop.get_size() != (width, height):
+                self.backdrop = surface.copy()
+            else:
+                self.backdrop.blit(surface, (0, 0))
+            self._backdrop_key = backdrop_key
+            self.snapshots += 1
+        else:
+            surface.blit(self.backdrop, (0, 0))
+
+        layers[-1][3](surface, width, height)
+
+    def invalidate(self):
+        """Force the next render() to redraw the world and lower layers"""
+        self._backdrop_key = None
@@ -0,0 +1,43 @@
+"""
+Weed Whacker - Retained Panel Component
+A pre-rendered UI surface that is only redrawn when its inputs change
+"""
+
+
+class RetainedPanel:
+    """A cached UI surface rebuilt only when its input key changes
+
+    The key is a tuple of everything the panel's appearance depends on. It is
+    unpacked into the build function, so the key doubles as the argument list.
+    """
+
+    def __init__(self, build_func):
+        """Initialize retained panel
+
+        Args:
+            build_func: Function taking the key's items and returning a surface
+        """
+        self.build_func = build_func
+        self.key = None
+        self.surface = None
+        self.redraws = 0
+
+    def get(self, *key):
+        """Get the panel surface for the given inputs, rebuilding it on change
+
+        Args:
+            *key: Hashable inputs the panel's appearance depends on
+
+        Returns:
+            Pygame surface with the panel drawn at (0, 0)
+        """
+        if self.surface is None or key != self.key:
+            self.surface = self.build_func(*key)
+            self.key = key
+            self.redraws += 1
+        return self.surface
+
+    def invalidate(self):
+        """Force the next get() to rebuild the surface"""
+        self.surface = None
+        self.key = None
@@ -0,0 +1,83 @@
+"""
+Weed Whacker - Surface Pool
+Shared pre-filled overlay and panel surfaces for modal UI
+"""
+
+import pygame # type: ignore
+
+
+class SurfacePool:
+    """Cache of overlay and panel surfaces keyed by size and colors
+
+    Modal UI used to allocate and fill a full-screen overlay and a panel
+    surface every frame. The pool draws each combination once and hands the
+    same surface back; callers must treat pooled surfaces as read-only.
+    """
+
+    def __init__(self):
+        """Initialize surface pool"""
+        self._overlays = {}  # (size, color) -> surface
+        self._panels = {}    # (size, fill, border, border_width, border_radius) -> surface
+        self.allocations = 0
+
+    def overlay(self, size, color):
+        """Get a surface filled with a translucent color
+
+        Args:
+            size: (width, height) in pixels
+            color: RGBA fill color
+
+        Returns:
+            SRCALPHA pygame surface
+        """
+        key = (tuple(size), tuple(color))
+        surface = self._overlays.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            self._overlays[key] = surface
+            self.allocations += 1
+        return surface
+
+    def panel(self, size, fill, border, border_width=3, border_radius=8):
+        """Get a dialog panel background with its rounded border
+
+        Args:
+            size: (width, height) in pixels
+            fill: RGB or RGBA background color
+            border: RGB border color
+            border_width: Border thickness in pixels
+            border_radius: Border corner radius in pixels
+
+        Returns:
+            SRCALPHA pygame surface
+        """
+        key = (tuple(size), tuple(fill), tuple(border), border_width, border_radius)
+        surface = self._panels.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(fill)
+            pygame.draw.rect(surface, border, surface.get_rect(), border_width, border_radius=border_radius)
+            self._panels[key] = surface
+            self.allocations += 1
+        return surface
+
+    def clear(self):
+        """Drop all pooled surfaces"""
+        self._overlays.clear()
+        self._panels.clear()
+
+
+_shared_pool = None
+
+
+def get_surface_pool():
+    """Get the surface pool shared by all UI components
+
+    Returns:
+        SurfacePool instance
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = SurfacePool()
+    return _shared_pool
@@ -0,0 +1,163 @@
+"""
+Weed Whacker - Text Surface Cache
+Shared LRU cache of rendered text surfaces and wrapped-line layouts
+"""
+
+import pygame # type: ignore
+from collections import OrderedDict
+
+
+def wrap_text(text, font, max_width):
+    """Wrap text to fit within a specific width
+
+    Args:
+        text: String to wrap
+        font: Pygame font object
+        max_width: Maximum width in pixels
+
+    Returns:
+        List of strings, each fitting within max_width
+    """
+    words = text.split(' ')
+    lines = []
+    current_line = []
+
+    for word in words:
+        current_line.append(word)
+        test_line = ' '.join(current_line)
+        width, _ = font.size(test_line)
+
+        if width > max_width:
+            # Word is too long, push it to the next line
+            if len(current_line) > 1:
+                current_line.pop()
+                lines.append(' '.join(current_line))
+                current_line = [word]
+            else:
+                # Single word is longer than max_width, just add it
+                lines.append(' '.join(current_line))
+                current_line = []
+
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return lines
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by font, text, color and shadow
+
+    Text with a drop shadow is composited once into a single surface, so a
+    cached label costs one blit per frame instead of two font renders.
+    """
+
+    def __init__(self, max_surfaces=512, max_layouts=128):
+        """Initialize text cache
+
+        Args:
+            max_surfaces: Maximum number of rendered surfaces kept
+            max_layouts: Maximum number of wrapped-line layouts kept
+        """
+        self.max_surfaces = max_surfaces
+        self.max_layouts = max_layouts
+        self._surfaces = OrderedDict()
+        self._layouts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True, shadow=None, shadow_offset=(1, 1)):
+        """Get a rendered text surface, rendering it only on a cache miss
+
+        Args:
+            font: Pygame font object
+            text: String to render
+            color: Text color
+            antialias: Whether to antialias the glyphs
+            shadow: Optional shadow color drawn behind the text
+            shadow_offset: (x, y) shadow offset in pixels, down and right only
+
+        Returns:
+            Pygame surface with the text drawn at (0, 0) and the shadow
+            extending past it to the right and below
+
+        Raises:
+            ValueError: If a shadow offset is negative
+        """
+        key = (font, text, tuple(color), antialias,
+               tuple(shadow) if shadow is not None else None,
+               tuple(shadow_offset) if shadow is not None else None)
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if shadow is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = self._render_with_shadow(font, text, color, antialias, shadow, shadow_offset)
+
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def _render_with_shadow(self, font, text, color, antialias, shadow, shadow_offset):
+        """Composite text over its drop shadow into one surface"""
+        dx, dy = shadow_offset
+        # A shadow up or left would push the text away from (0, 0) and shift every caller's layout
+        if dx < 0 or dy < 0:
+            raise ValueError(f"Shadow offset must not be negative: {shadow_offset}")
+        text_surface = font.render(text, antialias, color)
+        shadow_surface = font.render(text, antialias, shadow)
+
+        surface = pygame.Surface((text_surface.get_width() + dx, text_surface.get_height() + dy), pygame.SRCALPHA)
+        surface.blit(shadow_surface, (dx, dy))
+        surface.blit(text_surface, (0, 0))
+        return surface
+
+    def wrap(self, text, font, max_width):
+        """Get the wrapped-line layout for text, computing it only on a cache miss
+
+        Args:
+            text: String to wrap
+            font: Pygame font object
+            max_width: Maximum width in pixels
+
+        Returns:
+            Tuple of strings, each fitting within max_width
+        """
+        key = (font, text, max_width)
+
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return lines
+
+        lines = tuple(wrap_text(text, font, max_width))
+        self._layouts[key] = lines
+        if len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return lines
+
+    def clear(self):
+        """Drop all cached surfaces and layouts"""
+        self._surfaces.clear()
+        self._layouts.clear()
+
+
+_shared_cache = None
+
+
+def get_text_cache():
+    """Get the text cache shared by all UI components
+
+    Returns:
+        TextCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TextCache()
+    return _shared_cache
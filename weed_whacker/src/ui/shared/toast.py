@@ -1,94 +1,156 @@
 """
-Weed Whacker - Toast Component
-A temporary message popup that appears on screen and fades out
+Weed Whacker - Toast Notifications
+Temporary message popups that stack above the bottom of the screen and fade out
 """
 
 import pygame # type: ignore
-import time
 from ...constants.colors import PANEL_BG, PANEL_BORDER, UI_TEXT
+from .text_cache import get_text_cache
+
 
 class Toast:
-    """A temporary message popup that appears on screen and fades out"""
-    
-    def __init__(self):
-        self.message = ""
-        self.active = False
-        self.duration = 0
-        self.start_time = 0
+    """A single notification, rendered once when shown"""
+
+    def __init__(self, message, surface, duration):
+        """Initialize toast
+
+        Args:
+            message: Text shown in the toast
+            surface: Pre-rendered toast surface (background, border and text)
+            duration: Time to show the toast in milliseconds
+        """
+        self.message = message
+        self.surface = surface
+        self.duration = duration
+        self.elapsed = 0
+        self.alpha = 255
+
+    def restart(self, duration):
+        """Show the toast again from the start
+
+        Args:
+            duration: Time to show the toast in milliseconds
+        """
+        self.duration = duration
+        self.elapsed = 0
+
+
+class NotificationQueue:
+    """Stack of toasts advanced by the game clock
+
+    Each toast's surface is drawn once in show(); fading only changes the
+    surface alpha, so a visible toast costs one blit per frame. Time comes
+    from update(dt), so toasts pause and speed up with the game.
+    """
+
+    FADE_MS = 500
+    PADDING = (20, 10)
+    SPACING = 8
+    BOTTOM_MARGIN = 40
+
+    def __init__(self, max_visible=4):
+        """Initialize notification queue
+
+        Args:
+            max_visible: Most toasts shown at once; the oldest are dropped first
+        """
+        self.max_visible = max_visible
+        self.toasts = []  # Oldest first
+        self.text_cache = get_text_cache()
         self.font = None
         self._init_fonts()
-        
+
     def _init_fonts(self):
         if not hasattr(pygame.font, '_initialized') or not pygame.font.get_init():
             pygame.font.init()
         self.font = pygame.font.Font(None, 24)
-        
+
+    @property
+    def active(self):
+        """Whether any toast is showing"""
+        return bool(self.toasts)
+
     def show(self, message, duration=3.0):
         """Show a toast message
-        
+
+        Showing a message that is already on screen restarts it instead of
+        stacking a copy.
+
         Args:
             message: Text to display
             duration: Time in seconds to show the toast
         """
-        self.message = message
-        self.active = True
-        self.duration = duration
-        self.start_time = time.time()
-        
-    def update(self):
-        """Update toast state. Call this every frame."""
-        if not self.active:
+        duration_ms = duration * 1000
+        for toast in self.toasts:
+            if toast.message == message:
+                toast.restart(duration_ms)
+                # Move it to the newest position
+                self.toasts.remove(toast)
+                self.toasts.append(toast)
+                return
+
+        self.toasts.append(Toast(message, self._build_surface(message), duration_ms))
+        if len(self.toasts) > self.max_visible:
+            del self.toasts[:-self.max_visible]
+
+    def update(self, dt):
+        """Advance toast timers and fades. Call this every frame.
+
+        Args:
+            dt: Delta time in milliseconds
+        """
+        if not self.toasts:
             return
-            
-        elapsed = time.time() - self.start_time
-        if elapsed > self.duration:
-            self.active = False
-            
+
+        for toast in self.toasts:
+            toast.elapsed += dt
+            # Fade out over the last FADE_MS
+            time_left = toast.duration - toast.elapsed
+            alpha = 255
+            if time_left < self.FADE_MS:
+                alpha = max(0, min(255, int(255 * (time_left / self.FADE_MS))))
+            if alpha != toast.alpha:
+                toast.alpha = alpha
+                toast.surface.set_alpha(alpha)
+        self.toasts = [toast for toast in self.toasts if toast.elapsed < toast.duration]
+
+    def get_render_key(self):
+        """Get a summary of what render() would draw
+
+        Returns:
+            Hashable tuple of (message, alpha) per toast
+        """
+        return tuple((toast.message, toast.alpha) for toast in self.toasts)
+
+    def clear(self):
+        """Remove all toasts"""
+        self.toasts.clear()
+
     def render(self, surface, internal_width, internal_height):
-        """Render the toast if active"""
-        if not self.active:
-            return
-            
-        elapsed = time.time() - self.start_time
-        
-        # Calculate alpha for fade out (last 0.5 seconds)
-        alpha = 255
-        fade_duration = 0.5
-        time_left = self.duration - elapsed
-        if time_left < fade_duration:
-            alpha = max(0, min(255, int(255 * (time_left / fade_duration))))
-            
-        text_surface = self.font.render(self.message, True, UI_TEXT)
-        text_rect = text_surface.get_rect()
-        
-        # Background padding
-        padding_x = 20
-        padding_y = 10
-        
-        bg_width = text_rect.width + padding_x * 2
-        bg_height = text_rect.height + padding_y * 2
-        bg_x = (internal_width - bg_width) // 2
-        bg_y = internal_height - bg_height - 40 # 40 pixels from bottom
-        
-        # Create a surface with alpha support for fading
+        """Render the toasts, newest at the bottom"""
+        y = internal_height - self.BOTTOM_MARGIN
+        for toast in reversed(self.toasts):
+            width, height = toast.surface.get_size()
+            y -= height
+            surface.blit(toast.surface, ((internal_width - width) // 2, y))
+            y -= self.SPACING
+
+    def _build_surface(self, message):
+        """Draw a toast's background, border and text
+
+        Args:
+            message: Text to display
+
+        Returns:
+            SRCALPHA pygame surface
+        """
+        text_surface = self.text_cache.render(self.font, message, UI_TEXT)
+        padding_x, padding_y = self.PADDING
+        bg_width = text_surface.get_width() + padding_x * 2
+        bg_height = text_surface.get_height() + padding_y * 2
+
         toast_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
-        
-        # Determine background alpha - if PANEL_BG has an alpha component, use that as the base
-        base_bg_alpha = PANEL_BG[3] if len(PANEL_BG) > 3 else 255
-        bg_alpha = int((base_bg_alpha / 255.0) * alpha)
-        
-        # Draw background and border
-        # Fix invalid color issue by only taking the first 3 elements (RGB) and supplying alpha separately 
-        # or relying on the surface's alpha handling. Since it's SRCALPHA, we pass an RGBA tuple.
-        bg_color = (*PANEL_BG[:3], bg_alpha)
-        pygame.draw.rect(toast_surface, bg_color, (0, 0, bg_width, bg_height), border_radius=8)
-        
-        border_color = (*PANEL_BORDER[:3], alpha)
-        pygame.draw.rect(toast_surface, border_color, (0, 0, bg_width, bg_height), 2, border_radius=8)
-        
-        # Draw text
-        text_surface.set_alpha(alpha)
+        pygame.draw.rect(toast_surface, PANEL_BG, (0, 0, bg_width, bg_height), border_radius=8)
+        pygame.draw.rect(toast_surface, PANEL_BORDER[:3], (0, 0, bg_width, bg_height), 2, border_radius=8)
         toast_surface.blit(text_surface, (padding_x, padding_y))
-        
-        # Blit to screen
-        surface.blit(toast_surface, (bg_x, bg_y))
+        return toast_surface